@@ -0,0 +1,62 @@
+"""Сравнение HTML-бэкендов на сохраненной странице расписания.
+
+Запуск из корня проекта:
+    python -m benchmarks.html_backends [путь к странице] [повторов]
+
+Страница перекодируется в cp1251, как ее отдает портал, и разбирается каждым
+установленным бэкендом: отдельно извлечение (дерево + таблицы) и полный разбор группы.
+"""
+import logging
+import sys
+import time
+
+from config.config import HTTP_SETTINGS
+from parsers.html_backend import available_backends, get_backend
+from parsers.UlstuParser import UlstuParser
+
+
+def measure(func, repeats):
+    """Возвращает лучшее и среднее время вызова в миллисекундах"""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'debug_page.html'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    logging.disable(logging.CRITICAL)
+    encoding = HTTP_SETTINGS['encoding']
+    with open(path, encoding='utf-8') as f:
+        raw = f.read().encode(encoding, errors='replace')
+
+    parser = UlstuParser()
+    url = parser.get_group_url(175)
+    reference = None
+
+    print(f"Страница: {path}, {len(raw) / 1024:.1f} КБ, повторов: {repeats}")
+    print(f"{'бэкенд':<12}{'извлечение, мс':>18}{'полный разбор, мс':>22}")
+
+    for name in available_backends():
+        backend = get_backend(name)
+        parser.html_backend = backend
+
+        extract_best, extract_avg = measure(lambda: backend.extract(raw, encoding), repeats)
+        parse_best, parse_avg = measure(lambda: parser._parse_group_page(url, 200, raw), repeats)
+
+        result = parser._parse_group_page(url, 200, raw)
+        if reference is None:
+            reference = result
+        mark = "" if result == reference else "  (результат отличается!)"
+
+        print(f"{name:<12}{extract_best:>8.2f} / {extract_avg:<8.2f}{parse_best:>11.2f} / {parse_avg:<8.2f}{mark}")
+
+    print("Время: лучшее / среднее")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Проверка, что HTML-бэкенды извлекают со страницы расписания одно и то же.
+
+Запуск из корня проекта:
+    python -m benchmarks.html_parity [путь к странице]
+
+Результат каждого установленного бэкенда сравнивается с LxmlBackend (полное дерево
+libxml2) на сохраненной странице. Дополнительно потоковый бэкенд проверяется на
+розовом заголовке внутри таблицы и вложенной таблице. При расхождении код возврата 1.
+"""
+import sys
+
+from config.config import HTTP_SETTINGS
+from parsers.html_backend import available_backends, get_backend
+
+NESTED_PAGE = '''<html><body><table border="1">
+<tr><td><font color="#ff00ff">ПИбд-11Неделя: 5-я</font></td></tr>
+<tr><td>Пн<table><tr><td>вложенная</td></tr></table></td><td>1-я пара</td></tr>
+</table></body></html>'''
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'debug_page.html'
+    encoding = HTTP_SETTINGS['encoding']
+    with open(path, encoding='utf-8') as f:
+        raw = f.read().encode(encoding, errors='replace')
+
+    reference = get_backend('lxml').extract(raw, encoding)
+    failed = False
+    for name in available_backends():
+        content = get_backend(name).extract(raw, encoding)
+        differs = [field for field in content._fields if getattr(content, field) != getattr(reference, field)]
+        failed = failed or bool(differs)
+        print(f"{name:<12}{'отличается: ' + ', '.join(differs) if differs else 'совпадает с lxml'}")
+
+    nested = get_backend('stream').extract(NESTED_PAGE.encode(encoding), encoding)
+    # Вложенная таблица без border="1" отбрасывается, а ее строка не попадает во внешнюю
+    expected = [[['ПИбд-11Неделя: 5-я'], ['Пн\nвложенная', '1-я пара']]]
+    nested_ok = nested.headers == ['ПИбд-11Неделя: 5-я'] and nested.tables == expected
+    failed = failed or not nested_ok
+    print(f"{'stream':<12}{'вложенная таблица: ' + ('ок' if nested_ok else f'ошибка {nested}')}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Сравнение профилей кодирования картинки расписания.
+
+Запуск из корня проекта (шрифты берутся из ./fonts):
+    python -m benchmarks.image_encoders [путь к странице] [повторов]
+
+Для каждого профиля из IMAGE_SETTINGS['encoder_profiles'] печатается время кодирования
+(вместе с квантованием в палитру), размер файла и качество (PSNR относительно исходной
+картинки). Допустимы профили с PSNR не ниже IMAGE_SETTINGS['min_psnr']; из них
+рекомендуется самый быстрый.
+"""
+import io
+import logging
+import math
+import sys
+import time
+
+from PIL import Image, ImageChops, ImageStat
+
+from config.config import HTTP_SETTINGS, IMAGE_SETTINGS
+from parsers.UlstuParser import UlstuParser
+
+
+def measure(func, repeats):
+    """Возвращает лучшее и среднее время вызова в миллисекундах"""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), sum(timings) / len(timings)
+
+
+def psnr(original, encoded):
+    """Пиковое отношение сигнал/шум в дБ (inf - без потерь)"""
+    decoded = Image.open(io.BytesIO(encoded)).convert('RGB')
+    rms = ImageStat.Stat(ImageChops.difference(original, decoded)).rms
+    mse = sum(value * value for value in rms) / len(rms)
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'debug_page.html'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    logging.disable(logging.CRITICAL)
+    with open(path, encoding='utf-8') as f:
+        raw = f.read().encode(HTTP_SETTINGS['encoding'], errors='replace')
+
+    parser = UlstuParser()
+    generator = parser.image_generator
+    name, week_number, schedules = parser._parse_group_page(parser.get_group_url(175), 200, raw)
+    image = generator.create_schedule_image(name, week_number, schedules)
+
+    print(f"Картинка {image.width}x{image.height}, цветов: {len(image.getcolors(1 << 24))}, повторов: {repeats}")
+    print(f"{'профиль':<20}{'время, мс':>20}{'размер, КБ':>13}{'PSNR, дБ':>11}")
+
+    acceptable = []
+    for profile in IMAGE_SETTINGS['encoder_profiles']:
+        best, avg = measure(lambda: generator.image_to_bytes(image, profile), repeats)
+        encoded = generator.image_to_bytes(image, profile).getvalue()
+        quality = psnr(image, encoded)
+        ok = quality >= IMAGE_SETTINGS['min_psnr']
+        if ok:
+            acceptable.append((avg, profile))
+        current = " <- в настройках" if profile == IMAGE_SETTINGS['encoder'] else ""
+        print(f"{profile:<20}{best:>9.2f} / {avg:<8.2f}{len(encoded) / 1024:>11.1f}{quality:>11.1f}"
+              f"{'' if ok else '  (ниже min_psnr)'}{current}")
+
+    print("Время: лучшее / среднее")
+    if acceptable:
+        print(f"Самый быстрый допустимый профиль: {min(acceptable)[1]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Отрисовка расписания с заготовкой сетки и кэшем надписей и без них.
+
+Запуск из корня проекта (шрифты берутся из ./fonts):
+    python -m benchmarks.image_template [путь к странице] [повторов]
+
+"Без кэшей" - сетка и все надписи рисуются заново при каждом вызове, как раньше;
+"заготовка" - сетка из кэша, надписи растеризуются заново; "всё" - обычный режим.
+Отдельно показано кодирование PNG: кэши его не ускоряют.
+"""
+import logging
+import sys
+import time
+
+from PIL import ImageChops
+
+from config.config import HTTP_SETTINGS
+from parsers.image_generator import ScheduleImageGenerator
+from parsers.UlstuParser import UlstuParser
+
+
+def measure(func, repeats):
+    """Возвращает лучшее и среднее время вызова в миллисекундах"""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'debug_page.html'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    logging.disable(logging.CRITICAL)
+    with open(path, encoding='utf-8') as f:
+        raw = f.read().encode(HTTP_SETTINGS['encoding'], errors='replace')
+
+    parser = UlstuParser()
+    name, week_number, schedules = parser._parse_group_page(parser.get_group_url(175), 200, raw)
+    teacher_schedules = [lesson._replace(teacher="", group=name) for lesson in schedules]
+
+    generator = ScheduleImageGenerator()
+
+    def without_template(create, *args):
+        generator._templates.clear()
+        generator.text_cache._data.clear()
+        return create(*args)
+
+    def without_text_cache(create, *args):
+        generator.text_cache._data.clear()
+        return create(*args)
+
+    cases = [
+        ("группа", generator.create_schedule_image, (name, week_number, schedules)),
+        ("преподаватель", generator.create_teacher_schedule_image, ("Иванов И И", week_number, teacher_schedules)),
+    ]
+
+    print(f"Занятий: {len(schedules)}, повторов: {repeats}")
+    print(f"{'расписание':<16}{'без кэшей, мс':>20}{'заготовка, мс':>20}{'всё, мс':>20}{'экономия':>10}")
+    for title, create, args in cases:
+        cold_best, cold_avg = measure(lambda: without_template(create, *args), repeats)
+        create(*args)  # Заготовка нарисована
+        grid_best, grid_avg = measure(lambda: without_text_cache(create, *args), repeats)
+        create(*args)  # Надписи в кэше
+        warm_best, warm_avg = measure(lambda: create(*args), repeats)
+
+        same = ImageChops.difference(without_template(create, *args), create(*args)).getbbox() is None
+        mark = "" if same else "  (картинки отличаются!)"
+        print(f"{title:<16}{cold_best:>9.2f} / {cold_avg:<8.2f}{grid_best:>9.2f} / {grid_avg:<8.2f}"
+              f"{warm_best:>9.2f} / {warm_avg:<8.2f}{(cold_avg - warm_avg) / cold_avg:>9.0%}{mark}")
+
+    stats = generator.text_cache.stats()
+    print(f"Кэш надписей: {stats['size']} записей, попаданий {stats['hit_rate']:.0%}")
+
+    image = generator.create_schedule_image(name, week_number, schedules)
+    encode_best, encode_avg = measure(lambda: generator.image_to_bytes(image), repeats)
+    print(f"Кодирование PNG: {encode_best:.2f} / {encode_avg:.2f} мс")
+    print("Время: лучшее / среднее")
+
+
+if __name__ == '__main__':
+    main()
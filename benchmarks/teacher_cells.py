@@ -0,0 +1,93 @@
+"""Микробенчмарк разбора ячеек расписания преподавателя.
+
+Запуск из корня проекта:
+    python -m benchmarks.teacher_cells [страница группы] [повторов] [ревизия]
+
+Корпус строится из ячеек сохраненной страницы: сами ячейки плюс ячейки в формате
+расписания преподавателя (группа, занятие, аудитория) для групп из справочника.
+Сравниваются UlstuParser._parse_teacher_cell_content из исходной ревизии (по умолчанию -
+первый коммит репозитория, код берется через git show) и общий классификатор
+из parsers.cell_parser. Мемоизация отключена - меряется чистый разбор.
+"""
+import ast
+import functools
+import logging
+import re
+import subprocess
+import sys
+import textwrap
+import time
+
+from config.config import HTTP_SETTINGS
+from database.groups_dict import GROUPS_DICT
+from parsers.cell_parser import parse_teacher_cell
+from parsers.html_backend import get_backend
+
+
+def load_baseline(revision, path='parsers/UlstuParser.py', name='_parse_teacher_cell_content'):
+    """Загружает метод разбора ячейки из указанной ревизии git без изменений.
+    Метод не обращается к self, поэтому вызывается с self=None"""
+    source = subprocess.run(['git', 'show', f'{revision}:{path}'], capture_output=True, check=True,
+                            encoding='utf-8').stdout
+    method = next(node for node in ast.walk(ast.parse(source))
+                  if isinstance(node, ast.FunctionDef) and node.name == name)
+    namespace = {'re': re, 'logging': logging}
+    exec(textwrap.dedent(ast.get_source_segment(source, method)), namespace)
+    return functools.partial(namespace[name], None)
+
+
+def build_corpus(path):
+    """Собирает корпус ячеек из страницы расписания"""
+    encoding = HTTP_SETTINGS['encoding']
+    with open(path, encoding='utf-8') as f:
+        raw = f.read().encode(encoding, errors='replace')
+
+    page = get_backend().extract(raw, encoding)
+    cells = [cell for table in page.tables for row in table[2:8] for cell in row[1:9] if cell]
+
+    rooms = ['3-312', '6-НБ8', '8-417', '3_2', '2-СЗ', '3-ДОТ']
+    groups = list(GROUPS_DICT.values())
+    corpus = list(cells)
+    for index, cell in enumerate(cells):
+        subject = cell.split('\n')[0]
+        group = groups[index * 7 % len(groups)]
+        corpus.append(f"{group}\n{subject}\n{rooms[index % len(rooms)]}")
+        corpus.append(f"{subject}\n{group}, {groups[(index * 7 + 1) % len(groups)]}")
+    return corpus
+
+
+def measure(func, corpus, repeats):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for cell in corpus:
+            func(cell)
+    return (time.perf_counter() - started) / (repeats * len(corpus)) * 1e6
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'debug_page.html'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    revision = sys.argv[3] if len(sys.argv) > 3 else subprocess.run(
+        ['git', 'rev-list', '--max-parents=0', 'HEAD'], capture_output=True, check=True, text=True).stdout.split()[0]
+
+    logging.disable(logging.CRITICAL)
+    corpus = build_corpus(path)
+    legacy_parse_teacher_cell = load_baseline(revision)
+    classifier = parse_teacher_cell.__wrapped__  # Без LRU-кэша
+
+    legacy_time = measure(legacy_parse_teacher_cell, corpus, repeats)
+    classifier_time = measure(classifier, corpus, repeats)
+    differences = [cell for cell in corpus if legacy_parse_teacher_cell(cell) != classifier(cell)]
+
+    print(f"Корпус: {len(corpus)} ячеек ({len(set(corpus))} уникальных), повторов: {repeats}")
+    print(f"Прежний разбор ({revision[:7]}): {legacy_time:7.2f} мкс/ячейка")
+    print(f"Классификатор:            {classifier_time:7.2f} мкс/ячейка (x{legacy_time / classifier_time:.1f})")
+    print(f"940 преподавателей x 48 ячеек: {legacy_time * 940 * 48 / 1000:.0f} мс -> "
+          f"{classifier_time * 940 * 48 / 1000:.0f} мс")
+    print(f"Расхождений с прежним разбором: {len(differences)}")
+    for cell in differences[:5]:
+        print(f"  {cell!r}: {legacy_parse_teacher_cell(cell)} -> {classifier(cell)}")
+
+
+if __name__ == '__main__':
+    main()
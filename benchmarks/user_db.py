@@ -0,0 +1,78 @@
+"""Скорость запросов к базе пользователей: новое соединение на каждый вызов и постоянные соединения.
+
+Запуск из корня проекта:
+    python -m benchmarks.user_db [пользователей] [повторов]
+
+"Соединение на вызов" повторяет прежний UserDatabase: sqlite3.connect, один запрос, commit
+(журнал по умолчанию, synchronous=FULL). "Постоянное соединение" - текущий UserDatabase
+(WAL, synchronous=NORMAL, подготовленные запросы). База создается во временной папке.
+"""
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from database.user_database import UserDatabase, SELECT_USER_SQL, UPDATE_GROUP_SQL
+
+
+def measure(func, repeats):
+    """Возвращает среднее время вызова в микросекундах"""
+    started = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - started) / repeats * 1e6
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'users.db')
+        db = UserDatabase(db_path)
+        with db._connection() as conn:
+            conn.executemany('INSERT INTO users (user_id, role, group_name) VALUES (?, ?, ?)',
+                             ((user_id, 'student', f'ПИбд-{user_id % 50}') for user_id in range(users)))
+        db.close()
+
+        # Прежний режим журнала: сравнение честное, только если файл не в WAL
+        legacy_path = os.path.join(tmp, 'legacy.db')
+        with sqlite3.connect(db_path) as src, sqlite3.connect(legacy_path) as dst:
+            src.backup(dst)
+            dst.execute('PRAGMA journal_mode=DELETE')
+
+        def legacy_get_user():
+            with sqlite3.connect(legacy_path) as conn:
+                return conn.execute(SELECT_USER_SQL, (random.randrange(users),)).fetchone()
+
+        def legacy_update_group():
+            with sqlite3.connect(legacy_path) as conn:
+                conn.execute(UPDATE_GROUP_SQL, ('ПИбд-11', random.randrange(users)))
+                conn.commit()
+
+        db = UserDatabase(db_path)
+
+        def get_user():
+            return db.get_user(random.randrange(users))
+
+        def update_group():
+            return db.update_user_group(random.randrange(users), 'ПИбд-11')
+
+        print(f"Пользователей: {users}, повторов: {repeats}")
+        print(f"{'запрос':<20}{'соединение на вызов, мкс':>28}{'постоянное соединение, мкс':>30}{'ускорение':>12}")
+        for title, before, after in (
+                ("get_user", legacy_get_user, get_user),
+                ("update_user_group", legacy_update_group, update_group),
+        ):
+            before_us = measure(before, repeats)
+            after_us = measure(after, repeats)
+            print(f"{title:<20}{before_us:>28.1f}{after_us:>30.1f}{before_us / after_us:>11.0f}x")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
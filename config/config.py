@@ -44,11 +44,118 @@ ULSTU_PASSWORD = "zxcasdqwe123"
 # Настройки логирования
 LOG_LEVEL = "INFO"
 
-# Настройки изображения
+# Настройки отрисовки и кодирования картинок расписания
 IMAGE_SETTINGS = {
     'width': 1400,
     'margin': 20,
     'cell_height': 90,
-    'time_column_width': 120
+    'time_column_width': 120,
+    'text_cache_size': 4096,  # Сколько готовых надписей ячеек (перенос + растр) помнить
+    'encoder': 'png_palette_fast',  # Профиль кодирования из encoder_profiles (сравнение: python -m benchmarks.image_encoders)
+    'min_psnr': 40,  # Минимальное качество профиля (дБ), чтобы считать его допустимым в бенчмарке
+    'debug_dump_dir': None,  # Папка для копий отправленных картинок расписаний (отладка), None - не сохранять
+    'encoder_profiles': {
+        'png': {'format': 'PNG', 'compress_level': 6},  # Без потерь, как раньше
+        'png_fast': {'format': 'PNG', 'compress_level': 1},
+        # Палитра: на темной теме всего несколько цветов плюс сглаживание текста
+        'png_palette': {'format': 'PNG', 'colors': 64, 'compress_level': 6},
+        'png_palette_fast': {'format': 'PNG', 'colors': 32, 'compress_level': 1},
+        'webp': {'format': 'WEBP', 'quality': 90, 'method': 4},
+        'webp_lossless': {'format': 'WEBP', 'lossless': True, 'quality': 0, 'method': 0},
+        'jpeg': {'format': 'JPEG', 'quality': 90}
+    }
+}
+SCHEDULE_BASE_URL = "https://lk.ulstu.ru/timetable/shared/schedule/Часть%202%20–%20ФИСТ,%20ГФ/61.html"
+
+# Настройки HTTP-клиента для загрузки страниц портала
+HTTP_SETTINGS = {
+    'connection_limit': 20,  # Всего соединений в пуле
+    'limit_per_host': 8,  # Одновременных соединений к lk.ulstu.ru
+    'keepalive_timeout': 30,  # Сколько секунд держать простаивающее соединение
+    'total_timeout': 20,  # Общий таймаут запроса
+    'connect_timeout': 5,  # Таймаут установки соединения
+    'read_timeout': 15,  # Таймаут чтения ответа
+    'encoding': 'cp1251'
+}
+
+# Настройки пула воркеров для парсинга HTML и отрисовки PNG
+EXECUTOR_SETTINGS = {
+    'kind': 'thread',  # 'thread' или 'process'
+    'max_workers': 4,  # Количество потоков/процессов
+    'max_queue': 32  # Сколько задач может ожидать сверх занятых воркеров
+}
+
+# Настройки кэша расписаний: время жизни (секунды) и максимальное число записей на уровень
+CACHE_SETTINGS = {
+    'html': {'ttl': 30 * 60, 'max_size': 200},  # Исходные HTML страницы портала
+    'parsed': {'ttl': 60 * 60, 'max_size': 2000},  # Разобранные списки занятий
+    'png': {'ttl': 60 * 60, 'max_size': 300}  # Готовые PNG изображения
+}
+
+# Настройки массового обхода расписаний всех групп
+CRAWLER_SETTINGS = {
+    'rate': 12,  # Запросов в секунду к порталу (маркерная корзина)
+    'burst': 6,  # Максимальный всплеск запросов
+    'concurrency': 8,  # Одновременно загружаемых страниц
+    'retries': 3,  # Повторов при ошибке
+    'backoff_base': 0.5,  # Базовая задержка перед повтором, секунды
+    'backoff_max': 10  # Максимальная задержка перед повтором, секунды
+}
+
+# Настройки фонового прогрева кэша расписаний
+PREWARM_SETTINGS = {
+    'enabled': True,
+    'initial_delay': 10,  # Задержка первого прогрева после запуска, секунды
+    'interval': 30 * 60,  # Период прогрева, секунды (меньше времени жизни PNG в кэше)
+    'concurrency': 4,  # Одновременно прогреваемых групп
+    'max_groups': 150,  # Сколько самых популярных групп прогревать
+    'active_hours': (6, 22)  # Прогреваем только в эти часы (начало включительно, конец исключительно)
+}
+
+# Настройки автоматического выключателя для запросов к порталу
+CIRCUIT_BREAKER_SETTINGS = {
+    'failure_threshold': 5,  # Ошибок или медленных ответов подряд до размыкания
+    'slow_threshold': 8,  # Ответ дольше стольких секунд считается ошибкой
+    'reset_timeout': 30,  # Через сколько секунд пробовать портал снова
+    'stale_deadline': 4  # Сколько ждать портал, прежде чем отдать устаревшее расписание из кэша
+}
+
+# Настройки разбора HTML
+PARSER_SETTINGS = {
+    'html_backend': 'auto',  # 'selectolax', 'stream', 'lxml', 'bs4' или 'auto' (самый быстрый из установленных)
+    'cell_cache_size': 8192  # Сколько разобранных ячеек помнить (одинаковые ячейки у разных групп)
+}
+
+# Настройки индекса преподавателей, собираемого из расписаний всех групп
+TEACHER_INDEX_SETTINGS = {
+    'enabled': True,
+    'initial_delay': 60,  # Задержка первого полного обхода после запуска, секунды
+    'interval': 6 * 60 * 60,  # Период полного обхода групп для перестройки индекса, секунды
+    'max_age': 12 * 60 * 60  # Старше этого индекс не используется, страница преподавателя загружается с портала
+}
+
+# Настройки кэша загруженных вложений (токены MAX по хешу содержимого)
+MEDIA_SETTINGS = {
+    'max_tokens': 2000  # Сколько токенов помнить (статичные картинки + недавние расписания)
+}
+
+# Настройки картинок разделов (assets): сжатые копии готовятся при запуске и держатся в памяти
+ASSET_SETTINGS = {
+    'source_dir': 'assets',
+    'optimized_dir': 'assets/optimized',  # Сжатые копии и manifest.json; пересобираются при изменении исходников
+    'max_side': 1280,  # Длинная сторона картинки для чата на телефоне, пиксели
+    'jpeg_quality': 85,
+    'graphic_max_colors': 1024,  # Картинки с меньшим числом цветов (схемы, таблицы) или прозрачностью - PNG, остальные - JPEG
+    'palette_colors': 256,  # Палитра PNG-копий; 0 - без перевода в палитру
+    'mmap_threshold': 256 * 1024  # Копии больше этого размера отображаются в память (mmap), меньше - читаются целиком
+}
+
+# Настройки базы пользователей (SQLite)
+DATABASE_SETTINGS = {
+    'path': 'users.db',
+    'journal_mode': 'WAL',  # Чтения не ждут записи, запись - одна дописка в журнал
+    'synchronous': 'NORMAL',  # С WAL данные не теряются при падении процесса, fsync только на чекпойнтах
+    'busy_timeout': 5000,  # Сколько ждать блокировку базы другим процессом, мс
+    'cached_statements': 64,  # Кэш подготовленных запросов соединения
+    'reader_threads': 2  # Потоки чтения асинхронного доступа (запись всегда в одном потоке)
 }
-SCHEDULE_BASE_URL = "https://lk.ulstu.ru/timetable/shared/schedule/Часть%202%20–%20ФИСТ,%20ГФ/61.html"
\ No newline at end of file
@@ -0,0 +1,418 @@
+# content_catalog.py
+"""Статичные разделы меню: текст, картинка из assets и кнопки для каждого payload.
+
+Кнопка - пара (текст, payload); 'buttons' - ряды кнопок, как в InlineKeyboardBuilder.row.
+Картинка - (имя файла в assets, имя файла во вложении). Каталог один раз собирается
+в готовые сообщения при запуске (services/content_service.py).
+"""
+
+BACK_TO_STUDENT_MENU = ("🔙 Назад", "back_to_student_menu")
+BACK_TO_ABITURIENT_MENU = ("🔙 Назад", "back_to_abiturient_menu")
+BACK_TO_PROFKOM = ("🔙 Назад", "back_to_profkom")
+BACK_TO_SCHOLARSHIP = ("🔙 Назад", "student_scholarship")
+BACK_TO_DORMITORY = ("🔙 Назад", "student_dormitory")
+BACK_TO_STUDENT_LIFE = ("🔙 Назад", "student_life")
+
+CONTENT_CATALOG = {
+    # Профком
+    "student_profkom": {
+        'text': (
+            "🙌Мы — Первичная профсоюзная организация обучающихся УлГТУ.\n\n"
+            "Мы знаем, чего хотят студенты, поэтому каждый день:\n\n"
+            "– представляем интересы студенчества перед администрацией университета\n"
+            "– отвечаем на все вопросы про стипендии и общежития\n"
+            "– помогаем экономить деньги, предоставляя скидки и бонусы\n"
+            "– развиваем навыки, которые ты не прокачиваешь на парах\n"
+            "– организуем твоё свободное время\n"
+            "– и просто решаем студенческие проблемы!\n\n"
+            "И мы хотим, чтобы ты был частью нашей организации 💙\n\n"
+            "📃Вступить в Профсоюз можно в профкоме обучающихся УлГТУ.\n\n"
+            "Будем ждать тебя по будням в аудитории профкома обучающихся (между аудиториями 4 и 4а 3 учебного корпуса с 09:00 до 16:00 (обед с 12:00 до 13:00).\n\n"
+            "Или ты можешь дождаться, когда председатель профбюро твоего факультета проведёт с твоей группой встречу, где расскажет о нас."
+        ),
+        'buttons': [
+            [("👥 Состав", "profkom_staff"), ("💰 Выплаты", "profkom_payments")],
+            [("📞 Контакты", "profkom_contacts")],
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+    "profkom_staff": {
+        'text': (
+            "Ты готов попасть в нашу семью? Тогда пора знакомиться!\n\n"
+            "✏ Профсоюзный комитет — выборный орган Первичной профсоюзной организации обучающихся. "
+            "В состав профкома входят: председатель, заместители и 9 председателей профбюро факультетов.\n\n"
+            "👩🏻 Председатель профкома обучающихся - Наталья Федотова\n"
+            "🔷 Заместитель председатель профкома обучающихся - Ксения Морозова\n"
+            "🔹 Заместитель председатель профкома обучающихся - Алексей Лопатин\n\n"
+            "ПРЕДСЕДАТЕЛИ ПРОФСОЮЗНЫХ БЮРО ФАКУЛЬТЕТОВ:\n"
+            "💚ИЭФ - Дмитрий Ульянов\n"
+            "💜ГФ - Анастасия Павлычева\n"
+            "🩵ИАТУ - Айнур Багаутдинов\n"
+            "🧡ЭФ - Дарья Кирпичева\n"
+            "🤍ИФМИ - Герман Филиппов\n"
+            "💛СФ - Оля Лапушкина\n"
+            "💙РТФ - Камилла Алексеева\n"
+            "🖤МФ - Артём Лопатин\n"
+            "❤ФИСТ - Тимур Исаков\n\n"
+            "Тебе предстоит долгий и насыщенный путь, который ты пройдешь со своим профоргом рука об руку, поэтому не стесняйся, пиши ему по любому интересующему тебя вопросу!"
+        ),
+        'image': ("1.jpg", "profkom_staff.jpg"),
+        'buttons': [
+            [BACK_TO_PROFKOM],
+        ],
+    },
+    "profkom_payments": {
+        'text': (
+            "👩‍🎓«Информированный студент – успешный студент!»\n\n"
+            "Профком обучающихся УлГТУ считает своим долгом предоставлять студентам всегда самую актуальную информацию!\n\n"
+            "📌Для вашего удобства мы собрали самую важную информацию о выплатах в одном посте, чтобы вы могли легко ее найти.\n\n"
+            "Подробности об условиях их получения и сроках подачи документов находятся ниже.\n\n"
+            "🔹Государственная академическая стипендия\n"
+            "https://vk.com/wall-22117146_4704\n\n"
+            "🔹Повышенная государственная академическая стипендия\n"
+            "https://vk.com/wall-22117146_4713\n\n"
+            "🔹Государственная социальная стипендия\n"
+            "https://vk.com/wall-22117146_4715\n\n"
+            "🔹 Повышенная государственная социальная стипендия\n"
+            "https://vk.com/wall-22117146_4717\n\n"
+            "🔹 Именные стипендии\n"
+            "https://vk.com/wall-22117146_4746\n\n"
+            "🔹 Стипендии Президента и Правительства РФ\n"
+            "https://vk.com/wall-22117146_4303\n\n"
+            "🔹 Губернаторская стипендия «Семья»\n"
+            "https://vk.com/wall-22117146_4400\n\n"
+            "🔹 Стипендия губернатора Ульяновской области «Призывник»\n"
+            "https://vk.com/wall-22117146_4708\n\n"
+            "🔹 Материальная помощь из средств Профсоюза\n"
+            "https://vk.com/wall-22117146_4721\n\n"
+            "🔹 Материальная помощь из средств ВУЗа\n"
+            "https://vk.com/wall-22117146_4720\n\n"
+        ),
+        'image': ("2.jpg", "profkom_payments.jpg"),
+        'buttons': [
+            [BACK_TO_PROFKOM],
+        ],
+    },
+    "profkom_contacts": {
+        'text': (
+            "📞 Профком обучающихся УлГТУ\n\n"
+            "Информационная группа Первичной профсоюзной организации обучающихся УлГТУ.\n\n"
+            "Режим работы:\n"
+            "Пн-Пт: 8.30-17.30\n\n"
+            "Приём обучающихся:\n"
+            "Пн-Чт: 9.00-16.00\n\n"
+            "Обед:\n"
+            "12.00-13.00\n\n"
+            "📍 Местоположение:\n"
+            "Аудитория профкома обучающихся (между аудиториями 4 и 4а 3 учебного корпуса)"
+        ),
+        'buttons': [
+            [BACK_TO_PROFKOM],
+        ],
+    },
+
+    # Стипендиальные выплаты
+    "student_scholarship": {
+        'text': (
+            "💰 Стипендиальные выплаты\n\n"
+            "Выберите категорию для получения информации о стипендиях:"
+        ),
+        'buttons': [
+            [("👨‍🎓 Студенты", "scholarship_students"), ("🎓 Магистрантам", "scholarship_masters")],
+            [("📚 Аспирантам", "scholarship_phd"), ("🏫 Стипендия колледжей", "scholarship_college")],
+            [("⭐ Повышенная стипендия", "scholarship_increased")],
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+    "scholarship_students": {
+        'text': (
+            "👨‍ Стипендиальные выплаты для студентов\n\n"
+            "Здесь представлена информация о всех видах стипендий, доступных для студентов УлГТУ.\n\n"
+            "📊 Основные виды стипендий:\n"
+            "• Государственная академическая стипендия\n"
+            "• Повышенная государственная академическая стипендия\n"
+            "• Государственная социальная стипендия\n"
+            "• Именные стипендии\n"
+            "• Стипендии Президента и Правительства РФ\n\n"
+            "💡 Для получения подробной информации обращайтесь в профком или деканат вашего факультета."
+        ),
+        'image': ("4.png", "scholarship_students.png"),
+        'buttons': [
+            [BACK_TO_SCHOLARSHIP],
+        ],
+    },
+    "scholarship_masters": {
+        'text': (
+            "🎓 Стипендиальные выплаты для магистрантов\n\n"
+            "Информация о стипендиях и выплатах, доступных для студентов магистратуры УлГТУ.\n\n"
+            "📊 Виды стипендий для магистрантов:\n"
+            "• Государственная академическая стипендия\n"
+            "• Повышенная государственная академическая стипендия\n"
+            "• Стипендии для аспирантов и магистрантов\n"
+            "• Именные стипендии\n"
+            "• Стипендии за научные достижения\n\n"
+            "💡 Для получения подробной информации обращайтесь в профком или деканат вашего факультета."
+        ),
+        'image': ("5.png", "scholarship_masters.png"),
+        'buttons': [
+            [BACK_TO_SCHOLARSHIP],
+        ],
+    },
+    "scholarship_phd": {
+        'text': (
+            "📚 Стипендиальные выплаты для аспирантов\n\n"
+            "Информация о стипендиях и выплатах, доступных для аспирантов УлГТУ.\n\n"
+            "📊 Виды стипендий для аспирантов:\n"
+            "• Государственная стипендия аспирантам\n"
+            "• Повышенная стипендия за научные достижения\n"
+            "• Именные стипендии для аспирантов\n"
+            "• Стипендии Президента и Правительства РФ\n"
+            "• Гранты и научные стипендии\n\n"
+            "💡 Для получения подробной информации обращайтесь в отдел аспирантуры или профком."
+        ),
+        'image': ("6.png", "scholarship_phd.png"),
+        'buttons': [
+            [BACK_TO_SCHOLARSHIP],
+        ],
+    },
+    "scholarship_college": {
+        'text': (
+            "🏫 Стипендиальные выплаты для колледжей\n\n"
+            "Информация о стипендиях и выплатах, доступных для студентов колледжей при УлГТУ.\n\n"
+            "📊 Виды стипендий для колледжей:\n"
+            "• Государственная академическая стипендия\n"
+            "• Социальная стипендия\n"
+            "• Повышенная стипендия за успехи в учебе\n"
+            "• Стипендии за активную деятельность\n"
+            "• Именные стипендии и гранты\n\n"
+            "💡 Для получения подробной информации обращайтесь в администрацию колледжа или профком."
+        ),
+        'image': ("7.png", "scholarship_college.png"),
+        'buttons': [
+            [BACK_TO_SCHOLARSHIP],
+        ],
+    },
+    "scholarship_increased": {
+        'text': (
+            "⭐ Повышенная стипендия\n\n"
+            "Информация о повышенных стипендиях для студентов, магистрантов и аспирантов УлГТУ.\n\n"
+            "📊 Условия получения повышенной стипендии:\n"
+            "• Отличная успеваемость\n"
+            "• Научные достижения и публикации\n"
+            "• Участие в олимпиадах и конкурсах\n"
+            "• Активная общественная деятельность\n"
+            "• Спортивные достижения\n\n"
+            "💡 Для получения подробной информации о критериях и подаче заявления обращайтесь в профком или деканат."
+        ),
+        'image': ("8.png", "scholarship_increased.png"),
+        'buttons': [
+            [BACK_TO_SCHOLARSHIP],
+        ],
+    },
+
+    # Общежитие
+    "student_dormitory": {
+        'text': (
+            "🏠 ИНФОРМАЦИЯ ДЛЯ НУЖДАЮЩИХСЯ В ОБЩЕЖИТИИ\n\n"
+            "Лицам, зарегистрированным вне г.Ульяновска и нуждающимся в общежитии, таковое может быть предоставлено.\n\n"
+            "В г.Ульяновске УлГТУ располагает четырьмя общежития (№1, 2, 3 и 6) общей вместимостью свыше 1300 человек. Общежития расположены на территории кампуса УЛГТУ, на северной площадке (ул.Северный Венец, 32).\n\n"
+            "Проживание в общежитии – это весьма бюджетно (стоимость - от 571,77 руб. для обучающихся на бюджетных местах и от 2004,16 руб. – для внебюджетных мест) и территориально выгодно в силу близости как к учебным корпусам УлГТУ, так и к объектам спортивной инфраструктуры (порядка 500 м в обоих случаях).\n\n"
+            "Как правило, в общежитиях №1, №2 и №3 размещаются учащиеся и студенты УлГТУ, являющиеся гражданами РФ, а в общежитиях №3 и №6 – студенты, являющиеся гражданами иностранных государств, а также сотрудники УлГТУ.\n\n"
+            "Учащиеся и студенты, являющиеся гражданами РФ, размещаются в общежитиях №1, №2 и №3 с соблюдением факультетского принципа размещения: так, в общежитии №1 размещаются учащиеся КЭИ, а также студенты ФИСТ, РТФ и самолётостроительного факультета в общежитии №2 – студенты гуманитарного, энергетического факультетов; в общежитии № 3 - машиностроительного и строительного факультетов."
+        ),
+        'image': ("10.jpg", "dormitory_info.jpg"),
+        'buttons': [
+            [("📋 Предоставление мест", "dormitory_provision"), ("📞 Контакты", "dormitory_contacts")],
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+    "dormitory_provision": {
+        'text': (
+            "📋 Предоставление мест в общежитии\n\n"
+            "1. Получить в деканате справку о поступлении на обучение в УлГТУ (далее - Справка); получить Справку.\n\n"
+            "2. В зависимости от факультета обратиться со Справкой и паспортом РФ (далее - Паспорт) к заведующей общежитием №1, №2 или №3 (распределение факультетов по общежитиям – см. текст выше данного алгоритма) для получения ордера на заселение (далее - Ордер); получить Ордер.\n\n"
+            "3. Медицинская справка из медпункта УлГТУ (6 корпус каб. 410);\n\n"
+            "4. Обратиться с Ордером, Паспортом и медсправкой в центр обслуживания студентов (главный учебный корпус (корпус 6), этаж 3, каб.301) для заключения договора на проживание (далее - Договор) и оформления временной регистрации; получить Договор и свидетельство о временной регистрации.\n\n"
+            "5. Обратиться с Договором и Паспортом в бюро пропусков УлГТУ (каб.100Б, 1-й этаж 3-го учебного корпуса) для оформления биометрического пропуска в общежитие; оформить биометрический пропуск.\n\n"
+            "6. Обратиться с Договором, Медсправкой и Паспортом к заведующей общежитием для собственно заселения в общежитие; заселиться в общежитие."
+        ),
+        'buttons': [
+            [BACK_TO_DORMITORY],
+        ],
+    },
+    "dormitory_contacts": {
+        'text': (
+            "📞 Контакты общежитий УлГТУ\n\n"
+            "Директор студенческого городка:\n"
+            "Головко Марина Николаевна\n"
+            "тел.: +7 (8422) 778-516, +7 (8422) 778-459.\n\n"
+            "Центр обслуживания студентов:\n"
+            "+7 (8422) 778-465.\n\n"
+            "Заведующая общежитием №1:\n"
+            "Шевцова Наталья Евгеньевна\n"
+            "тел.: +7 (8422) 778-278; +7 (8422) 778-514 (вахта общежития №1).\n\n"
+            "Заведующая общежитием №2:\n"
+            "Пигалёва Надежда Павловна\n"
+            "тел.: +7 (8422) 778-268; +7 (8422) 778-515 (вахта общежития №2).\n\n"
+            "Заведующая общежитием №3:\n"
+            "Зайцева Лариса Владимировна\n"
+            "тел.: +7 (8422) 778-269; +7 (8422) 778-507 (вахта общежития №3)."
+        ),
+        'buttons': [
+            [BACK_TO_DORMITORY],
+        ],
+    },
+
+    # Студенческая жизнь
+    "student_life": {
+        'text': (
+            "🎓 Студенческая жизнь УлГТУ\n\n"
+            "Выберите направление для получения подробной информации:"
+        ),
+        'buttons': [
+            [("📰 Студенческие медиа", "student_media")],
+            [("🤝 Добровольческий центр", "student_volunteer")],
+            [("👷 Студенческие отряды", "student_teams")],
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+    "student_media": {
+        'text': (
+            "📰 Студенческие медиа УлГТУ\n\n"
+            "Студенческие медиа УлГТУ – это площадка для самореализации тех, кому интересно быть в центре событий, кто любит Политех и хочет рассказать о нем другим!\n\n"
+            "Студенческие медиа УлГТУ освещают события студенческой жизни вуза: научные, образовательные, культурные, спортивные, развлекательные и другие. Свой профессиональный уровень участники поднимают в рамках медиашкол УлГТУ, выездных мастер-классов и самообучения. Более 50% всего контента об УлГТУ - продукт студенческих медиа.\n\n"
+            "Команда студенческих медиа регулярно участвуют в конкурсах и фестивалях, представляют УлГТУ и Ульяновскую область на Российской студенческой весне в номинации «Журналистика».\n\n"
+            "Любой студент может стать участником студенческих медиацентров УлГТУ, где есть возможность заниматься фото- и видеосъемкой, монтажом роликов, моушн-дизайном, создавать собственные студенческие медиапроекты, становиться ведущими и сценаристами, создавать контент для социальных сетей УлГТУ и писать интересные статьи для разных площадок.\n\n"
+            "В УлГТУ действуют 2 студенческих медиацентра:\n\n"
+            "• студенческий медиацентр при Управлении по информационной политики и связям с общественностью УлГТУ - http://vk.com/mediaulstu\n\n"
+            "• студенческий медиацентр «ОСОВЕТЬ» при Объединенном совете обучающихся УлГТУ - http://vk.com/osovet_media\n\n"
+            "В своей дружной команде студенческие медиацентры рады видеть: фотографов, сценаристов и ведущих, операторов, журналистов, пиарщиков, SMM-щиков, дизайнеров."
+        ),
+        'image': ("12.png", "student_media.png"),
+        'buttons': [
+            [BACK_TO_STUDENT_LIFE],
+        ],
+    },
+    "student_volunteer": {
+        'text': (
+            "🤝 Добровольческий центр УлГТУ\n\n"
+            "Добровольческий Центр является объединением обучающихся, осуществляющим деятельность по организации и развитию добровольческого движения в университете.\n\n"
+            "Все добровольцы – герои нашего времени, которые всегда находят время и возможность помогать тем, кто в этом нуждается. Студенты работают как на вузовских, так и на региональных мероприятиях, участвуют в конференциях и форумах, в экологических, благотворительных, донорских акциях.\n\n"
+            "Сейчас в Центре более 50 волонтеров, которые активно принимают участие в жизни нашего вуза и города. Они занимаются организацией многих масштабных мероприятий, донорством, облагораживанием территориы, пропагандой здорового образа жизни, экологическим просвещением, содействием в помощи пожилым людям, осуществлением посещений в приют для животных.\n\n"
+            "Волонтеры УлГТУ являются участниками общероссийской акции взаимопомощи #МЫВМЕСТЕ. Активисты добровольческого центра оказывают адресную помощь нуждающимся жителям города. Волонтёры могут помочь в покупке продуктов и лекарств, решении бытовых проблем.\n\n"
+            "Если ты хочешь стать частью Центра: помогать нуждающимся, организовывать благотворительные акции и мероприятия, а также участвовать в качестве волонтёра в масштабных проектах, пиши руководителю и присоединяйся к команде!"
+        ),
+        'image': ("13.png", "student_volunteer.png"),
+        'buttons': [
+            [BACK_TO_STUDENT_LIFE],
+        ],
+    },
+    "student_teams": {
+        'text': (
+            "👷 Студенческие отряды УлГТУ\n\n"
+            "Штаб студенческих отрядов УлГТУ действует совместно с общественной организацией «Российские Студенческие Отряды». Главная цель - трудоустройство студентов в летнее и внеучебное время.\n\n"
+            "Сейчас на базе университета работает 6 отрядов:\n\n"
+            "• Строительные отряды «Патриот», «Фобос» и «Селена». Направление деятельности – участие во всероссийских стройках.\n\n"
+            "• Сервисные отряды «Лампа» и «Калейдоскоп». Направление деятельности - работа на море (Семейный Отель 'Alean Family Dovile', г. Анапа) по направлениям клининг, бармен, официант, повар, спасатель, аниматор.\n\n"
+            "• Отряд снежного десанта «Эверест». Направление деятельности - волонтерская помощь ветеранам ВОВ и СВО, проведение развлекательных программ для детей сел и деревень, Профориентационная работа со школьникам\n\n"
+            "Группа Штаба студенческих отрядов УлГТУ - https://vk.com/rso_ulstu"
+        ),
+        'image': ("14.jpg", "student_teams.jpg"),
+        'buttons': [
+            [BACK_TO_STUDENT_LIFE],
+        ],
+    },
+
+    # Остальные разделы меню студента
+    "student_career": {
+        'text': (
+            "💼 Центр Карьеры, УлГТУ\n\n"
+            "Подберем ключ к твоей карьере\n"
+            "Поможем пройти практику, расскажем о вакансиях, сообщим о карьерных мероприятиях.\n\n"
+            "Мы на Факультетусе: https://facultetus.ru/ulstu\n\n"
+            "Наша группа в вк: https://vk.com/rabotaulstu"
+        ),
+        'image': ("15.jpg", "career_center.jpg"),
+        'buttons': [
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+    "student_events": {
+        'text': (
+            "Все анонсы мероприятий можно узнать по следующей ссылке, в официальном канале УлГТУ в MAX - https://max.ru/ulstu73 \n\n "
+            "Группы в ВК каждого нашего факультета:\n\n "
+            "1. Факультет информационных систем и технологий - https://vk.com/fist_ulstu\n\n "
+            "2. Строительный факультет - https://vk.com/sfulstu\n\n "
+            "3. Энергетический факультет - https://vk.com/energoulstu\n\n "
+            "4. Гуманитарный факультет - https://vk.com/gf_ulgtu\n\n "
+            "5. Инженерно-экономический факультет - https://vk.com/ief_ulstu\n\n "
+            "6. Радиотехнический факультет - https://vk.com/rtfpage\n\n "
+            "7. Машиностроительный факультет - https://vk.com/ulstu_mf\n\n "
+        ),
+        'buttons': [
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+    "student_certificate": {
+        'text': (
+            "Для того, чтобы заказать справку об обучении, выполните следующие действия:\n\n"
+            "1. Напишите на почту: L.matveichuk@ulstu.ru c темой письма «Заказать справку»\n"
+            "2. В тексте письма укажите ФИО, группу и количество справок, а также цифру 1-3, в зависимости от того, для чего вам нужна эта справка.\n\n"
+            "1 - Пенсионный фонд\n"
+            "2 - Профком\n"
+            "3 - Родителям на работу\n\n"
+            "Пример письма:\n\n"
+            "Иванов Иван Иванович - группа ПИбд-11\n"
+            "3 - Родителям на работу\n"
+        ),
+        'buttons': [
+            [BACK_TO_STUDENT_MENU],
+        ],
+    },
+
+    # Меню абитуриента
+    "abiturient_info": {
+        'text': (
+            "Информация для поступления:\n\n"
+            "По следующей ссылке находится вся необходимая информация, которая понадобится вам для поступления в Ульяновский Государственный Технический Университет:\n\n"
+            "https://ulstu.ru/education_programs/index.php?SECTION_ID=536\n\n"
+            "📍 Контакты и адреса:\n"
+            "Приемная комиссия УлГТУ расположена по адресу: г. Ульяновск, ул. Северный Венец, 32, 2 учебный корпус\n\n"
+            "☎ Телефоны:\n +7 (8422) 43-05-05\n +7 (909) 355-70-69\n\n"
+            "✉ E-mail: pk@ulstu.ru\n\n"
+            "Приёмная ректора:\n"
+            "• Телефон: 8 (8422) 43-06-43\n"
+            "• Факс: 8 (8422) 43-02-37\n"
+            "• E-mail: rector@ulstu.ru\n\n"
+            "🔗 Более подробная информация находится по ссылке:\n"
+            "https://ulstu.ru/abitur/common/contacts/\n\n"
+            "Для справки используйте команду /help"
+        ),
+        'buttons': [
+            [BACK_TO_ABITURIENT_MENU],
+        ],
+    },
+    "abiturient_chats": {
+        'text': (
+            "💬 Чаты факультетов для абитуриентов:\n\n"
+            "Здесь будут ссылки на чаты всех факультетов УлГТУ\n\n"
+            "Вы можете задавать вопросы о подаче документов и деканы факультетов с радостью вам ответят\n\n"
+            "📚 Факультеты:\n\n"
+            "1. Факультет информационных систем и технологий - https://vk.me/join/AJQ1dyfBWykr3cy9beR_oyxR\n\n"
+            "2. Строительный факультет - https://vk.me/join/AJQ1d9NGXyn4jOf/78xjXyQi\n\n"
+            "3. Энергетический факультет - https://vk.me/join/AJQ1d2gnZymJfeXPSsdF/NlW\n\n"
+            "4. Гуманитарный факультет - https://vk.me/join/AJQ1dwj_ZilWzfZOesDdgPNk\n\n"
+            "5. Инженерно-экономический факультет - https://vk.me/join/AJQ1d2UzYik924RhKc5VMeZ/\n\n"
+            "6. Радиотехнический факультет - https://vk.me/join/AJQ1dyfCTSk8o5ITrqemJS7g\n\n"
+            "7. Машиностроительный факультет - https://vk.me/join/AJQ1dzMjWin5iByTPltOVTit\n\n"
+        ),
+        'buttons': [
+            [BACK_TO_ABITURIENT_MENU],
+        ],
+    },
+}
+
+# Другие payload, которые показывают тот же раздел
+CONTENT_ALIASES = {
+    "back_to_profkom": "student_profkom",
+}
@@ -0,0 +1,336 @@
+"""База пользователей: UserDatabase (SQLite) и асинхронный фасад AsyncUserDatabase.
+
+Модуль ничего не открывает при импорте - экземпляры для бота создаются в database.database,
+а бенчмарки и скрипты создают свои на отдельных файлах.
+"""
+import asyncio
+import sqlite3
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from config.config import DATABASE_SETTINGS
+
+# Тексты запросов не меняются, поэтому соединение подготавливает каждый запрос один раз (cached_statements)
+SELECT_USER_SQL = 'SELECT user_id, role, group_name FROM users WHERE user_id = ?'
+INSERT_USER_SQL = 'INSERT INTO users (user_id, role, group_name) VALUES (?, ?, ?)'
+UPDATE_USER_SQL = 'UPDATE users SET role = ?, group_name = ?, updated_at = CURRENT_TIMESTAMP WHERE user_id = ?'
+UPDATE_ROLE_SQL = 'UPDATE users SET role = ?, updated_at = CURRENT_TIMESTAMP WHERE user_id = ?'
+UPDATE_GROUP_SQL = 'UPDATE users SET group_name = ?, updated_at = CURRENT_TIMESTAMP WHERE user_id = ?'
+DELETE_USER_SQL = 'DELETE FROM users WHERE user_id = ?'
+
+
+class UserDatabase:
+    """База пользователей на долгоживущих соединениях SQLite.
+
+    Соединения открываются при первом обращении в режиме WAL с synchronous=NORMAL и живут
+    до close(). Запись идет через одно общее соединение по очереди под блокировкой;
+    чтение - через собственное соединение каждого потока, поэтому в режиме WAL
+    читатели не ждут записи.
+    """
+
+    def __init__(self, db_path=None, settings=DATABASE_SETTINGS):
+        self.db_path = db_path or settings['path']
+        self.settings = settings
+        self._conn = None
+        self._lock = threading.RLock()
+        self._local = threading.local()  # Соединение для чтения в текущем потоке
+        self._readers = []  # Все открытые соединения для чтения, чтобы закрыть их в close()
+        self._generation = 0  # Меняется при закрытии, чтобы потоки открыли соединения заново
+        self.check_and_update_schema()  # Сначала проверяем схему
+        self.init_database()  # Затем инициализируем
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.settings['busy_timeout'] / 1000,
+            check_same_thread=False,  # Общее соединение защищено self._lock, закрывает соединения close()
+            cached_statements=self.settings['cached_statements']
+        )
+        conn.execute(f"PRAGMA journal_mode={self.settings['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous={self.settings['synchronous']}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.settings['busy_timeout'])}")
+        return conn
+
+    def _connection(self):
+        """Общее соединение с базой (запись); вызывать под self._lock"""
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def _reader(self):
+        """Соединение для чтения, свое у каждого потока"""
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            with self._lock:
+                local.conn = self._connect()
+                local.generation = self._generation
+                self._readers.append(local.conn)
+        return local.conn
+
+    def close(self):
+        """Закрывает соединения; журнал WAL при этом переносится в файл базы"""
+        with self._lock:
+            self._generation += 1
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def init_database(self):
+        """Инициализация базы данных и создание таблицы"""
+        try:
+            with self._lock, self._connection() as conn:
+                cursor = conn.cursor()
+
+                # УБИРАЕМ УДАЛЕНИЕ ТАБЛИЦЫ - сохраняем данные между перезапусками
+                # cursor.execute('DROP TABLE IF EXISTS users')
+
+                # Создаем таблицу только если она не существует
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS users (
+                        user_id INTEGER PRIMARY KEY,
+                        role TEXT NOT NULL DEFAULT 'student',
+                        group_name TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+
+                # Проверяем структуру таблицы
+                cursor.execute("PRAGMA table_info(users)")
+                columns = cursor.fetchall()
+                logging.info(f"📊 Структура таблицы users: {columns}")
+
+                logging.info("✅ База данных инициализирована успешно")
+
+        except Exception as e:
+            logging.error(f"❌ Ошибка инициализации БД: {e}")
+            # Пытаемся создать заново при ошибке
+            self.force_recreate_database()
+
+    def force_recreate_database(self):
+        """Принудительно пересоздает базу данных только при критических ошибках"""
+        try:
+            # Проверяем, существует ли таблица и имеет ли правильную структуру
+            if not self.check_database_health():
+                with self._lock:
+                    # Файл удаляется вместе с журналом WAL, поэтому сначала закрываем соединение
+                    self.close()
+                    for path in (self.db_path, self.db_path + '-wal', self.db_path + '-shm'):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    logging.info("🗑️ Старая база данных удалена из-за ошибок")
+
+                    with self._connection() as conn:
+                        cursor = conn.cursor()
+                        cursor.execute('''
+                            CREATE TABLE users (
+                                user_id INTEGER PRIMARY KEY,
+                                role TEXT NOT NULL DEFAULT 'student',
+                                group_name TEXT,
+                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                            )
+                        ''')
+                    logging.info("✅ База данных пересоздана успешно")
+            else:
+                logging.info("✅ База данных в норме, пересоздание не требуется")
+        except Exception as e:
+            logging.error(f"❌ Критическая ошибка при создании БД: {e}")
+
+    def add_or_update_user(self, user_id: int, role: str, group_name: Optional[str] = None):
+        """Добавляет или обновляет пользователя"""
+        try:
+            with self._lock, self._connection() as conn:
+                # Проверяем существование пользователя
+                existing_user = conn.execute(SELECT_USER_SQL, (user_id,)).fetchone()
+
+                if existing_user:
+                    # Обновляем существующего пользователя
+                    conn.execute(UPDATE_USER_SQL, (role, group_name, user_id))
+                    logging.info(f"✅ Пользователь {user_id} обновлен: роль={role}, группа={group_name}")
+                else:
+                    # Добавляем нового пользователя
+                    conn.execute(INSERT_USER_SQL, (user_id, role, group_name))
+                    logging.info(f"✅ Пользователь {user_id} добавлен: роль={role}, группа={group_name}")
+
+                return True
+
+        except Exception as e:
+            logging.error(f"❌ Ошибка добавления/обновления пользователя {user_id}: {e}")
+            # Пытаемся восстановить базу данных при ошибке
+            self.force_recreate_database()
+            return False
+
+    def check_and_update_schema(self):
+        """Проверяет и обновляет схему базы данных при необходимости"""
+        try:
+            with self._lock:
+                cursor = self._connection().cursor()
+
+                # Проверяем существующие колонки
+                cursor.execute("PRAGMA table_info(users)")
+                existing_columns = {column[1] for column in cursor.fetchall()}
+
+            required_columns = {'user_id', 'role', 'group_name', 'created_at', 'updated_at'}
+
+            # Если есть отсутствующие колонки, пересоздаем таблицу
+            if not required_columns.issubset(existing_columns):
+                logging.warning("🔄 Обнаружены изменения в схеме, пересоздаем таблицу...")
+                self.force_recreate_database()
+
+        except Exception as e:
+            logging.error(f"❌ Ошибка проверки схемы: {e}")
+
+    def get_user(self, user_id: int) -> Optional[Tuple]:
+        """Получает информацию о пользователе"""
+        try:
+            return self._reader().execute(SELECT_USER_SQL, (user_id,)).fetchone()
+        except Exception as e:
+            logging.error(f"❌ Ошибка получения пользователя {user_id}: {e}")
+            # Пытаемся восстановить базу данных при ошибке
+            self.force_recreate_database()
+            return None
+
+    def update_user_role(self, user_id: int, role: str):
+        """Обновляет роль пользователя"""
+        try:
+            with self._lock, self._connection() as conn:
+                conn.execute(UPDATE_ROLE_SQL, (role, user_id))
+            logging.info(f"✅ Роль пользователя {user_id} обновлена: {role}")
+            return True
+        except Exception as e:
+            logging.error(f"❌ Ошибка обновления роли пользователя {user_id}: {e}")
+            return False
+
+    def update_user_group(self, user_id: int, group_name: str):
+        """Обновляет группу пользователя"""
+        try:
+            with self._lock, self._connection() as conn:
+                conn.execute(UPDATE_GROUP_SQL, (group_name, user_id))
+            logging.info(f"✅ Группа пользователя {user_id} обновлена: {group_name}")
+            return True
+        except Exception as e:
+            logging.error(f"❌ Ошибка обновления группы пользователя {user_id}: {e}")
+            return False
+
+    def delete_user(self, user_id: int):
+        """Удаляет пользователя"""
+        try:
+            with self._lock, self._connection() as conn:
+                conn.execute(DELETE_USER_SQL, (user_id,))
+            logging.info(f"✅ Пользователь {user_id} удален")
+            return True
+        except Exception as e:
+            logging.error(f"❌ Ошибка удаления пользователя {user_id}: {e}")
+            return False
+
+    def get_all_users(self):
+        """Получает всех пользователей (для админки)"""
+        try:
+            return self._reader().execute(
+                'SELECT user_id, role, group_name FROM users ORDER BY created_at DESC'
+            ).fetchall()
+        except Exception as e:
+            logging.error(f"❌ Ошибка получения всех пользователей: {e}")
+            return []
+
+    def get_group_popularity(self):
+        """Возвращает [(группа, число пользователей)] по убыванию числа пользователей"""
+        try:
+            return self._reader().execute('''
+                SELECT group_name, COUNT(*) AS users_count
+                FROM users
+                WHERE group_name IS NOT NULL AND group_name != ''
+                GROUP BY group_name
+                ORDER BY users_count DESC
+            ''').fetchall()
+        except Exception as e:
+            logging.error(f"❌ Ошибка получения популярных групп: {e}")
+            return []
+
+    def check_database_health(self):
+        """Проверяет здоровье базы данных"""
+        try:
+            with self._lock:
+                cursor = self._connection().cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
+                table_exists = cursor.fetchone()
+
+                if table_exists:
+                    cursor.execute("PRAGMA table_info(users)")
+                    columns = cursor.fetchall()
+                    logging.info(f"🔍 Проверка БД: таблица существует, колонки: {columns}")
+                    return True
+                else:
+                    logging.error("❌ Таблица 'users' не существует")
+                    return False
+        except Exception as e:
+            logging.error(f"❌ Ошибка проверки здоровья БД: {e}")
+            return False
+
+
+class AsyncUserDatabase:
+    """Асинхронный доступ к UserDatabase для обработчиков бота.
+
+    Вызовы выполняются в отдельных потоках, и цикл событий не ждет диск.
+    Запись идет через один поток (очередь запросов исполнителя), поэтому записи
+    выполняются строго по порядку; чтение - в своих потоках и записи не ждет.
+    """
+
+    def __init__(self, db, settings=DATABASE_SETTINGS):
+        self.db = db
+        self.settings = settings
+        self._writer = None
+        self._readers = None
+
+    def _get_writer(self):
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        return self._writer
+
+    def _get_readers(self):
+        if self._readers is None:
+            self._readers = ThreadPoolExecutor(max_workers=self.settings['reader_threads'],
+                                               thread_name_prefix="db-reader")
+        return self._readers
+
+    async def _read(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_readers(), func, *args)
+
+    async def _write(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_writer(), func, *args)
+
+    async def get_user(self, user_id: int) -> Optional[Tuple]:
+        return await self._read(self.db.get_user, user_id)
+
+    async def get_all_users(self):
+        return await self._read(self.db.get_all_users)
+
+    async def get_group_popularity(self):
+        return await self._read(self.db.get_group_popularity)
+
+    async def add_or_update_user(self, user_id: int, role: str, group_name: Optional[str] = None):
+        return await self._write(self.db.add_or_update_user, user_id, role, group_name)
+
+    async def update_user_role(self, user_id: int, role: str):
+        return await self._write(self.db.update_user_role, user_id, role)
+
+    async def update_user_group(self, user_id: int, group_name: str):
+        return await self._write(self.db.update_user_group, user_id, group_name)
+
+    async def delete_user(self, user_id: int):
+        return await self._write(self.db.delete_user, user_id)
+
+    def close(self):
+        """Дожидается начатых запросов, останавливает потоки и закрывает базу"""
+        for executor in (self._writer, self._readers):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._writer = self._readers = None
+        self.db.close()
@@ -2,6 +2,7 @@ import logging
 from maxapi.types import MessageCallback
 
 from services.state_service import state_service
+from services.content_service import content_service
 from services.schedule_service import ScheduleService
 from services.user_service import UserService
 from keyboards.student_menu import send_student_menu
@@ -11,6 +12,13 @@ logging.basicConfig(level=logging.INFO)
 
 
 def register_callback_handlers(dp, bot, schedule_service: ScheduleService, user_service: UserService):
+    # Остальные callback-и с логикой; статичные разделы меню - в content_service
+    other_callbacks = {
+        "back_to_abiturient_menu": lambda bot, chat_id: user_service.process_role_selection(bot, chat_id, "abiturient"),
+        "enter_group_name": schedule_service.handle_enter_group_name,
+        "search_group": schedule_service.handle_search_group,
+    }
+
     @dp.message_callback()
     async def handle_callback(event: MessageCallback):
         try:
@@ -19,7 +27,11 @@ def register_callback_handlers(dp, bot, schedule_service: ScheduleService, user_
 
             logging.info(f"🔍 Callback получен: chat_id={chat_id}, payload={payload}")
 
-            if payload and payload.startswith("role_"):
+            message = content_service.get(payload)
+            if message is not None:
+                await content_service.send(bot, chat_id, message)
+
+            elif payload and payload.startswith("role_"):
                 role = payload.split("_")[1]
                 await user_service.process_role_selection(bot, chat_id, role)
 
@@ -33,6 +45,19 @@ def register_callback_handlers(dp, bot, schedule_service: ScheduleService, user_
             elif payload == "student_schedule":
                 await schedule_service.handle_student_schedule_callback(bot, chat_id)
 
+            elif payload and payload.startswith("group_week_"):
+                _, _, group_number, week = payload.split("_")
+                await schedule_service.generate_and_send_table(
+                    bot, chat_id, int(group_number), None if week == "current" else week
+                )
+
+            elif payload == "free_rooms":
+                await schedule_service.send_free_rooms(bot, chat_id)
+
+            elif payload and payload.startswith("free_rooms_"):
+                _, _, building, pair = payload.split("_")
+                await schedule_service.send_free_rooms(bot, chat_id, None if building == "all" else building, int(pair))
+
             elif payload == "back_to_main":
                 user_service.clear_temp_states(chat_id)
                 await send_welcome_message(bot, chat_id)
@@ -57,37 +82,9 @@ def register_callback_handlers(dp, bot, schedule_service: ScheduleService, user_
 
     async def handle_other_callbacks(bot, chat_id, payload):
         """Обработка остальных callback-пейлоадов"""
-        callback_handlers = {
-            "profkom_staff": lambda: schedule_service.send_profkom_staff_info(bot, chat_id),
-            "profkom_payments": lambda: schedule_service.send_profkom_payments_info(bot, chat_id),
-            "profkom_contacts": lambda: schedule_service.send_profkom_contacts_info(bot, chat_id),
-            "student_scholarship": lambda: schedule_service.send_scholarship_info(bot, chat_id),
-            "student_life": lambda: schedule_service.send_student_life_info(bot, chat_id),
-            "scholarship_students": lambda: schedule_service.send_scholarship_students_info(bot, chat_id),
-            "scholarship_masters": lambda: schedule_service.send_scholarship_masters_info(bot, chat_id),
-            "scholarship_phd": lambda: schedule_service.send_scholarship_phd_info(bot, chat_id),
-            "scholarship_college": lambda: schedule_service.send_scholarship_college_info(bot, chat_id),
-            "scholarship_increased": lambda: schedule_service.send_scholarship_increased_info(bot, chat_id),
-            "student_dormitory": lambda: schedule_service.send_dormitory_info(bot, chat_id),
-            "dormitory_provision": lambda: schedule_service.send_dormitory_provision_info(bot, chat_id),
-            "dormitory_contacts": lambda: schedule_service.send_dormitory_contacts_info(bot, chat_id),
-            "student_media": lambda: schedule_service.send_student_media_info(bot, chat_id),
-            "student_volunteer": lambda: schedule_service.send_student_volunteer_info(bot, chat_id),
-            "student_teams": lambda: schedule_service.send_student_teams_info(bot, chat_id),
-            "abiturient_info": lambda: schedule_service.send_abiturient_info(bot, chat_id),
-            "abiturient_chats": lambda: schedule_service.send_abiturient_chats(bot, chat_id),
-            "back_to_abiturient_menu": lambda: user_service.process_role_selection(bot, chat_id, "abiturient"),
-            "student_events": lambda: schedule_service.send_events_info(bot, chat_id),
-            "student_certificate": lambda: schedule_service.send_certificate_info(bot, chat_id),
-            "student_profkom": lambda: schedule_service.send_profkom_info(bot, chat_id),
-            "student_career": lambda: schedule_service.send_career_center_info(bot, chat_id),
-            "back_to_profkom": lambda: schedule_service.send_profkom_info(bot, chat_id),
-            "enter_group_name": lambda: schedule_service.handle_enter_group_name(bot, chat_id),
-            "search_group": lambda: schedule_service.handle_search_group(bot, chat_id),
-        }
-
-        if payload in callback_handlers:
-            await callback_handlers[payload]()
+        handler = other_callbacks.get(payload)
+        if handler is not None:
+            await handler(bot, chat_id)
         else:
             await bot.send_message(
                 chat_id=chat_id,
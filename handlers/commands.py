@@ -1,9 +1,10 @@
 import logging
 from maxapi.types import MessageCreated, Command, BotStarted
-from services.schedule_service import ScheduleService
+from services.schedule_service import ScheduleService, ROOMS_USAGE
 from services.user_service import UserService
 from keyboards.main_menu import send_welcome_message
 from keyboards.student_menu import send_student_menu
+from parsers.room_index import PAIRS
 
 logging.basicConfig(level=logging.INFO)
 
@@ -103,6 +104,27 @@ def register_command_handlers(dp, bot, schedule_service: ScheduleService, user_s
             logging.error(f"❌ Ошибка в обработчике /search: {e}")
             await event.message.answer("❌ Ошибка при поиске групп")
 
+    @dp.message_created(Command('rooms'))
+    async def rooms_command(event: MessageCreated):
+        try:
+            chat_id = event.message.recipient.chat_id
+            parts = event.message.body.text.strip().split()
+
+            # /rooms [корпус] [пара]
+            building = parts[1] if len(parts) > 1 else None
+            pair = parts[2] if len(parts) > 2 else None
+            if (building is not None and not building.isdigit()) or \
+                    (pair is not None and not (pair.isdigit() and 1 <= int(pair) <= PAIRS)):
+                await event.message.answer(ROOMS_USAGE)
+                return
+            pair = int(pair) if pair is not None else None
+
+            await schedule_service.send_free_rooms(bot, chat_id, building, pair)
+
+        except Exception as e:
+            logging.error(f"❌ Ошибка в обработчике /rooms: {e}")
+            await event.message.answer("❌ Ошибка при поиске свободных аудиторий")
+
     @dp.message_created(Command('profile'))
     async def profile_command(event: MessageCreated):
         try:
@@ -30,3 +30,15 @@ def get_back_to_abiturient_menu_button():
 def get_back_to_group_selection_button():
     """Возвращает кнопку 'Назад' к выбору группы"""
     return CallbackButton(text="🔙 Назад", payload="back_to_group_selection")
+
+
+def get_group_week_button(group_number, week, current=False):
+    """Возвращает кнопку переключения недели в расписании группы"""
+    if current:
+        return CallbackButton(text="📅 Текущая неделя", payload=f"group_week_{group_number}_current")
+    return CallbackButton(text="📆 Следующая неделя", payload=f"group_week_{group_number}_{week}")
+
+
+def get_free_rooms_button(building, pair):
+    """Возвращает кнопку свободных аудиторий на следующую пару"""
+    return CallbackButton(text=f"➡️ {pair} пара", payload=f"free_rooms_{building or 'all'}_{pair}")
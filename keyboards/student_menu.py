@@ -7,6 +7,9 @@ async def send_student_menu(bot, chat_id):
     builder.row(
         CallbackButton(text="📅 Получить расписание", payload="student_schedule"),
     )
+    builder.row(
+        CallbackButton(text="🚪 Свободные аудитории", payload="free_rooms"),
+    )
     builder.row(
         CallbackButton(text="💰 Стипендиальные выплаты", payload="student_scholarship"),
         CallbackButton(text="🏠 Общежитие", payload="student_dormitory"),
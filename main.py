@@ -9,14 +9,18 @@ from handlers.callbacks import register_callback_handlers
 from handlers.messages import register_message_handlers
 from services.schedule_service import ScheduleService
 from services.user_service import UserService
+from services.prewarm_service import PrewarmService
 from config import *
-from database.database import user_db
+from database.database import user_db, async_user_db
+from utils.assets import asset_store
+from services.content_service import content_service
 
 logging.basicConfig(level=logging.INFO)
 
 # Создаем экземпляры сервисов
 schedule_service = ScheduleService()
 user_service = UserService()
+prewarm_service = PrewarmService(schedule_service.parser)
 
 bot = Bot(BOT_TOKEN)
 dp = Dispatcher()
@@ -36,14 +40,22 @@ async def main():
             logging.error("❌ Проблемы с базой данных, пытаемся восстановить...")
             user_db.force_recreate_database()
 
+        # Готовим и загружаем в память картинки разделов и собираем статичные разделы меню
+        asset_store.load()
+        content_service.load()
+
+        # Прогреваем кэш расписаний популярных групп в фоне
+        prewarm_service.start()
+
         logging.info("✅ Бот запущен!")
         await dp.start_polling(bot)
 
     except Exception as e:
         logging.error(f"Ошибка: {e}")
     finally:
-        if schedule_service.parser.session:
-            schedule_service.parser.session.close()
+        await prewarm_service.stop()
+        await schedule_service.parser.close()
+        async_user_db.close()
 
 
 if __name__ == '__main__':
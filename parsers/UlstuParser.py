@@ -1,22 +1,53 @@
 from parsers.image_generator import ScheduleImageGenerator
+from parsers.http_client import AsyncHttpClient, PageResponse
+from parsers.html_backend import get_backend
+from parsers.page_parser import SchedulePageParser
+from parsers import workers, cell_parser
+from parsers.schedule_cache import ScheduleCache, RenderedSchedule
+from parsers.crawler import ScheduleCrawler
+from parsers.teacher_index import TeacherIndex
+from parsers.room_index import RoomIndex
+from utils.worker_pool import WorkerPool
+from utils.singleflight import SingleFlight
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from database.groups_dict import GROUPS_DICT
 from database.teachers_dict import TEACHERS_DICT
-import re
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
 import logging
-from config.config import SCHEDULE_BASE_URL, MIN_GROUP_NUMBER, MAX_GROUP_NUMBER, SCHEDULE_PARTS
+from config.config import SCHEDULE_BASE_URL, MIN_GROUP_NUMBER, MAX_GROUP_NUMBER, SCHEDULE_PARTS, EXECUTOR_SETTINGS, \
+    CIRCUIT_BREAKER_SETTINGS, PARSER_SETTINGS
 from database.groups_dict import GROUPS_DICT, GROUPS_REVERSE_DICT  # Добавляем импорт обратного словаря
 from database.teachers_dict import TEACHERS_DICT, TEACHERS_REVERSE_DICT
 
 
 class UlstuParser:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = requests.Session()  # Используется только для авторизации
+        self.http = AsyncHttpClient()
+        self.worker_pool = WorkerPool(**EXECUTOR_SETTINGS)
+        self.cache = ScheduleCache()
+        self.in_flight = SingleFlight()
+        self.teacher_index = TeacherIndex()
+        self.room_index = RoomIndex()
+        self.breaker = CircuitBreaker("lk.ulstu.ru",
+                                      failure_threshold=CIRCUIT_BREAKER_SETTINGS['failure_threshold'],
+                                      slow_threshold=CIRCUIT_BREAKER_SETTINGS['slow_threshold'],
+                                      reset_timeout=CIRCUIT_BREAKER_SETTINGS['reset_timeout'])
+        self._refresh_tasks = {}
         self.base_url = "https://lk.ulstu.ru"
         self.logged_in = False
         self.image_generator = ScheduleImageGenerator()
-        self.image_generator = ScheduleImageGenerator()
+        self.page_parser = SchedulePageParser(get_backend(PARSER_SETTINGS['html_backend']))
+
+    @property
+    def html_backend(self):
+        return self.page_parser.html_backend
+
+    @html_backend.setter
+    def html_backend(self, backend):
+        self.page_parser.html_backend = backend
 
     def get_schedule_part_for_group(self, group_number):
         """Определяет к какой части расписания принадлежит группа"""
@@ -44,6 +75,7 @@ class UlstuParser:
                 else:
                     logging.info("✅ Авторизация успешна!")
                     self.logged_in = True
+                    self.http.set_cookies(self.session.cookies.get_dict())
 
                     # Проверяем реальную авторизацию, делая тестовый запрос
                     test_url = "https://lk.ulstu.ru/timetable/shared/schedule/Часть%202%20–%20ФИСТ,%20ГФ/60.html"
@@ -103,299 +135,97 @@ class UlstuParser:
 
         return None
 
-    def parse_all_groups(self):
-        """Парсит расписание всех групп"""
+    async def parse_all_groups_async(self, group_numbers=None):
+        """Парсит расписание всех групп параллельно с ограничением частоты запросов"""
         if not self.logged_in:
             logging.error("❌ Не авторизован для парсинга")
             return {}
 
-        all_groups_data = {}
+        all_groups_data = await ScheduleCrawler(self).crawl_groups(group_numbers)
+        if group_numbers is None and all_groups_data:
+            # Полный обход покрывает все занятия - из него строятся расписания преподавателей и занятость аудиторий
+            self.teacher_index.build(all_groups_data)
+            self.room_index.build(all_groups_data)
+        return all_groups_data
 
-        for group_number in range(MIN_GROUP_NUMBER, MAX_GROUP_NUMBER + 1):
+    def parse_all_groups(self):
+        """Парсит расписание всех групп (синхронная обёртка)"""
+
+        async def runner():
             try:
-                group_url = self.get_group_url(group_number)
-                group_name = self.get_group_name(group_number)
-                logging.info(f"🔍 Парсим группу {group_number} ({group_name})...")
-
-                parsed_group_name, week_number, schedules = self.parse_group_schedule(group_url)
-
-                if group_name and schedules:
-                    all_groups_data[group_number] = {
-                        'name': group_name,
-                        'week': week_number,
-                        'schedule': schedules,
-                        'url': group_url
-                    }
-                    logging.info(f"✅ Группа {group_number} ({group_name}): {len(schedules)} занятий")
-                else:
-                    logging.warning(f"⚠️ Группа {group_number} ({group_name}): расписание не найдено")
+                return await self.parse_all_groups_async()
+            finally:
+                await self.http.close()
 
-                import time
-                time.sleep(0.5)
+        return asyncio.run(runner())
 
-            except Exception as e:
-                logging.error(f"❌ Ошибка парсинга группы {group_number}: {e}")
-                continue
+    async def _fetch_page_async(self, url, conditional=False):
+        """Загружает страницу портала (с учетом кэша HTML) и возвращает PageResponse.
+        При сетевой ошибке статус равен None"""
+        content = self.cache.html.get(url)
+        if content is not None:
+            # То же тело, что пришло с портала в прошлый раз, уже разобрано - changed=False
+            return PageResponse(200, content, not (conditional and self.http.matches_last(url, content)))
 
-        return all_groups_data
+        try:
+            logging.info(f"🔍 Загружаю страницу: {url}")
+            page = await self.fetch_portal(url, conditional=conditional)
+        except CircuitOpenError as e:
+            logging.warning(f"⛔ {e}, страница {url} не запрашивается")
+            return PageResponse(None, b"")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"❌ Ошибка загрузки страницы {url}: {e!r}")
+            return PageResponse(None, b"")
+
+        if page.status == 200:
+            self.cache.html.set(url, page.content)
+        return page
+
+    async def fetch_portal(self, url, conditional=False):
+        """Запрос к порталу через автоматический выключатель.
+        Ошибки, 429/5xx и слишком медленные ответы размыкают его, пока открыт - бросает CircuitOpenError"""
+        return await self.breaker.call(self.http.fetch, url, conditional=conditional,
+                                       is_failure=lambda page: page.status == 429 or page.status >= 500)
+
+    def _fetch_page(self, url):
+        """Синхронная загрузка страницы портала"""
+        try:
+            logging.info(f"🔍 Загружаю страницу: {url}")
+            return self.http.fetch_sync(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"❌ Ошибка загрузки страницы {url}: {e!r}")
+            return PageResponse(None, b"")
+
+    async def _parse_page_async(self, kind, url, page):
+        """Разбирает загруженную страницу группы или преподавателя в пуле воркеров: (имя, {неделя: занятия})"""
+        if kind == 'group':
+            return await self.worker_pool.run("parse_group", workers.parse_group_weeks, url, page.status, page.content)
+        return await self.worker_pool.run("parse_teacher", workers.parse_teacher_weeks, page.status, page.content)
+
+    async def parse_group_schedule_async(self, group_url):
+        """Асинхронно загружает и парсит расписание группы УлГТУ"""
+        page = await self._fetch_page_async(group_url)
+        return self._current_week(*await self._parse_page_async('group', group_url, page))
 
     def parse_group_schedule(self, group_url):
-        """Парсит расписание группы УлГТУ"""
-        try:
-            logging.info(f"🔍 Загружаю расписание: {group_url}")
-            response = self.session.get(group_url)
-            response.encoding = 'cp1251'
-
-            if response.status_code != 200:
-                logging.warning(f"⚠️ Не удалось загрузить страницу: {response.status_code}")
-                # Пытаемся извлечь номер группы из URL
-                try:
-                    group_number_match = re.search(r'/(\d+)\.html', group_url)
-                    if group_number_match:
-                        url_group_number = int(group_number_match.group(1))
-
-                        # Определяем часть по URL
-                        if 'Часть%201' in group_url or 'Часть 1' in group_url:
-                            actual_group_number = url_group_number
-                        elif 'Часть%202' in group_url or 'Часть 2' in group_url:
-                            actual_group_number = url_group_number + 115
-                        elif 'Часть%203' in group_url or 'Часть 3' in group_url:
-                            actual_group_number = url_group_number + 234
-                        elif 'Часть%204' in group_url or 'Часть 4' in group_url:
-                            actual_group_number = url_group_number + 464
-                        elif 'Часть%205' in group_url or 'Часть 5' in group_url:
-                            actual_group_number = url_group_number + 562
-                        else:
-                            actual_group_number = url_group_number
-
-                        group_name = self.get_group_name(actual_group_number)
-                    else:
-                        group_name = "Неизвестная группа"
-                except:
-                    group_name = "Неизвестная группа"
-                return group_name, "1", []
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Извлекаем номер группы из URL для определения реального номера
-            group_number_match = re.search(r'/(\d+)\.html', group_url)
-            if group_number_match:
-                url_group_number = int(group_number_match.group(1))
-
-                # Определяем часть по URL
-                if 'Часть%201' in group_url or 'Часть 1' in group_url:
-                    actual_group_number = url_group_number
-                elif 'Часть%202' in group_url or 'Часть 2' in group_url:
-                    actual_group_number = url_group_number + 115
-                elif 'Часть%203' in group_url or 'Часть 3' in group_url:
-                    actual_group_number = url_group_number + 234
-                elif 'Часть%204' in group_url or 'Часть 4' in group_url:
-                    actual_group_number = url_group_number + 464
-                elif 'Часть%205' in group_url or 'Часть 5' in group_url:
-                    actual_group_number = url_group_number + 562
-                else:
-                    actual_group_number = url_group_number
+        """Парсит расписание группы УлГТУ (синхронная обёртка)"""
+        page = self._fetch_page(group_url)
+        return self._parse_group_page(group_url, page.status, page.content)
 
-                group_name = self.get_group_name(actual_group_number)
-            else:
-                group_name = "Неизвестная группа"
-
-            week_number = "1"
-
-            # Поиск номера недели
-            week_elements = soup.find_all('font', {'color': '#ff00ff', 'face': 'Times New Roman', 'size': '6'})
-            for element in week_elements:
-                text = element.get_text(strip=True)
-                if 'Неделя:' in text:
-                    week_match = re.search(r'Неделя:\s*(\d+)-я', text)
-                    if week_match:
-                        week_number = week_match.group(1)
-                        logging.info(f"📅 Найдена неделя: {week_number}")
-                    break
-
-            if week_number == "1":
-                week_texts = soup.find_all(text=re.compile(r'Неделя:'))
-                for text in week_texts:
-                    week_match = re.search(r'Неделя:\s*(\d+)-я', str(text))
-                    if week_match:
-                        week_number = week_match.group(1)
-                        logging.info(f"📅 Найдена неделя через текст: {week_number}")
-                        break
-
-            # Поиск таблиц
-            tables = soup.find_all("table", {"border": "1"})
-            if not tables:
-                tables = soup.find_all("table", {"class": re.compile(r'table|schedule', re.I)})
-            if not tables:
-                tables = soup.find_all("table")
-
-            if not tables:
-                schedule_tables = []
-                all_tables = soup.find_all("table")
-                for table in all_tables:
-                    table_text = table.get_text().lower()
-                    if any(word in table_text for word in
-                           ['пн', 'вт', 'ср', 'чт', 'пт', 'сб', 'пара', 'понедельник', 'вторник']):
-                        schedule_tables.append(table)
-                tables = schedule_tables
-
-            logging.info(f"🔍 Найдено таблиц: {len(tables)}")
-
-            schedules = []
-            day_names = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб"]
-
-            if tables:
-                for table_idx, table in enumerate(tables):
-                    logging.info(f"🔍 Анализирую таблицу {table_idx + 1}")
-                    rows = table.find_all("tr")
-                    logging.info(f"🔍 Найдено строк в таблице: {len(rows)}")
-
-                    for row_idx in range(2, min(len(rows), 8)):
-                        row = rows[row_idx]
-                        cells = row.find_all(["td", "th"])
-
-                        if len(cells) < 2:
-                            continue
-
-                        day_name = day_names[row_idx - 2] if (row_idx - 2) < len(day_names) else f"День{row_idx - 1}"
-
-                        for cell_idx in range(1, min(len(cells), 9)):
-                            cell = cells[cell_idx]
-                            pair_number = cell_idx
-                            cell_text = cell.get_text(separator='\n', strip=True)
-
-                            if cell_text and cell_text not in ['', '-', ' ']:
-                                lesson_data = self._parse_cell_content(cell_text)
-                                if lesson_data:
-                                    schedule_item = {
-                                        'week': int(week_number),
-                                        'day': day_name,
-                                        'pair': pair_number,
-                                        'subject': lesson_data['subject'],
-                                        'type': lesson_data['type'],
-                                        'teacher': lesson_data['teacher'],
-                                        'classroom': lesson_data['classroom']
-                                    }
-                                    schedules.append(schedule_item)
-                                    logging.info(f"✅ {day_name} {pair_number} пара - {lesson_data['subject']}")
-
-                    if schedules:
-                        break
-
-            logging.info(f"📊 Итог: {len(schedules)} занятий для {group_name}, неделя {week_number}")
-            return group_name, week_number, schedules
+    def _parse_group_page(self, group_url, status, html):
+        """Разбирает страницу расписания группы: (название, текущая неделя, занятия)"""
+        group_name, weeks = self._parse_group_weeks(group_url, status, html)
+        return self._current_week(group_name, weeks)
 
-        except Exception as e:
-            logging.error(f"❌ Ошибка парсинга: {e}")
-            import traceback
-            logging.error(f"❌ Трассировка: {traceback.format_exc()}")
-            try:
-                group_number_match = re.search(r'/(\d+)\.html', group_url)
-                if group_number_match:
-                    url_group_number = int(group_number_match.group(1))
-
-                    if 'Часть%201' in group_url or 'Часть 1' in group_url:
-                        actual_group_number = url_group_number
-                    elif 'Часть%202' in group_url or 'Часть 2' in group_url:
-                        actual_group_number = url_group_number + 115
-                    elif 'Часть%203' in group_url or 'Часть 3' in group_url:
-                        actual_group_number = url_group_number + 234
-                    elif 'Часть%204' in group_url or 'Часть 4' in group_url:
-                        actual_group_number = url_group_number + 464
-                    elif 'Часть%205' in group_url or 'Часть 5' in group_url:
-                        actual_group_number = url_group_number + 562
-                    else:
-                        actual_group_number = url_group_number
+    def _parse_group_weeks(self, group_url, status, html):
+        """Разбирает все недели на странице группы: (название, {номер недели: занятия})"""
+        return self.page_parser.parse_group_weeks(group_url, status, html)
 
-                    group_name = self.get_group_name(actual_group_number)
-                else:
-                    group_name = "Неизвестная группа"
-            except:
-                group_name = "Неизвестная группа"
-            return group_name, "1", []
+    _current_week = staticmethod(SchedulePageParser.current_week)
 
     def _parse_cell_content(self, cell_text):
         """Парсит содержимое ячейки с занятием — с поддержкой аудиторий 3_2, 3-312, 3-ДОТ"""
-        try:
-            lines = [line.strip() for line in cell_text.split('\n') if line.strip()]
-            if not lines:
-                return None
-
-            first_line = lines[0].lower()
-
-            lesson_type = "Лекция"
-            if 'пр.' in first_line or 'практ' in first_line:
-                lesson_type = "Практика"
-            elif 'лаб.' in first_line or 'лабор' in first_line:
-                lesson_type = "Лабораторная"
-            elif 'сем.' in first_line:
-                lesson_type = "Семинар"
-            elif 'зач.' in first_line:
-                lesson_type = "Зачёт"
-            elif 'экз.' in first_line:
-                lesson_type = "Экзамен"
-
-            subject = lines[0]
-            for abbrev in ['лек.', 'пр.', 'лаб.', 'сем.', 'зач.', 'экз.']:
-                if abbrev in subject.lower():
-                    subject = subject.lower().replace(abbrev, '').strip().capitalize()
-                    break
-
-            teacher = "Не указан"
-            classroom = "Не указана"
-
-            # Поддерживаем все форматы: 3_2, 3-312, 3-ДОТ, ауд. 3_1 и т.д.
-            if len(lines) > 1:
-                teacher_line = lines[1]
-
-                classroom_pattern = (
-                    r'([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)*)\s+'  # Фамилия Имя
-                    r'([А-ЯЁ]\s*[А-ЯЁ])\s+'  # Инициалы
-                    r'((?:\d+[\-_][\dА-ЯA-Zа-яa-z]+)|(?:\d+\s*-\s*ДОТ)|(?:\d+_ДОТ)|(?:\d+\s*ДОТ))$'  # Поддержка 6-НБ8
-                )
-                classroom_match = re.search(classroom_pattern, teacher_line, re.IGNORECASE)
-
-                if classroom_match:
-                    teacher_name = classroom_match.group(1)
-                    initials = classroom_match.group(2)
-                    room_number = classroom_match.group(3).replace(' ', '')
-
-                    teacher = f"{teacher_name} {initials}"
-                    classroom = f"ауд. {room_number.upper()}"
-
-                    logging.info(f"🎯 Найдена аудитория: {teacher} -> {classroom}")
-                else:
-                    # Проверяем просто "ауд. ..." без ФИО
-                    old_classroom_match = re.search(r'ауд\.?\s*([^\s,\n]+)', teacher_line, re.IGNORECASE)
-                    if old_classroom_match:
-                        classroom = f"ауд. {old_classroom_match.group(1)}"
-                        teacher = re.sub(r'ауд\.?\s*[^\s,\n]+', '', teacher_line, flags=re.IGNORECASE).strip()
-                    else:
-                        teacher = teacher_line
-
-            if len(lines) > 2 and classroom == "Не указана":
-                third_line = lines[2]
-                classroom_match = re.search(classroom_pattern, third_line, re.IGNORECASE)
-                if classroom_match:
-                    teacher_name = classroom_match.group(1)
-                    initials = classroom_match.group(2)
-                    room_number = classroom_match.group(3).replace(' ', '')
-                    teacher = f"{teacher_name} {initials}"
-                    classroom = f"ауд. {room_number.upper()}"
-                    logging.info(f"🎯 Найдена аудитория в 3-й строке: {teacher} -> {classroom}")
-                elif 'ауд.' in third_line.lower():
-                    classroom = third_line
-
-            return {
-                'subject': subject if subject else "Не указано",
-                'type': lesson_type,
-                'teacher': teacher if teacher else "Не указан",
-                'classroom': classroom
-            }
-
-        except Exception as e:
-            logging.error(f"❌ Ошибка парсинга ячейки: {e}")
-            return None
+        return cell_parser.parse_group_cell(cell_text)
 
     def get_schedule_image(self, group_url):
         group_name, week_number, schedules = self.parse_group_schedule(group_url)
@@ -405,6 +235,192 @@ class UlstuParser:
         group_url = self.get_group_url(group_number)
         return self.get_schedule_image(group_url)
 
+    async def get_schedule_by_number_async(self, group_number, week=None):
+        """Возвращает (название, неделя, занятия) группы из кэша или с портала.
+        week - номер недели со страницы ("11"), None - текущая"""
+        return await self._get_parsed_async('group', group_number, week)
+
+    async def get_schedule_png_by_number_async(self, group_number, week=None):
+        """Возвращает RenderedSchedule группы из кэша или рисует его заново"""
+        return await self._get_png_async('group', group_number, week)
+
+    def get_cached_weeks(self, kind, number):
+        """Номера недель, разобранных с последней загрузки страницы (первая - текущая)"""
+        weeks = self.cache.weeks.get((kind, number))
+        if weeks is None and kind == 'teacher' and number in self.teacher_index:
+            weeks = tuple(self.teacher_index.get(number)[1])
+        return weeks or ()
+
+    async def _get_parsed_async(self, kind, number, week=None):
+        """Возвращает разобранное расписание группы ('group') или преподавателя ('teacher') на неделю"""
+        key = self.cache.make_key(kind, number, week)
+        parsed = self.cache.parsed.get(key)
+        if parsed is not None:
+            return parsed
+
+        # Одна загрузка страницы дает все недели на ней, одновременные запросы ждут ее вместе
+        pages = await self.in_flight.do(('parsed', kind, number), self._load_parsed_async, kind, number)
+        if week in pages:
+            return pages[week]
+        name, _, _ = pages[None]
+        return name, week, []
+
+    def get_stale_pages(self, kind, number):
+        """Собирает прежний (возможно, устаревший) разбор всех недель страницы или None"""
+        current = self.cache.parsed.get_stale(self.cache.make_key(kind, number))
+        if current is None:
+            return None
+
+        pages = {None: current}
+        for week in self.get_cached_weeks(kind, number):
+            parsed = self.cache.parsed.get_stale(self.cache.make_key(kind, number, week))
+            if parsed is not None:
+                pages[week] = parsed
+        return pages
+
+    async def _load_parsed_async(self, kind, number):
+        """Загружает и разбирает страницу расписания, сохраняя каждую неделю в кэш.
+        Возвращает {неделя: (имя, неделя, занятия)}, под ключом None - текущая неделя"""
+        if kind == 'teacher':
+            # Расписание преподавателя берется из индекса по обходу групп, портал - только если его там нет
+            indexed = self.teacher_index.get(number)
+            if indexed is not None:
+                logging.info(f"👩‍🏫 Расписание преподавателя {number} взято из индекса групп")
+                return self.store_parsed(kind, number, *indexed)
+
+        url = self.get_group_url(number) if kind == 'group' else self.get_teacher_url(number)
+
+        # Если есть прежний разбор (пусть и устаревший), спрашиваем портал, изменилась ли страница
+        previous = self.get_stale_pages(kind, number)
+        page = await self._fetch_page_async(url, conditional=previous is not None)
+
+        if previous is not None and page.status not in (200, 304):
+            # Портал недоступен - отдаем прежний разбор, но не продлеваем его срок жизни
+            logging.warning(f"🕰️ Портал не ответил ({page.status}), для {kind} {number} используется прежнее расписание")
+            return previous
+
+        if previous is not None and not page.changed:
+            logging.info(f"♻️ Страница {kind} {number} не изменилась, разбор и отрисовка не нужны")
+            self.renew_cached(kind, number)
+            return previous
+
+        name, weeks = await self._parse_page_async(kind, url, page)
+        pages = self.store_parsed(kind, number, name, weeks)
+        if not weeks:
+            self.http.forget(url)
+        return pages
+
+    def store_parsed(self, kind, number, name, weeks):
+        """Кладет в кэш каждую неделю страницы и текущую неделю под week=None.
+        Пустой результат обычно означает ошибку загрузки - такое не кэшируем"""
+        pages = {week: (name, week, schedules) for week, schedules in weeks.items()}
+        pages[None] = self._current_week(name, weeks)
+        if not weeks:
+            return pages
+
+        # Недели прошлой загрузки, которых больше нет на странице, убираем
+        for week in set(self.get_cached_weeks(kind, number)) - set(weeks):
+            self.cache.parsed.pop(self.cache.make_key(kind, number, week))
+            self.cache.png.pop(self.cache.make_key(kind, number, week))
+
+        for week, parsed in pages.items():
+            self.cache.parsed.set(self.cache.make_key(kind, number, week), parsed)
+        self.cache.weeks[(kind, number)] = tuple(weeks)
+        if kind == 'group':
+            # Новая версия страницы группы сразу обновляет занятость ее аудиторий
+            self.room_index.update_group(number, weeks, pages[None][1])
+        return pages
+
+    def renew_cached(self, kind, number):
+        """Продлевает срок жизни разбора и PNG всех недель неизменившейся страницы"""
+        for week in (None,) + self.get_cached_weeks(kind, number):
+            key = self.cache.make_key(kind, number, week)
+            parsed = self.cache.parsed.get_stale(key)
+            if parsed is not None:
+                self.cache.parsed.set(key, parsed)
+            png = self.cache.png.get_stale(key)
+            if png is not None:
+                self.cache.png.set(key, png)
+
+    async def _get_png_async(self, kind, number, week=None):
+        """Возвращает RenderedSchedule: кэш PNG -> кэш занятий -> кэш HTML -> портал.
+
+        Если портал недоступен или отвечает дольше stale_deadline, сразу отдается прежний PNG
+        с признаком stale, а обновление продолжается в фоне.
+        """
+        key = self.cache.make_key(kind, number, week)
+        png = self.cache.png.get(key)
+        if png is not None:
+            logging.info(f"📦 PNG расписания {kind} {number} взят из кэша")
+            return RenderedSchedule(png, False, self.cache.parsed.stored_at(key))
+
+        stale = self._get_stale_png(key)
+        if stale is not None and self.breaker.is_open:
+            logging.info(f"🕰️ Портал недоступен, PNG {kind} {number} отдан из устаревшего кэша")
+            self._refresh_in_background(kind, number, week)
+            return stale
+
+        render = self.in_flight.do(('png',) + key, self._render_png_async, kind, number, week)
+        if stale is None:
+            return await render
+
+        try:
+            # Загрузка защищена shield в SingleFlight, поэтому по таймауту она не прерывается
+            return await asyncio.wait_for(render, CIRCUIT_BREAKER_SETTINGS['stale_deadline'])
+        except asyncio.TimeoutError:
+            logging.info(f"🕰️ Портал отвечает медленно, PNG {kind} {number} отдан из устаревшего кэша")
+            return stale
+
+    def _get_stale_png(self, key):
+        """Возвращает устаревший PNG из кэша (или None)"""
+        png = self.cache.png.get_stale(key)
+        if png is None:
+            return None
+        return RenderedSchedule(png, True, self.cache.parsed.stored_at(key))
+
+    def _refresh_in_background(self, kind, number, week=None):
+        """Запускает фоновое обновление расписания после того, как автомат пропустит пробный запрос"""
+        key = self.cache.make_key(kind, number, week)
+        task = self._refresh_tasks.get(key)
+        if task is not None and not task.done():
+            return
+
+        async def refresh():
+            try:
+                await asyncio.sleep(self.breaker.retry_after())
+                await self.in_flight.do(('png',) + key, self._render_png_async, kind, number, week)
+            except Exception as e:
+                logging.warning(f"⚠️ Фоновое обновление {kind} {number} не удалось: {e}")
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.create_task(refresh())
+
+    async def _render_png_async(self, kind, number, week=None):
+        """Рисует PNG расписания в пуле воркеров и сохраняет его в кэш"""
+        key = self.cache.make_key(kind, number, week)
+        name, week_number, schedules = await self._get_parsed_async(kind, number, week)
+
+        fresh = self.cache.parsed.peek(key) is not None
+        if fresh:
+            # Страница могла оказаться неизменной - тогда прежний PNG уже продлен
+            png = self.cache.png.peek(key)
+            if png is not None:
+                return RenderedSchedule(png, False, self.cache.parsed.stored_at(key))
+        elif schedules:
+            # Обновить не удалось, получено прежнее расписание
+            stale = self._get_stale_png(key)
+            if stale is not None:
+                return stale
+
+        render = workers.render_group_schedule if kind == 'group' else workers.render_teacher_schedule
+        png = await self.worker_pool.run(f"render_{kind}", render, name, week_number, schedules)
+
+        if fresh:
+            self.cache.png.set(key, png)
+        return RenderedSchedule(png, not fresh and bool(schedules),
+                                self.cache.parsed.stored_at(key) if schedules else None)
+
     def get_schedule_image_by_name(self, group_name):
         group_number = self.find_group_number(group_name)
         if group_number:
@@ -441,169 +457,24 @@ class UlstuParser:
 
         return None
 
+    async def parse_teacher_schedule_async(self, teacher_url):
+        """Асинхронно загружает и парсит расписание преподавателя"""
+        page = await self._fetch_page_async(teacher_url)
+        return self._current_week(*await self._parse_page_async('teacher', teacher_url, page))
+
     def parse_teacher_schedule(self, teacher_url):
-        """Парсит расписание преподавателя"""
-        try:
-            logging.info(f"🔍 Загружаю расписание преподавателя: {teacher_url}")
-            response = self.session.get(teacher_url)
-            response.encoding = 'cp1251'
-
-            if response.status_code != 200:
-                logging.warning(f"⚠️ Не удалось загрузить страницу преподавателя: {response.status_code}")
-                return "Неизвестный преподаватель", "1", []
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Ищем имя преподавателя - более прямой подход
-            teacher_name = "Неизвестный преподаватель"
-
-            # Ищем все элементы с розовым цветом (#ff00ff)
-            pink_elements = soup.find_all('font', {'color': '#ff00ff'})
-
-            for element in pink_elements:
-                text = element.get_text(strip=True)
-                logging.info(f"🔍 Анализируем розовый текст: {text}")
-
-                # Пропускаем пустые тексты
-                if not text:
-                    continue
-
-                # Ищем текст, который содержит имя (должен быть перед "Неделя:")
-                if 'Неделя:' in text:
-                    # Разделяем текст по "Неделя:" и берем первую часть
-                    name_part = text.split('Неделя:')[0].strip()
-                    if name_part and len(name_part) > 1:  # Проверяем, что это не пустая строка
-                        teacher_name = name_part
-                        logging.info(f"✅ Найдено имя преподавателя: {teacher_name}")
-                        break
-
-            # Если не нашли через розовый текст, пробуем альтернативные методы
-            if teacher_name == "Неизвестный преподаватель":
-                # Ищем в заголовках
-                headers = soup.find_all(['h1', 'h2', 'h3', 'font'])
-                for header in headers:
-                    text = header.get_text(strip=True)
-                    if 'расписание' in text.lower() and 'преподавателя' in text.lower():
-                        # Пытаемся извлечь имя после "преподавателя"
-                        match = re.search(r'преподавателя\s+(.+)', text, re.IGNORECASE)
-                        if match:
-                            teacher_name = match.group(1).strip()
-                            logging.info(f"✅ Найдено имя преподавателя из заголовка: {teacher_name}")
-                            break
-
-            week_number = "1"
-
-            # Поиск номера недели
-            week_elements = soup.find_all('font', {'color': '#ff00ff', 'face': 'Times New Roman', 'size': '6'})
-            for element in week_elements:
-                text = element.get_text(strip=True)
-                if 'Неделя:' in text:
-                    week_match = re.search(r'Неделя:\s*(\d+)-я', text)
-                    if week_match:
-                        week_number = week_match.group(1)
-                        logging.info(f"📅 Найдена неделя преподавателя: {week_number}")
-                    break
-
-            # Если не нашли неделю в специфичных элементах, ищем в любых розовых
-            if week_number == "1":
-                for element in pink_elements:
-                    text = element.get_text(strip=True)
-                    if 'Неделя:' in text:
-                        week_match = re.search(r'Неделя:\s*(\d+)-я', text)
-                        if week_match:
-                            week_number = week_match.group(1)
-                            logging.info(f"📅 Найдена неделя в розовом тексте: {week_number}")
-                            break
-
-            # Остальной код парсинга таблиц остается без изменений...
-            # Поиск таблиц расписания
-            tables = soup.find_all("table", {"border": "1"})
-            if not tables:
-                tables = soup.find_all("table", {"class": re.compile(r'table|schedule', re.I)})
-            if not tables:
-                tables = soup.find_all("table")
-
-            if not tables:
-                schedule_tables = []
-                all_tables = soup.find_all("table")
-                for table in all_tables:
-                    table_text = table.get_text().lower()
-                    if any(word in table_text for word in
-                           ['пн', 'вт', 'ср', 'чт', 'пт', 'сб', 'пара', 'понедельник', 'вторник']):
-                        schedule_tables.append(table)
-                tables = schedule_tables
-
-            logging.info(f"🔍 Найдено таблиц преподавателя: {len(tables)}")
-
-            schedules = []
-            day_names = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб"]
-
-            if tables:
-                for table_idx, table in enumerate(tables):
-                    logging.info(f"🔍 Анализирую таблицу преподавателя {table_idx + 1}")
-                    rows = table.find_all("tr")
-                    logging.info(f"🔍 Найдено строк в таблице преподавателя: {len(rows)}")
-
-                    # Проходим по строкам (дням недели)
-                    for row_idx in range(2, min(len(rows), 8)):
-                        row = rows[row_idx]
-                        cells = row.find_all(["td", "th"])
-
-                        if len(cells) < 2:
-                            continue
-
-                        day_name = day_names[row_idx - 2]
-
-                        # Проходим по ячейкам (парам)
-                        for cell_idx in range(1, min(len(cells), 9)):  # пары 1-8
-                            cell = cells[cell_idx]
-                            pair_number = cell_idx
-                            cell_text = cell.get_text(separator='\n', strip=True)
-
-                            if cell_text and cell_text not in ['', '-', ' ']:
-                                lesson_data = self._parse_teacher_cell_content(cell_text)
-                                if lesson_data:
-                                    schedule_item = {
-                                        'week': int(week_number),
-                                        'day': day_name,
-                                        'pair': pair_number,
-                                        'subject': lesson_data['subject'],
-                                        'type': lesson_data['type'],
-                                        'group': lesson_data['group'],
-                                        'classroom': lesson_data['classroom']
-                                    }
-                                    schedules.append(schedule_item)
-
-                    if schedules:
-                        break
-
-            # --- ДОБАВЛЯЕМ ПУСТЫЕ КЛЕТКИ ---
-            full_schedule = []
-            existing = {(s["day"], s["pair"]): s for s in schedules}
-
-            for d in day_names:
-                for p in range(1, 9):
-                    if (d, p) in existing:
-                        full_schedule.append(existing[(d, p)])
-                    else:
-                        full_schedule.append({
-                            'week': int(week_number),
-                            'day': d,
-                            'pair': p,
-                            'subject': "",
-                            'type': "",
-                            'group': "",
-                            'classroom': ""
-                        })
-
-            logging.info(f"📊 Итог преподавателя {teacher_name}: {len(full_schedule)} ячеек, неделя {week_number}")
-            return teacher_name, week_number, full_schedule
+        """Парсит расписание преподавателя (синхронная обёртка)"""
+        page = self._fetch_page(teacher_url)
+        return self._parse_teacher_page(page.status, page.content)
 
-        except Exception as e:
-            logging.error(f"❌ Ошибка парсинга расписания преподавателя: {e}")
-            import traceback
-            logging.error(f"❌ Трассировка преподавателя: {traceback.format_exc()}")
-            return "Неизвестный преподаватель", "1", []
+    def _parse_teacher_page(self, status, html):
+        """Разбирает страницу расписания преподавателя: (имя, текущая неделя, занятия)"""
+        teacher_name, weeks = self._parse_teacher_weeks(status, html)
+        return self._current_week(teacher_name, weeks)
+
+    def _parse_teacher_weeks(self, status, html):
+        """Разбирает все недели на странице преподавателя: (имя, {номер недели: занятия})"""
+        return self.page_parser.parse_teacher_weeks(status, html)
 
     def _parse_teacher_cell_content(self, text):
         """
@@ -614,161 +485,17 @@ class UlstuParser:
         - group (номер группы) - ЗЕЛЕНАЯ ячейка
         - classroom (аудитория) - ЖЕЛТАЯ ячейка
         """
-
-        try:
-            if not text or not isinstance(text, str):
-                return {
-                    "subject": "",
-                    "type": "",
-                    "group": "",
-                    "classroom": ""
-                }
-
-            # Разбиваем на строки
-            lines = [l.strip() for l in text.split("\n") if isinstance(l, str) and l.strip()]
-            if not lines:
-                return {
-                    "subject": "",
-                    "type": "",
-                    "group": "",
-                    "classroom": ""
-                }
-
-            # ---------- Извлекаем ГРУППУ (ЗЕЛЕНАЯ ячейка) ----------
-            group = ""
-            # Ищем группу в первой строке (обычно там группа)
-            if lines:
-                # Паттерн для групп: буквы-цифры-буквы (например: АТТПбд-21, АИСТбд-11 и т.д.)
-                group_pattern = r'[А-ЯA-Z]{2,}[\w\-]+\d+[\w\-]*'
-                group_match = re.search(group_pattern, lines[0])
-                if group_match:
-                    group = group_match.group(0)
-                else:
-                    # Ищем в других строках
-                    for line in lines:
-                        group_match = re.search(group_pattern, line)
-                        if group_match:
-                            group = group_match.group(0)
-                            break
-
-            # ---------- Извлекаем ТИП и ПРЕДМЕТ (КРАСНАЯ и БЕЛАЯ ячейки) ----------
-            lesson_type = ""
-            subject = ""
-
-            # Словарь для определения типа занятия
-            type_map = {
-                "лек.": "Лекция",
-                "лекция": "Лекция",
-                "лк.": "Лекция",
-                "лаб.": "Лабораторная",
-                "лабораторная": "Лабораторная",
-                "пр.": "Практика",
-                "практика": "Практика",
-                "сем.": "Практика",
-            }
-
-            # Ищем тип и предмет в тексте
-            for line in lines:
-                line_lower = line.lower()
-
-                # Ищем тип занятия
-                for key, val in type_map.items():
-                    if key in line_lower:
-                        lesson_type = val
-                        # Извлекаем предмет - убираем тип из строки
-                        subject = line_lower.replace(key, '').strip(' .,-')
-                        # Делаем первую букву заглавной
-                        if subject:
-                            subject = subject[0].upper() + subject[1:]
-                        break
-                if lesson_type:
-                    break
-
-            # Если не нашли тип, но есть текст - считаем его предметом
-            if not subject and lines:
-                # Берем первую строку, но исключаем группу из нее
-                first_line = lines[0]
-                if group and group in first_line:
-                    subject = first_line.replace(group, '').strip(' ,')
-                else:
-                    subject = first_line
-
-            # ---------- Извлекаем АУДИТОРИЮ (ЖЕЛТАЯ ячейка) ----------
-            classroom = ""
-            for line in lines:
-                # Ищем аудитории: 8-417, 3-312, 8-310 и т.д.
-                classroom_match = re.search(r'(\d+[\-_]\d+)', line)
-                if classroom_match:
-                    classroom = f"ауд. {classroom_match.group(0)}"
-                    break
-
-            return {
-                "subject": subject or "",  # БЕЛАЯ - название предмета
-                "type": lesson_type or "",  # КРАСНАЯ - тип занятия
-                "group": group or "",  # ЗЕЛЕНАЯ - номер группы
-                "classroom": classroom or ""  # ЖЕЛТАЯ - аудитория
-            }
-
-        except Exception as e:
-            logging.error(f"❌ Ошибка парсинга ячейки преподавателя: {e}")
-            return {
-                "subject": "",
-                "type": "",
-                "group": "",
-                "classroom": ""
-            }
+        if not text or not isinstance(text, str):
+            return {"subject": "", "type": "", "group": "", "classroom": ""}
+        return cell_parser.parse_teacher_cell(text)
 
     def _looks_like_classroom(self, text):
         """Проверяет, похож ли текст на описание аудитории"""
-        classroom_indicators = [
-            'ауд.', 'аудитория', 'ком.', 'комната',
-            'корп.', 'корпус', 'здание', 'каб.', 'кабинет'
-        ]
-
-        text_lower = text.lower()
-
-        # Если содержит указатели аудитории
-        if any(indicator in text_lower for indicator in classroom_indicators):
-            return True
-
-        # Если соответствует паттерну номера аудитории
-        classroom_patterns = [
-            r'\d+[\-_]\d+',
-            r'\d+[-–][А-ЯA-Z]',
-            r'\d+[А-ЯA-Z]',
-            r'\d+\s*-\s*ДОТ',
-            r'\d+_ДОТ'
-        ]
-
-        for pattern in classroom_patterns:
-            if re.search(pattern, text):
-                return True
-
-        return False
+        return cell_parser.looks_like_classroom(text)
 
     def _find_classroom_in_text(self, text):
         """Ищет и нормализует аудиторию в тексте"""
-        try:
-            patterns = [
-                r'ауд\.?\s*([A-Za-zА-Яа-я0-9\-_]+)',  # ауд. 312
-                r'каб\.?\s*([A-Za-zА-Яа-я0-9\-_]+)',  # каб. 312
-                r'(\d+[\-_][A-Za-zА-Яа-я0-9]+)',  # 3-312, 6-НБ8, 3_2
-                r'(\d+\s*-\s*ДОТ)',  # 3-ДОТ
-                r'(\d+_ДОТ)',  # 3_ДОТ
-                r'(\d+\s*ДОТ)',  # 3 ДОТ
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    room = match.group(1).replace(" ", "")
-                    return f"ауд. {room.upper()}"
-
-            return None
-
-        except Exception as e:
-            logging.error(f"❌ Ошибка поиска аудитории: {e}")
-            return None
+        return cell_parser.find_classroom(text)
 
     def get_teacher_schedule_image(self, teacher_url):
         """Получает изображение расписания преподавателя"""
@@ -780,6 +507,14 @@ class UlstuParser:
         teacher_url = self.get_teacher_url(teacher_number)
         return self.get_teacher_schedule_image(teacher_url)
 
+    async def get_teacher_schedule_by_number_async(self, teacher_number, week=None):
+        """Возвращает (имя, неделя, занятия) преподавателя из кэша или с портала"""
+        return await self._get_parsed_async('teacher', teacher_number, week)
+
+    async def get_teacher_schedule_png_by_number_async(self, teacher_number, week=None):
+        """Возвращает RenderedSchedule преподавателя из кэша или рисует его заново"""
+        return await self._get_png_async('teacher', teacher_number, week)
+
     def get_teacher_schedule_image_by_name(self, teacher_name):
         """Получает изображение расписания преподавателя по имени"""
         teacher_number = self.find_teacher_number(teacher_name)
@@ -787,3 +522,11 @@ class UlstuParser:
             return self.get_teacher_schedule_image_by_number(teacher_number)
         else:
             raise ValueError(f"Преподаватель с фамилией '{teacher_name}' не найден")
+
+    async def close(self):
+        """Закрывает HTTP-соединения парсера"""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        await self.http.close()
+        self.session.close()
+        self.worker_pool.shutdown()
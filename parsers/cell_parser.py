@@ -0,0 +1,228 @@
+"""Разбор текста ячеек расписания.
+
+При обходе всех групп одни и те же ячейки (тот же предмет, преподаватель и аудитория)
+встречаются у многих групп и подгрупп, поэтому результат разбора запоминается
+в ограниченном LRU-кэше по исходному тексту ячейки. Кэш свой в каждом процессе.
+Возвращаемые словари общие для всех попаданий - их нельзя изменять.
+"""
+import logging
+import re
+from functools import lru_cache
+
+from config.config import PARSER_SETTINGS
+
+CELL_CACHE_SIZE = PARSER_SETTINGS['cell_cache_size']
+
+# Ячейка группы: "Фамилия И О 3-312" (поддерживаются аудитории 3_2, 3-312, 3-ДОТ, 6-НБ8)
+TEACHER_CLASSROOM_RE = re.compile(
+    r'([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)*)\s+'  # Фамилия Имя
+    r'([А-ЯЁ]\s*[А-ЯЁ])\s+'  # Инициалы
+    r'((?:\d+[\-_][\dА-ЯA-Zа-яa-z]+)|(?:\d+\s*-\s*ДОТ)|(?:\d+_ДОТ)|(?:\d+\s*ДОТ))$',  # Аудитория
+    re.IGNORECASE
+)
+AUDITORIUM_RE = re.compile(r'ауд\.?\s*([^\s,\n]+)', re.IGNORECASE)
+
+GROUP_LESSON_TYPES = (
+    (('пр.', 'практ'), "Практика"),
+    (('лаб.', 'лабор'), "Лабораторная"),
+    (('сем.',), "Семинар"),
+    (('зач.',), "Зачёт"),
+    (('экз.',), "Экзамен"),
+)
+GROUP_TYPE_ABBREVIATIONS = ('лек.', 'пр.', 'лаб.', 'сем.', 'зач.', 'экз.')
+
+# Ячейка преподавателя размечается одним вызовом regex на всю ячейку.
+# Метки - независимые опережающие проверки, поэтому совпадения не "съедают" друг друга:
+# group - группа (АТТПбд-21), room - аудитория (8-417), type - обозначение типа занятия.
+# Шаблоны group и room не пересекают перевод строки, поэтому самое левое совпадение
+# лежит в первой подходящей строке, как и при построчном поиске
+TEACHER_CELL_RE = re.compile(
+    r'(?=.*?(?P<group>[А-ЯA-Z]{2,}[\w\-]+\d+[\w\-]*))?'
+    r'(?=.*?(?P<room>\d+[\-_]\d+))?'
+    r'(?=.*?(?P<type>(?i:лекция|лек\.|лк\.|лабораторная|лаб\.|практика|пр\.|сем\.)))?',
+    re.DOTALL
+)
+
+TEACHER_LESSON_TYPES = {
+    "лек.": "Лекция",
+    "лекция": "Лекция",
+    "лк.": "Лекция",
+    "лаб.": "Лабораторная",
+    "лабораторная": "Лабораторная",
+    "пр.": "Практика",
+    "практика": "Практика",
+    "сем.": "Практика",
+}
+
+# Признаки аудитории: слова-указатели (без учета регистра) или номер вида 3-312, 3-А, 3А, 3-ДОТ
+CLASSROOM_HINT_RE = re.compile(
+    r'(?i:ауд\.|аудитория|ком\.|комната|корп\.|корпус|здание|каб\.|кабинет)'
+    r'|\d+[\-_]\d+|\d+[-–][А-ЯA-Z]|\d+[А-ЯA-Z]|\d+\s*-\s*ДОТ|\d+_ДОТ'
+)
+
+# Аудитория в тексте: варианты перечислены по приоритету, первый подошедший где угодно в тексте выигрывает
+CLASSROOM_RE = re.compile(
+    r'(?:(?=.*?ауд\.?\s*([A-Za-zА-Яа-я0-9\-_]+))'  # ауд. 312
+    r'|(?=.*?каб\.?\s*([A-Za-zА-Яа-я0-9\-_]+))'  # каб. 312
+    r'|(?=.*?(\d+[\-_][A-Za-zА-Яа-я0-9]+))'  # 3-312, 6-НБ8, 3_2
+    r'|(?=.*?(\d+\s*-\s*ДОТ))'  # 3-ДОТ
+    r'|(?=.*?(\d+_ДОТ))'  # 3_ДОТ
+    r'|(?=.*?(\d+\s*ДОТ)))',  # 3 ДОТ
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _split_lines(text):
+    return [line.strip() for line in text.split('\n') if line.strip()]
+
+
+def _empty_teacher_cell():
+    return {"subject": "", "type": "", "group": "", "classroom": ""}
+
+
+@lru_cache(maxsize=CELL_CACHE_SIZE)
+def parse_group_cell(cell_text):
+    """Разбирает ячейку расписания группы: предмет, тип, преподаватель, аудитория (или None)"""
+    try:
+        lines = _split_lines(cell_text)
+        if not lines:
+            return None
+
+        first_line = lines[0].lower()
+
+        lesson_type = "Лекция"
+        for markers, type_name in GROUP_LESSON_TYPES:
+            if any(marker in first_line for marker in markers):
+                lesson_type = type_name
+                break
+
+        subject = lines[0]
+        for abbrev in GROUP_TYPE_ABBREVIATIONS:
+            if abbrev in first_line:
+                subject = first_line.replace(abbrev, '').strip().capitalize()
+                break
+
+        teacher = "Не указан"
+        classroom = "Не указана"
+
+        if len(lines) > 1:
+            teacher_line = lines[1]
+            classroom_match = TEACHER_CLASSROOM_RE.search(teacher_line)
+
+            if classroom_match:
+                teacher = f"{classroom_match.group(1)} {classroom_match.group(2)}"
+                classroom = f"ауд. {classroom_match.group(3).replace(' ', '').upper()}"
+                logging.info(f"🎯 Найдена аудитория: {teacher} -> {classroom}")
+            else:
+                # Проверяем просто "ауд. ..." без ФИО
+                auditorium_match = AUDITORIUM_RE.search(teacher_line)
+                if auditorium_match:
+                    classroom = f"ауд. {auditorium_match.group(1)}"
+                    teacher = AUDITORIUM_RE.sub('', teacher_line).strip()
+                else:
+                    teacher = teacher_line
+
+        if len(lines) > 2 and classroom == "Не указана":
+            third_line = lines[2]
+            classroom_match = TEACHER_CLASSROOM_RE.search(third_line)
+            if classroom_match:
+                teacher = f"{classroom_match.group(1)} {classroom_match.group(2)}"
+                classroom = f"ауд. {classroom_match.group(3).replace(' ', '').upper()}"
+                logging.info(f"🎯 Найдена аудитория в 3-й строке: {teacher} -> {classroom}")
+            elif 'ауд.' in third_line.lower():
+                classroom = third_line
+
+        return {
+            'subject': subject if subject else "Не указано",
+            'type': lesson_type,
+            'teacher': teacher if teacher else "Не указан",
+            'classroom': classroom
+        }
+
+    except Exception as e:
+        logging.error(f"❌ Ошибка парсинга ячейки: {e}")
+        return None
+
+
+@lru_cache(maxsize=CELL_CACHE_SIZE)
+def parse_teacher_cell(text):
+    """Разбирает ячейку расписания преподавателя: предмет, тип, группа, аудитория"""
+    try:
+        labels = TEACHER_CELL_RE.match(text)
+        group = labels.group('group') or ""
+        room = labels.group('room')
+
+        lesson_type = ""
+        subject = ""
+        if labels.group('type'):
+            # Строка, в которой впервые встретилось обозначение типа
+            type_start = labels.start('type')
+            line_start = text.rfind('\n', 0, type_start) + 1
+            line_end = text.find('\n', type_start)
+            line_lower = text[line_start:line_end if line_end != -1 else len(text)].strip().lower()
+            # В строке может быть несколько обозначений - приоритет по порядку словаря
+            type_key = next(key for key in TEACHER_LESSON_TYPES if key in line_lower)
+            lesson_type = TEACHER_LESSON_TYPES[type_key]
+            # Предмет - строка без обозначения типа, с заглавной буквы
+            subject = line_lower.replace(type_key, '').strip(' .,-')
+            if subject:
+                subject = subject[0].upper() + subject[1:]
+
+        # Если не нашли тип, считаем предметом первую строку без группы
+        if not subject:
+            lines = _split_lines(text)
+            if not lines:
+                return _empty_teacher_cell()
+            first_line = lines[0]
+            if group and group in first_line:
+                subject = first_line.replace(group, '').strip(' ,')
+            else:
+                subject = first_line
+
+        classroom = f"ауд. {room}" if room else ""
+
+        return {
+            "subject": subject,
+            "type": lesson_type,
+            "group": group,
+            "classroom": classroom
+        }
+
+    except Exception as e:
+        logging.error(f"❌ Ошибка парсинга ячейки преподавателя: {e}")
+        return _empty_teacher_cell()
+
+
+def looks_like_classroom(text):
+    """Проверяет, похож ли текст на описание аудитории"""
+    return CLASSROOM_HINT_RE.search(text) is not None
+
+
+def find_classroom(text):
+    """Ищет и нормализует аудиторию в тексте ("ауд. 3-312") или возвращает None"""
+    match = CLASSROOM_RE.match(text)
+    if match is None or match.lastindex is None:
+        return None
+    return f"ауд. {match.group(match.lastindex).replace(' ', '').upper()}"
+
+
+def cell_cache_stats():
+    """Возвращает счетчики LRU-кэша ячеек в текущем процессе"""
+    stats = {}
+    for name, func in (('group', parse_group_cell), ('teacher', parse_teacher_cell)):
+        info = func.cache_info()
+        total = info.hits + info.misses
+        stats[name] = {
+            'size': info.currsize,
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / total if total else 0.0
+        }
+    return stats
+
+
+def log_cell_cache_stats():
+    """Пишет статистику кэша ячеек в лог"""
+    for name, cell_stats in cell_cache_stats().items():
+        logging.info(f"🧩 Кэш ячеек {name}: {cell_stats['size']} записей, попаданий {cell_stats['hits']}, "
+                     f"промахов {cell_stats['misses']} ({cell_stats['hit_rate']:.0%})")
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+from config.config import CRAWLER_SETTINGS, MIN_GROUP_NUMBER, MAX_GROUP_NUMBER
+from parsers import workers
+from parsers.cell_parser import log_cell_cache_stats
+from utils.rate_limiter import TokenBucket
+from utils.circuit_breaker import CircuitOpenError
+
+
+class ScheduleCrawler:
+    """Асинхронный обход расписаний всех групп с ограничением частоты и повторами"""
+
+    def __init__(self, parser, settings=None):
+        self.parser = parser
+        self.settings = dict(CRAWLER_SETTINGS, **(settings or {}))
+
+    async def crawl_groups(self, group_numbers=None):
+        """Загружает расписания групп и возвращает {номер: {'name', 'week', 'weeks', 'schedule', 'url'}}"""
+        if group_numbers is None:
+            group_numbers = range(MIN_GROUP_NUMBER, MAX_GROUP_NUMBER + 1)
+        group_numbers = list(group_numbers)
+
+        bucket = TokenBucket(self.settings['rate'], self.settings['burst'])
+        semaphore = asyncio.Semaphore(self.settings['concurrency'])
+        progress = self._init_progress(group_numbers)
+        all_groups_data = {}
+        started = time.perf_counter()
+
+        async def crawl_one(group_number):
+            # Ошибка одной группы (разбор, кэш) стоит только этой группы, а не всего обхода
+            try:
+                async with semaphore:
+                    data = await self._crawl_group(group_number, bucket)
+            except Exception as e:
+                logging.error(f"❌ Группа {group_number}: ошибка обхода: {e!r}")
+                data = None
+            if data:
+                all_groups_data[group_number] = data
+            self._report_progress(progress, group_number, bool(data))
+
+        await asyncio.gather(*(crawl_one(number) for number in group_numbers))
+
+        logging.info(f"🏁 Обход завершен за {time.perf_counter() - started:.1f} с: "
+                     f"{len(all_groups_data)} из {len(group_numbers)} групп с расписанием")
+        log_cell_cache_stats()
+        return all_groups_data
+
+    async def _crawl_group(self, group_number, bucket):
+        """Загружает и разбирает расписание одной группы с повторами при ошибках"""
+        group_url = self.parser.get_group_url(group_number)
+        group_name = self.parser.get_group_name(group_number)
+
+        previous = self.parser.get_stale_pages('group', group_number)
+
+        page = await self._fetch_with_retry(group_url, bucket, conditional=previous is not None)
+        if page is None:
+            logging.warning(f"⚠️ Группа {group_number} ({group_name}): страница не загружена")
+            return None
+
+        if previous is not None and not page.changed:
+            # Страница не изменилась с прошлого обхода - разбирать заново не нужно
+            pages = previous
+            self.parser.renew_cached('group', group_number)
+        else:
+            self.parser.cache.html.set(group_url, page.content)
+            name, weeks = await self.parser.worker_pool.run("parse_group", workers.parse_group_weeks,
+                                                            group_url, 200, page.content)
+            # Обе недели со страницы сразу попадают в кэш - отдельная загрузка следующей недели не нужна
+            pages = self.parser.store_parsed('group', group_number, name, weeks)
+        _, week_number, schedules = pages[None]
+
+        if not schedules:
+            logging.warning(f"⚠️ Группа {group_number} ({group_name}): расписание не найдено")
+            self.parser.http.forget(group_url)
+            return None
+
+        return {
+            'name': group_name,
+            'week': week_number,
+            'weeks': {week: parsed[2] for week, parsed in pages.items() if week is not None},
+            'schedule': schedules,
+            'url': group_url
+        }
+
+    async def _fetch_with_retry(self, url, bucket, conditional=False):
+        """Загружает страницу (PageResponse), повторяя запрос с экспоненциальной задержкой и разбросом"""
+        retries = self.settings['retries']
+
+        for attempt in range(retries + 1):
+            await bucket.acquire()
+            try:
+                page = await self.parser.fetch_portal(url, conditional=conditional)
+                if page.status in (200, 304):
+                    return page
+                if page.status != 429 and page.status < 500:
+                    logging.warning(f"⚠️ Страница {url} вернула {page.status}, повтор не нужен")
+                    return None
+                reason = f"статус {page.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError) as e:
+                reason = repr(e)
+
+            if attempt < retries:
+                delay = min(self.settings['backoff_max'], self.settings['backoff_base'] * 2 ** attempt)
+                delay = random.uniform(0, delay)  # "Полный разброс", чтобы повторы не шли волной
+                # Пока автомат разомкнут, ждем пробного окна, а не бьемся в него
+                delay = max(delay, self.parser.breaker.retry_after())
+                logging.info(f"🔁 {url}: {reason}, повтор {attempt + 1}/{retries} через {delay:.1f} с")
+                await asyncio.sleep(delay)
+
+        logging.error(f"❌ Не удалось загрузить {url} после {retries + 1} попыток")
+        return None
+
+    def _init_progress(self, group_numbers):
+        """Готовит счетчики прогресса по частям расписания"""
+        progress = {}
+        for group_number in group_numbers:
+            part_id, _ = self.parser.get_schedule_part_for_group(group_number)
+            part = progress.setdefault(part_id, {'total': 0, 'done': 0, 'found': 0})
+            part['total'] += 1
+        return progress
+
+    def _report_progress(self, progress, group_number, found):
+        """Логирует прогресс части расписания каждые 25% и по завершении"""
+        part_id, part_data = self.parser.get_schedule_part_for_group(group_number)
+        part = progress[part_id]
+        part['done'] += 1
+        part['found'] += int(found)
+
+        step = max(1, part['total'] // 4)
+        if part['done'] % step == 0 or part['done'] == part['total']:
+            logging.info(f"📊 {part_data['name']}: {part['done']}/{part['total']} "
+                         f"(с расписанием: {part['found']})")
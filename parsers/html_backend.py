@@ -0,0 +1,277 @@
+import logging
+import re
+from typing import NamedTuple, List, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+HEADER_COLOR = '#ff00ff'
+WEEK_MARKER = 'Неделя:'
+TABLE_CLASS_RE = re.compile(r'table|schedule', re.I)
+
+
+class PageContent(NamedTuple):
+    """Всё, что парсеру нужно от страницы расписания"""
+    headers: List[str]  # Тексты <font color="#ff00ff"> по порядку: имя группы/преподавателя и неделя
+    captions: List[str]  # Заголовки со словом "преподавателя" (запасной источник имени)
+    week_text: Optional[str]  # Первый текст с "Неделя:", если его нет в headers
+    tables: List[List[List[str]]]  # Таблицы расписания: строки -> тексты ячеек (строки ячейки через \n)
+
+
+def _join_strings(strings, separator):
+    """Склеивает непустые текстовые узлы как BeautifulSoup.get_text(separator, strip=True)"""
+    return separator.join(s for s in (s.strip() for s in strings) if s)
+
+
+def _is_caption(text):
+    lowered = text.lower()
+    return 'расписание' in lowered and 'преподавателя' in lowered
+
+
+class BeautifulSoupBackend:
+    """Чистый Python (html.parser) - медленный, но всегда доступный вариант"""
+
+    name = 'bs4'
+
+    def extract(self, raw, encoding):
+        soup = BeautifulSoup(raw, 'html.parser', from_encoding=encoding)
+
+        headers = [font.get_text(strip=True) for font in soup.find_all('font', {'color': HEADER_COLOR})]
+        captions = []
+        week_text = None
+        if not any(WEEK_MARKER in header for header in headers):
+            captions = [text for text in (tag.get_text(strip=True) for tag in soup.find_all(['h1', 'h2', 'h3', 'font']))
+                        if _is_caption(text)]
+            week_text = soup.find(string=re.compile(WEEK_MARKER))
+
+        tables = soup.find_all('table', {'border': '1'})
+        if not tables:
+            tables = soup.find_all('table', {'class': TABLE_CLASS_RE})
+        if not tables:
+            tables = soup.find_all('table')
+
+        return PageContent(headers, captions, str(week_text) if week_text else None, [
+            [[cell.get_text(separator='\n', strip=True) for cell in row.find_all(['td', 'th'])]
+             for row in table.find_all('tr')]
+            for table in tables
+        ])
+
+
+class LxmlBackend:
+    """libxml2 через lxml: разбирает байты страницы сразу в нужной кодировке"""
+
+    name = 'lxml'
+
+    def extract(self, raw, encoding):
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        root = lxml.html.document_fromstring(raw, parser=parser)
+
+        headers = [_join_strings(font.itertext(), '') for font in root.iter('font') if font.get('color') == HEADER_COLOR]
+        captions = []
+        week_text = None
+        if not any(WEEK_MARKER in header for header in headers):
+            captions = [text for text in (_join_strings(tag.itertext(), '') for tag in root.iter('h1', 'h2', 'h3', 'font'))
+                        if _is_caption(text)]
+            found = root.xpath('//text()[contains(., $marker)]', marker=WEEK_MARKER)
+            week_text = str(found[0]) if found else None
+
+        all_tables = list(root.iter('table'))
+        tables = [table for table in all_tables if table.get('border') == '1']
+        if not tables:
+            tables = [table for table in all_tables if TABLE_CLASS_RE.search(table.get('class') or '')]
+        if not tables:
+            tables = all_tables
+
+        return PageContent(headers, captions, week_text, [
+            [[_join_strings(cell.itertext(), '\n') for cell in row.iter('td', 'th')]
+             for row in table.iter('tr')]
+            for table in tables
+        ])
+
+
+class _TimetableTarget:
+    """Приемник событий парсера lxml: за один проход собирает заголовки и ячейки таблиц, не строя дерево"""
+
+    def __init__(self):
+        self.headers = []
+        self.captions = []
+        self.week_text = None
+        self.tables = []  # (border, class, строки) всех таблиц, включая вложенные, в порядке документа
+        self._stack = []  # (тег, цвет, буфер текста, строка) для каждого открытого элемента, None - текст не нужен
+        self._active = []  # Открытые буферы, в которые идет текст
+        self._parts = []  # Куски текущего текстового узла
+        self._open_tables = []  # Строки открытых таблиц, последняя - самая вложенная
+
+    def _flush(self):
+        """Завершает текущий текстовый узел и раздает его открытым буферам"""
+        if not self._parts:
+            return
+        text = ''.join(self._parts)
+        self._parts = []
+        if self.week_text is None and WEEK_MARKER in text:
+            self.week_text = text
+        text = text.strip()
+        if text:
+            for buffer in self._active:
+                buffer.append(text)
+
+    def _push(self, entry):
+        self._stack.append(entry)
+        if entry is not None:
+            self._active.append(entry[2])
+
+    def start(self, tag, attrib):
+        self._flush()
+        entry = None
+
+        if tag == 'table':
+            rows = []
+            self._open_tables.append(rows)
+            self.tables.append((attrib.get('border'), attrib.get('class'), rows))
+        elif tag == 'tr' and self._open_tables:
+            # Строка принадлежит только своей (самой вложенной) таблице
+            self._open_tables[-1].append([])
+        elif tag in ('td', 'th') and self._open_tables and self._open_tables[-1]:
+            entry = (tag, None, [], self._open_tables[-1][-1])
+        elif tag in ('h1', 'h2', 'h3', 'font'):
+            # Заголовки собираются на любой глубине, в том числе внутри таблиц
+            entry = (tag, attrib.get('color'), [], None)
+
+        self._push(entry)
+
+    def end(self, tag):
+        self._flush()
+        entry = self._stack.pop() if self._stack else None
+
+        if tag == 'table' and self._open_tables:
+            self._open_tables.pop()
+        if entry is None:
+            return
+
+        self._active.pop()
+        tag, color, buffer, row = entry
+        if tag in ('td', 'th'):
+            row.append('\n'.join(buffer))
+        elif tag == 'font' and color == HEADER_COLOR:
+            self.headers.append(''.join(buffer))
+        else:
+            text = ''.join(buffer)
+            if _is_caption(text):
+                self.captions.append(text)
+
+    def data(self, data):
+        self._parts.append(data)
+
+    def comment(self, text):
+        # Комментарий разделяет текстовые узлы, как и в BeautifulSoup
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return self
+
+
+class StreamingBackend:
+    """Однопроходный разбор через события lxml (target parser).
+
+    Дерево документа не строится: текст копится только внутри розовых заголовков,
+    заголовков h1-h3 и ячеек таблиц, поэтому стоимость определяется таблицей,
+    а не размером страницы. Строки вложенной таблицы относятся к ней самой, а не к внешней.
+    """
+
+    name = 'stream'
+
+    def extract(self, raw, encoding):
+        target = _TimetableTarget()
+        parser = lxml.etree.HTMLParser(target=target, encoding=encoding, remove_blank_text=True)
+        lxml.etree.fromstring(raw, parser)
+
+        captions = []
+        week_text = None
+        if not any(WEEK_MARKER in header for header in target.headers):
+            captions = target.captions
+            week_text = target.week_text
+
+        tables = [rows for border, _, rows in target.tables if border == '1']
+        if not tables:
+            tables = [rows for _, css_class, rows in target.tables if TABLE_CLASS_RE.search(css_class or '')]
+        if not tables:
+            tables = [rows for _, _, rows in target.tables]
+
+        return PageContent(target.headers, captions, week_text, tables)
+
+
+class SelectolaxBackend:
+    """lexbor через selectolax: самый быстрый вариант, если пакет установлен"""
+
+    name = 'selectolax'
+
+    # Разделитель текстовых узлов, которого не бывает в HTML
+    _SEP = '\x00'
+
+    def _text(self, node, separator):
+        return _join_strings(node.text(separator=self._SEP).split(self._SEP), separator)
+
+    def extract(self, raw, encoding):
+        tree = LexborHTMLParser(raw.decode(encoding, errors='replace'))
+
+        headers = [self._text(font, '') for font in tree.css(f'font[color="{HEADER_COLOR}"]')]
+        captions = []
+        week_text = None
+        if not any(WEEK_MARKER in header for header in headers):
+            captions = [text for text in (self._text(tag, '') for tag in tree.css('h1, h2, h3, font'))
+                        if _is_caption(text)]
+            body = tree.body
+            if body is not None:
+                week_text = next((s for s in body.text(separator=self._SEP).split(self._SEP) if WEEK_MARKER in s),
+                                 None)
+
+        tables = tree.css('table[border="1"]')
+        if not tables:
+            tables = [table for table in tree.css('table')
+                      if TABLE_CLASS_RE.search(table.attributes.get('class') or '')]
+        if not tables:
+            tables = tree.css('table')
+
+        return PageContent(headers, captions, week_text, [
+            [[self._text(cell, '\n') for cell in row.css('td, th')]
+             for row in table.css('tr')]
+            for table in tables
+        ])
+
+
+BACKENDS = {
+    'selectolax': (SelectolaxBackend, LexborHTMLParser is not None),
+    'stream': (StreamingBackend, lxml is not None),
+    'lxml': (LxmlBackend, lxml is not None),
+    'bs4': (BeautifulSoupBackend, True),
+}
+
+
+def available_backends():
+    """Имена бэкендов, для которых установлены зависимости (от быстрого к медленному)"""
+    return [name for name, (_, available) in BACKENDS.items() if available]
+
+
+def get_backend(name='auto'):
+    """Возвращает бэкенд по имени; 'auto' - самый быстрый из установленных"""
+    if name == 'auto':
+        name = available_backends()[0]
+
+    backend_class, available = BACKENDS.get(name, (None, False))
+    if not available:
+        fallback = available_backends()[0]
+        logging.warning(f"⚠️ HTML-бэкенд {name} недоступен, используется {fallback}")
+        backend_class = BACKENDS[fallback][0]
+
+    return backend_class()
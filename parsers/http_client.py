@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import logging
+from typing import NamedTuple, Optional
+
+import aiohttp
+
+from config.config import HTTP_SETTINGS
+
+
+class PageResponse(NamedTuple):
+    """Ответ портала: статус, байты страницы (в кодировке портала) и признак изменения с прошлой загрузки"""
+    status: Optional[int]
+    content: Optional[bytes]
+    changed: bool = True
+
+
+class AsyncHttpClient:
+    """Асинхронный HTTP-клиент для страниц портала с пулом keep-alive соединений"""
+
+    def __init__(self, settings=None, cookies=None):
+        self.settings = dict(HTTP_SETTINGS, **(settings or {}))
+        self.cookies = dict(cookies or {})
+        # Сессия aiohttp привязана к циклу событий, поэтому храним по одной на цикл
+        self._sessions = {}
+        # url -> {'etag', 'last_modified', 'hash'} для условных запросов
+        self._validators = {}
+        self.not_modified = 0
+
+    def set_cookies(self, cookies):
+        """Обновляет cookies (например, после авторизации через requests)"""
+        self.cookies = dict(cookies or {})
+        for session in self._sessions.values():
+            if not session.closed:
+                session.cookie_jar.update_cookies(self.cookies)
+
+    def _get_session(self):
+        """Возвращает сессию для текущего цикла событий, создавая её при необходимости"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.settings['connection_limit'],
+                limit_per_host=self.settings['limit_per_host'],
+                keepalive_timeout=self.settings['keepalive_timeout'],
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=self.settings['total_timeout'],
+                connect=self.settings['connect_timeout'],
+                sock_read=self.settings['read_timeout']
+            )
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout, cookies=self.cookies)
+            self._sessions[loop] = session
+            logging.info("🌐 Создана HTTP-сессия для портала")
+
+        return session
+
+    async def fetch(self, url, conditional=False):
+        """Загружает страницу и возвращает PageResponse.
+
+        При conditional=True отправляет If-None-Match/If-Modified-Since из прошлого ответа.
+        Если портал ответил 304 или содержимое совпало по хешу, changed=False,
+        а вызывающий код может не разбирать страницу заново.
+        """
+        session = self._get_session()
+        validators = self._validators.get(url)
+        headers = {}
+        if conditional and validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and conditional and validators:
+                self.not_modified += 1
+                return PageResponse(304, None, False)
+
+            raw = await response.read()
+            if response.status != 200:
+                return PageResponse(response.status, raw)
+
+            content_hash = hashlib.sha1(raw).hexdigest()
+            changed = not (conditional and validators and validators.get('hash') == content_hash)
+            if not changed:
+                self.not_modified += 1
+
+            self._validators[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'hash': content_hash
+            }
+            # Страница не декодируется здесь: HTML-бэкенд разбирает байты сам
+            return PageResponse(200, raw, changed)
+
+    def matches_last(self, url, content):
+        """Совпадает ли content с последним полученным телом страницы (по хешу)"""
+        validators = self._validators.get(url)
+        return bool(validators) and validators.get('hash') == hashlib.sha1(content).hexdigest()
+
+    def forget(self, url):
+        """Сбрасывает сохраненные валидаторы страницы"""
+        self._validators.pop(url, None)
+
+    def fetch_sync(self, url):
+        """Синхронная загрузка страницы во временном цикле событий"""
+
+        async def runner():
+            try:
+                return await self.fetch(url)
+            finally:
+                await self.close()
+
+        return asyncio.run(runner())
+
+    async def close(self):
+        """Закрывает сессию текущего цикла событий"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
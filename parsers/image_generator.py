@@ -3,10 +3,54 @@ import io
 import logging
 import os
 
+from config.config import IMAGE_SETTINGS
+from parsers.text_layout import TextLayoutCache, rasterize_line
+
+# Расширение файла для формата кодирования
+FILE_EXTENSIONS = {'PNG': 'png', 'WEBP': 'webp', 'JPEG': 'jpg'}
+
+
+def get_encoder_profile(name=None):
+    """Профиль кодирования по имени, по умолчанию - IMAGE_SETTINGS['encoder']"""
+    name = name or IMAGE_SETTINGS['encoder']
+    profiles = IMAGE_SETTINGS['encoder_profiles']
+    if name not in profiles:
+        logging.warning(f"⚠️ Профиль кодирования {name} не найден, используется png")
+        name = 'png'
+    return profiles[name]
+
+
+def image_file_extension(profile=None):
+    """Расширение файла картинки, закодированной профилем"""
+    return FILE_EXTENSIONS[get_encoder_profile(profile)['format']]
+
 
 class ScheduleImageGenerator:
+    # Разметка кадра 1280x720
+    WIDTH = 1280
+    HEIGHT = 720
+    MARGIN = 15
+    DAY_COLUMN_HEIGHT = 93  # Высота колонки дня
+    PAIR_COLUMN_WIDTH = 149  # Ширина колонки пары
+    TIME_ROW_HEIGHT = 50  # Увеличена высота строки с временем с 40 до 50
+    DAY_COLUMN_WIDTH = 60  # УЗКАЯ КОЛОНКА ДЛЯ ДНЕЙ НЕДЕЛИ
+    GRID_TOP = MARGIN + 35 + 40  # Под заголовком и строкой с неделей
+
+    # Времена пар (по горизонтали)
+    TIME_SLOTS = {
+        1: "8:30-9:50", 2: "10:00-11:20", 3: "11:30-12:50",
+        4: "13:30-14:50", 5: "15:00-16:20", 6: "16:30-17:50",
+        7: "18:00-19:20", 8: "19:30-20:50"
+    }
+
+    # Дни недели (по вертикали слева) и их обозначение в занятиях
+    DAYS = ["ПН", "ВТ", "СР", "ЧТ", "ПТ", "СБ"]
+    LESSON_DAYS = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб"]
+
     def __init__(self):
         self._setup_fonts()
+        self._templates = {}  # Заготовки кадра по разметке
+        self.text_cache = TextLayoutCache(IMAGE_SETTINGS['text_cache_size'])
 
     def _setup_fonts(self):
         """Настройка шрифтов - используем Arial из локальной папки"""
@@ -77,52 +121,29 @@ class ScheduleImageGenerator:
         """Создает изображение с расписанием"""
         if not schedules:
             return self._create_error_image("Расписание не найдено")
+        return self._render_schedule(f"Расписание группы: {group_name}", week_number, schedules, 'teacher')
 
-        # Группируем по дням
-        days_schedule = {}
-        for item in schedules:
-            day = item['day']
-            if day not in days_schedule:
-                days_schedule[day] = []
-            days_schedule[day].append(item)
-
-        # Создаем изображение с разрешением 1280x720
-        width = 1280
-        height = 720
-        margin = 15
-        day_column_height = 93  # Высота колонки дня
-        pair_column_width = 149  # Ширина колонки пары
-        time_row_height = 50  # Увеличена высота строки с временем с 40 до 50
-
-        # УЗКАЯ КОЛОНКА ДЛЯ ДНЕЙ НЕДЕЛИ
-        day_column_width = 60  # Уменьшили ширину колонки дней
-
-        img = Image.new('RGB', (width, height), color='#1a1a1a')
-        draw = ImageDraw.Draw(img)
-
-        y_position = margin
-
-        # Заголовок
-        title = f"Расписание группы: {group_name}"
-        draw.text((width // 2, y_position), title, fill='white', font=self.title_font, anchor="mm")
-        y_position += 35
+    def _get_template(self, layout='grid'):
+        """Возвращает заготовку кадра: фон, шапка с парами и временем, колонка дней и пустые ячейки.
 
-        week_info = f"Неделя: {week_number}"
-        draw.text((width // 2, y_position), week_info, fill='#cccccc', font=self.subheader_font, anchor="mm")
-        y_position += 40
+        Сетка одинакова для всех расписаний, поэтому рисуется один раз на генератор,
+        а для каждого запроса копируется - на копии остается нарисовать заголовок и занятия.
+        """
+        template = self._templates.get(layout)
+        if template is not None:
+            return template
 
-        # Времена пар (теперь по горизонтали)
-        time_slots = {
-            1: "8:30-9:50", 2: "10:00-11:20", 3: "11:30-12:50",
-            4: "13:30-14:50", 5: "15:00-16:20", 6: "16:30-17:50",
-            7: "18:00-19:20", 8: "19:30-20:50"
-        }
+        img = Image.new('RGB', (self.WIDTH, self.HEIGHT), color='#1a1a1a')
+        draw = ImageDraw.Draw(img)
 
-        # Дни недели (теперь по вертикали слева)
-        days = ["ПН", "ВТ", "СР", "ЧТ", "ПТ", "СБ"]
+        margin = self.MARGIN
+        day_column_width = self.DAY_COLUMN_WIDTH
+        pair_column_width = self.PAIR_COLUMN_WIDTH
+        day_column_height = self.DAY_COLUMN_HEIGHT
+        time_row_height = self.TIME_ROW_HEIGHT
 
         # Заголовок дней
-        day_header_y = y_position
+        day_header_y = self.GRID_TOP
         draw.rectangle([margin, day_header_y, margin + day_column_width, day_header_y + time_row_height],
                        fill='#2d2d2d')
         draw.text((margin + day_column_width // 2, day_header_y + time_row_height // 2), "День",
@@ -147,67 +168,114 @@ class ScheduleImageGenerator:
 
             # Время пары - УВЕЛИЧЕНО И СМЕЩЕНО ВНИЗ
             time_y = center_y + 12  # Смещаем время вниз от центра
-            draw.text((center_x, time_y), time_slots[pair_num],
+            draw.text((center_x, time_y), self.TIME_SLOTS[pair_num],
                       fill='#cccccc', font=self.time_font, anchor="mm")
 
-        y_position += time_row_height
-
-        # Сетка расписания (дни по вертикали, пары по горизонтали)
-        for day_idx, day_name in enumerate(days):
-            day_y = y_position + day_idx * day_column_height
+        # Сетка расписания (дни по вертикали, пары по горизонтали) с пустыми ячейками
+        for day_idx, day_name in enumerate(self.DAYS):
+            day_y = self.GRID_TOP + time_row_height + day_idx * day_column_height
 
             # Ячейка дня (УЗКАЯ)
             draw.rectangle([margin, day_y, margin + day_column_width, day_y + day_column_height],
                            fill='#2d2d2d')
-
-            # Название дня (вертикально) - используем сокращенные названия
-            short_day = day_name  # Уже короткие: ПН, ВТ, СР и т.д.
-            draw.text((margin + day_column_width // 2, day_y + day_column_height // 2), short_day,
+            draw.text((margin + day_column_width // 2, day_y + day_column_height // 2), day_name,
                       fill='white', font=self.bob_font, anchor="mm")
 
-            # Ячейки для пар в этот день
             for pair_num in range(1, 9):
                 pair_x = margin + day_column_width + (pair_num - 1) * pair_column_width
+                draw.rectangle([pair_x, day_y, pair_x + pair_column_width, day_y + day_column_height],
+                               fill='#1a1a1a', outline='#444444')
+
+        self._templates[layout] = img
+        return img
 
-                # Ищем занятие
-                lesson = None
-                short_day_name = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб"][day_idx]
-                if short_day_name in days_schedule:
-                    for les in days_schedule[short_day_name]:
-                        if les['pair'] == pair_num:
-                            lesson = les
-                            break
+    def _render_schedule(self, title, week_number, schedules, third_field):
+        """Рисует заголовок и занятия на копии заготовки.
+        third_field - поле занятия для третьей строки ячейки: 'teacher' у группы, 'group' у преподавателя"""
+        img = self._get_template().copy()
+        draw = ImageDraw.Draw(img)
+        width = self.WIDTH
+
+        y_position = self.MARGIN
+
+        # Заголовок
+        draw.text((width // 2, y_position), title, fill='white', font=self.title_font, anchor="mm")
+        y_position += 35
+
+        week_info = f"Неделя: {week_number}"
+        draw.text((width // 2, y_position), week_info, fill='#cccccc', font=self.subheader_font, anchor="mm")
+
+        # Первое занятие в каждой ячейке (день, пара)
+        lessons = {}
+        for item in schedules:
+            lessons.setdefault((item.day, item.pair), item)
+
+        rows_top = self.GRID_TOP + self.TIME_ROW_HEIGHT
+        for day_idx, short_day_name in enumerate(self.LESSON_DAYS):
+            day_y = rows_top + day_idx * self.DAY_COLUMN_HEIGHT
+
+            for pair_num in range(1, 9):
+                lesson = lessons.get((short_day_name, pair_num))
+                if lesson is None:
+                    continue
+
+                pair_x = self.MARGIN + self.DAY_COLUMN_WIDTH + (pair_num - 1) * self.PAIR_COLUMN_WIDTH
 
                 # Рисуем ячейку
-                cell_color = '#1a1a1a' if not lesson else '#2d2d2d'
-                draw.rectangle([pair_x, day_y, pair_x + pair_column_width, day_y + day_column_height],
-                               fill=cell_color, outline='#444444')
-
-                if lesson:
-                    # Форматируем текст
-                    subject = self._wrap_text(lesson['subject'], 25)
-                    lesson_type = self._truncate_text(lesson['type'], 20)
-                    teacher = self._truncate_text(lesson['teacher'], 22)
-                    classroom = self._truncate_text(lesson['classroom'], 20)
-
-                    # Рисуем текст
-                    text_y = day_y + 5
-
-                    # Предмет (может быть в несколько строк)
-                    subject_lines = subject.split('\n')
-                    for line in subject_lines[:2]:  # Максимум 2 строки
-                        draw.text((pair_x + 5, text_y), line, fill='white', font=self.small_font)
-                        text_y += 10
-
-                    text_y += 2
-                    draw.text((pair_x + 5, text_y), lesson_type, fill='#ff6b6b', font=self.small_font)
+                draw.rectangle([pair_x, day_y, pair_x + self.PAIR_COLUMN_WIDTH, day_y + self.DAY_COLUMN_HEIGHT],
+                               fill='#2d2d2d', outline='#444444')
+
+                # Готовые надписи из общего кэша: перенос, обрезка и растр уже сделаны
+                subject = self._cell_text(lesson.subject, 25, wrap=True)
+                lesson_type = self._cell_text(lesson.type, 20)
+                third_line = self._cell_text(getattr(lesson, third_field), 22)
+                classroom = self._cell_text(lesson.classroom, 20)
+
+                # Рисуем текст
+                text_x = pair_x + 5
+                text_y = day_y + 5
+
+                # Предмет (может быть в несколько строк)
+                for line in subject:  # Максимум 2 строки
+                    self._paste_text(img, text_x, text_y, line, 'white')
                     text_y += 10
-                    draw.text((pair_x + 5, text_y), teacher, fill='#4ecdc4', font=self.small_font)
-                    text_y += 10
-                    draw.text((pair_x + 5, text_y), classroom, fill='#ffe66d', font=self.small_font)
+
+                text_y += 2
+                self._paste_text(img, text_x, text_y, lesson_type[0], '#ff6b6b')
+                text_y += 10
+                self._paste_text(img, text_x, text_y, third_line[0], '#4ecdc4')
+                text_y += 10
+                self._paste_text(img, text_x, text_y, classroom[0], '#ffe66d')
 
         return img
 
+    def _cell_text(self, text, max_length, wrap=False):
+        """Надпись ячейки мелким шрифтом: кортеж растеризованных строк (перенос до 2 строк или обрезка)"""
+        font = self.small_font
+
+        def build():
+            if wrap:
+                lines = self._wrap_text(text, max_length).split('\n')[:2]
+            else:
+                lines = [self._truncate_text(text, max_length)]
+            return tuple(rasterize_line(line, font) for line in lines)
+
+        return self.text_cache.get((text, font, max_length, wrap), build)
+
+    @staticmethod
+    def _paste_text(img, x, y, line, fill):
+        """Накладывает растеризованную строку цветом fill (как draw.text в точке x, y)"""
+        if line is None:
+            return
+        mask, left, top = line
+        img.paste(fill, (x + left, y + top, x + left + mask.width, y + top + mask.height), mask)
+
+    def log_text_cache_stats(self):
+        """Пишет статистику кэша надписей в лог"""
+        stats = self.text_cache.stats()
+        logging.info(f"🔤 Кэш надписей: {stats['size']} записей, попаданий {stats['hits']}, "
+                     f"промахов {stats['misses']} ({stats['hit_rate']:.0%})")
+
     def _truncate_text(self, text, max_length):
         """Обрезает текст"""
         if len(text) > max_length:
@@ -246,10 +314,18 @@ class ScheduleImageGenerator:
         draw.text((400, 200), error_message, fill='white', font=self.text_font, anchor="mm")
         return img
 
-    def image_to_bytes(self, image):
-        """Конвертирует изображение в bytes"""
+    def image_to_bytes(self, image, profile=None):
+        """Кодирует изображение по профилю из IMAGE_SETTINGS (по умолчанию - выбранному в настройках)"""
+        profile = get_encoder_profile(profile)
+        options = {key: value for key, value in profile.items() if key not in ('format', 'colors')}
+
+        if profile.get('colors'):
+            # Палитра без дизеринга: однотонные заливки остаются однотонными и хорошо сжимаются
+            image = image.quantize(colors=profile['colors'], method=Image.Quantize.FASTOCTREE,
+                                   dither=Image.Dither.NONE)
+
         img_byte_arr = io.BytesIO()
-        image.save(img_byte_arr, format='PNG', quality=95)
+        image.save(img_byte_arr, format=profile['format'], **options)
         img_byte_arr.seek(0)
         return img_byte_arr
 
@@ -257,131 +333,5 @@ class ScheduleImageGenerator:
         """Создает изображение с расписанием преподавателя"""
         if not schedules:
             return self._create_error_image("Расписание не найдено")
-
-        # Группируем по дням
-        days_schedule = {}
-        for item in schedules:
-            day = item['day']
-            if day not in days_schedule:
-                days_schedule[day] = []
-            days_schedule[day].append(item)
-
-        # Создаем изображение с разрешением 1280x720
-        width = 1280
-        height = 720
-        margin = 15
-        day_column_height = 93  # Высота колонки дня
-        pair_column_width = 149  # Ширина колонки пары
-        time_row_height = 50  # Высота строки с временем
-
-        # Узкая колонка для дней недели
-        day_column_width = 60
-
-        img = Image.new('RGB', (width, height), color='#1a1a1a')
-        draw = ImageDraw.Draw(img)
-
-        y_position = margin
-
-        # Заголовок
-        title = f"Расписание преподавателя: {teacher_name}"
-        draw.text((width // 2, y_position), title, fill='white', font=self.title_font, anchor="mm")
-        y_position += 35
-
-        week_info = f"Неделя: {week_number}"
-        draw.text((width // 2, y_position), week_info, fill='#cccccc', font=self.subheader_font, anchor="mm")
-        y_position += 40
-
-        # Времена пар
-        time_slots = {
-            1: "8:30-9:50", 2: "10:00-11:20", 3: "11:30-12:50",
-            4: "13:30-14:50", 5: "15:00-16:20", 6: "16:30-17:50",
-            7: "18:00-19:20", 8: "19:30-20:50"
-        }
-
-        # Дни недели
-        days = ["ПН", "ВТ", "СР", "ЧТ", "ПТ", "СБ"]
-
-        # Заголовок дней
-        day_header_y = y_position
-        draw.rectangle([margin, day_header_y, margin + day_column_width, day_header_y + time_row_height],
-                       fill='#2d2d2d')
-        draw.text((margin + day_column_width // 2, day_header_y + time_row_height // 2), "День",
-                  fill='white', font=self.bob_font, anchor="mm")
-
-        # Заголовки пар (номера и время)
-        for pair_num in range(1, 9):
-            pair_x = margin + day_column_width + (pair_num - 1) * pair_column_width
-
-            # Заголовок пары
-            draw.rectangle([pair_x, day_header_y, pair_x + pair_column_width, day_header_y + time_row_height],
-                           fill='#2d2d2d')
-
-            # Центр колонки по горизонтали и вертикали
-            center_x = pair_x + pair_column_width // 2
-            center_y = day_header_y + time_row_height // 2
-
-            # Номер пары
-            number_y = center_y - 8
-            draw.text((center_x, number_y), str(pair_num),
-                      fill='white', font=self.pair_number_font, anchor="mm")
-
-            # Время пары
-            time_y = center_y + 12
-            draw.text((center_x, time_y), time_slots[pair_num],
-                      fill='#cccccc', font=self.time_font, anchor="mm")
-
-        y_position += time_row_height
-
-        # Сетка расписания
-        for day_idx, day_name in enumerate(days):
-            day_y = y_position + day_idx * day_column_height
-
-            # Ячейка дня
-            draw.rectangle([margin, day_y, margin + day_column_width, day_y + day_column_height],
-                           fill='#2d2d2d')
-            draw.text((margin + day_column_width // 2, day_y + day_column_height // 2), day_name,
-                      fill='white', font=self.bob_font, anchor="mm")
-
-            # Ячейки для пар в этот день
-            for pair_num in range(1, 9):
-                pair_x = margin + day_column_width + (pair_num - 1) * pair_column_width
-
-                # Ищем занятие
-                lesson = None
-                short_day_name = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб"][day_idx]
-                if short_day_name in days_schedule:
-                    for les in days_schedule[short_day_name]:
-                        if les['pair'] == pair_num:
-                            lesson = les
-                            break
-
-                # Рисуем ячейку
-                cell_color = '#1a1a1a' if not lesson else '#2d2d2d'
-                draw.rectangle([pair_x, day_y, pair_x + pair_column_width, day_y + day_column_height],
-                               fill=cell_color, outline='#444444')
-
-                if lesson:
-                    # Форматируем текст для преподавателя
-                    subject = self._wrap_text(lesson['subject'], 25)
-                    lesson_type = self._truncate_text(lesson['type'], 20)
-                    group = self._truncate_text(lesson['group'], 22)  # Вместо teacher теперь group
-                    classroom = self._truncate_text(lesson['classroom'], 20)
-
-                    # Рисуем текст
-                    text_y = day_y + 5
-
-                    # Предмет (может быть в несколько строк)
-                    subject_lines = subject.split('\n')
-                    for line in subject_lines[:2]:  # Максимум 2 строки
-                        draw.text((pair_x + 5, text_y), line, fill='white', font=self.small_font)
-                        text_y += 10
-
-                    text_y += 2
-                    draw.text((pair_x + 5, text_y), lesson_type, fill='#ff6b6b', font=self.small_font)
-                    text_y += 10
-                    draw.text((pair_x + 5, text_y), group, fill='#4ecdc4',
-                              font=self.small_font)  # Группа вместо преподавателя
-                    text_y += 10
-                    draw.text((pair_x + 5, text_y), classroom, fill='#ffe66d', font=self.small_font)
-
-        return img
\ No newline at end of file
+        # Вместо преподавателя в ячейке выводится группа
+        return self._render_schedule(f"Расписание преподавателя: {teacher_name}", week_number, schedules, 'group')
@@ -0,0 +1,28 @@
+import sys
+from typing import NamedTuple
+
+
+class Lesson(NamedTuple):
+    """Одно занятие в расписании группы или преподавателя.
+
+    У группы заполнен teacher, у преподавателя - group.
+    """
+    week: int
+    day: str
+    pair: int
+    subject: str
+    type: str
+    teacher: str = ""
+    classroom: str = ""
+    group: str = ""
+
+
+def make_lesson(week, day, pair, subject, type, teacher="", classroom="", group=""):
+    """Создает Lesson с интернированными строками.
+
+    Названия предметов, преподаватели, аудитории и дни повторяются у сотен групп,
+    поэтому в кэше расписаний хранится по одному экземпляру каждой строки.
+    """
+    intern = sys.intern
+    return Lesson(week, intern(day), pair, intern(subject), intern(type),
+                  intern(teacher), intern(classroom), intern(group))
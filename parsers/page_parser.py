@@ -0,0 +1,193 @@
+"""Разбор страниц расписания: HTML -> (имя, {номер недели: занятия}).
+
+Здесь нет сети, кэшей и авторизации - только HTML-бэкенд и разбор ячеек,
+поэтому такой разборщик дешево создать в каждом воркере пула (parsers/workers.py).
+"""
+import logging
+import re
+
+from config.config import HTTP_SETTINGS, PARSER_SETTINGS
+from database.groups_dict import GROUPS_DICT
+from parsers import cell_parser
+from parsers.html_backend import get_backend
+from parsers.lesson import make_lesson
+
+
+class SchedulePageParser:
+    """Разбирает страницы групп и преподавателей выбранным HTML-бэкендом"""
+
+    def __init__(self, html_backend=None):
+        self.html_backend = html_backend or get_backend(PARSER_SETTINGS['html_backend'])
+
+    def group_name_from_url(self, group_url):
+        """Определяет название группы по URL страницы расписания"""
+        try:
+            group_number_match = re.search(r'/(\d+)\.html', group_url)
+            if not group_number_match:
+                return "Неизвестная группа"
+
+            url_group_number = int(group_number_match.group(1))
+
+            # Определяем часть по URL
+            if 'Часть%201' in group_url or 'Часть 1' in group_url:
+                actual_group_number = url_group_number
+            elif 'Часть%202' in group_url or 'Часть 2' in group_url:
+                actual_group_number = url_group_number + 115
+            elif 'Часть%203' in group_url or 'Часть 3' in group_url:
+                actual_group_number = url_group_number + 234
+            elif 'Часть%204' in group_url or 'Часть 4' in group_url:
+                actual_group_number = url_group_number + 464
+            elif 'Часть%205' in group_url or 'Часть 5' in group_url:
+                actual_group_number = url_group_number + 562
+            else:
+                actual_group_number = url_group_number
+
+            return GROUPS_DICT.get(actual_group_number, f"Группа_{actual_group_number}")
+        except:
+            return "Неизвестная группа"
+
+    def parse_group_weeks(self, group_url, status, html):
+        """Разбирает все недели на странице группы: (название, {номер недели: занятия}).
+        Недели идут в порядке страницы, первая - текущая"""
+        group_name = self.group_name_from_url(group_url)
+        try:
+            if status != 200:
+                logging.warning(f"⚠️ Не удалось загрузить страницу: {status}")
+                return group_name, {}
+
+            page = self.html_backend.extract(html, HTTP_SETTINGS['encoding'])
+            logging.info(f"🔍 Найдено таблиц: {len(page.tables)}")
+
+            weeks = {}
+            for week_number, table in self._week_tables(page):
+                week = int(week_number)
+                schedules = []
+                for day_name, pair_number, cell_text in self._iter_timetable_cells(table):
+                    lesson_data = cell_parser.parse_group_cell(cell_text)
+                    if lesson_data:
+                        schedules.append(make_lesson(
+                            week, day_name, pair_number,
+                            subject=lesson_data['subject'],
+                            type=lesson_data['type'],
+                            teacher=lesson_data['teacher'],
+                            classroom=lesson_data['classroom']
+                        ))
+                        logging.info(f"✅ {day_name} {pair_number} пара - {lesson_data['subject']}")
+                if schedules and week_number not in weeks:
+                    weeks[week_number] = schedules
+
+            logging.info(f"📊 Итог для {group_name}: " + (", ".join(
+                f"неделя {week_number} - {len(schedules)} занятий" for week_number, schedules in weeks.items()
+            ) or "занятий нет"))
+            return group_name, weeks
+
+        except Exception as e:
+            logging.error(f"❌ Ошибка парсинга: {e}")
+            import traceback
+            logging.error(f"❌ Трассировка: {traceback.format_exc()}")
+            return group_name, {}
+
+    @staticmethod
+    def current_week(name, weeks):
+        """Возвращает (имя, неделя, занятия) для первой недели страницы"""
+        for week_number, schedules in weeks.items():
+            return name, week_number, schedules
+        return name, "1", []
+
+    def _week_tables(self, page):
+        """Сопоставляет таблицы страницы с номерами недель из заголовков: [(неделя, таблица)]"""
+        week_numbers = []
+        for text in page.headers:
+            week_match = re.search(r'Неделя:\s*(\d+)-я', text)
+            if week_match:
+                week_numbers.append(week_match.group(1))
+
+        if week_numbers and len(week_numbers) == len(page.tables):
+            logging.info(f"📅 Найдены недели: {', '.join(week_numbers)}")
+            return list(zip(week_numbers, page.tables))
+
+        # Заголовки не сопоставляются с таблицами - как раньше, текущей считаем первую таблицу с занятиями
+        week_number = self._find_week_number(page)
+        return [(week_number, table) for table in page.tables]
+
+    @staticmethod
+    def _iter_timetable_cells(table):
+        """Перебирает непустые ячейки таблицы расписания: (день, номер пары, текст).
+        Строки 2-7 - дни Пн-Сб, столбцы 1-8 - пары"""
+        day_names = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб"]
+        for row_idx in range(2, min(len(table), 8)):
+            cells = table[row_idx]
+            if len(cells) < 2:
+                continue
+            for cell_idx in range(1, min(len(cells), 9)):
+                cell_text = cells[cell_idx]
+                if cell_text and cell_text not in ['', '-', ' ']:
+                    yield day_names[row_idx - 2], cell_idx, cell_text
+
+    def _find_week_number(self, page):
+        """Ищет номер недели в розовых заголовках страницы, затем в любом тексте с «Неделя:»"""
+        for text in page.headers + ([page.week_text] if page.week_text else []):
+            if 'Неделя:' in text:
+                week_match = re.search(r'Неделя:\s*(\d+)-я', text)
+                if week_match:
+                    logging.info(f"📅 Найдена неделя: {week_match.group(1)}")
+                    return week_match.group(1)
+        return "1"
+
+    def parse_teacher_weeks(self, status, html):
+        """Разбирает все недели на странице преподавателя: (имя, {номер недели: занятия})"""
+        try:
+            if status != 200:
+                logging.warning(f"⚠️ Не удалось загрузить страницу преподавателя: {status}")
+                return "Неизвестный преподаватель", {}
+
+            page = self.html_backend.extract(html, HTTP_SETTINGS['encoding'])
+
+            # Ищем имя преподавателя - оно стоит в розовом заголовке перед "Неделя:"
+            teacher_name = "Неизвестный преподаватель"
+            for text in page.headers:
+                if 'Неделя:' in text:
+                    name_part = text.split('Неделя:')[0].strip()
+                    if name_part and len(name_part) > 1:  # Проверяем, что это не пустая строка
+                        teacher_name = name_part
+                        logging.info(f"✅ Найдено имя преподавателя: {teacher_name}")
+                        break
+
+            # Если не нашли через розовый текст, пробуем заголовки "Расписание ... преподавателя ..."
+            if teacher_name == "Неизвестный преподаватель":
+                for text in page.captions:
+                    match = re.search(r'преподавателя\s+(.+)', text, re.IGNORECASE)
+                    if match:
+                        teacher_name = match.group(1).strip()
+                        logging.info(f"✅ Найдено имя преподавателя из заголовка: {teacher_name}")
+                        break
+
+            logging.info(f"🔍 Найдено таблиц преподавателя: {len(page.tables)}")
+
+            weeks = {}
+            for week_number, table in self._week_tables(page):
+                week = int(week_number)
+                schedules = []
+                for day_name, pair_number, cell_text in self._iter_timetable_cells(table):
+                    lesson_data = cell_parser.parse_teacher_cell(cell_text)
+                    if lesson_data:
+                        schedules.append(make_lesson(
+                            week, day_name, pair_number,
+                            subject=lesson_data['subject'],
+                            type=lesson_data['type'],
+                            group=lesson_data['group'],
+                            classroom=lesson_data['classroom']
+                        ))
+                if schedules and week_number not in weeks:
+                    weeks[week_number] = schedules
+
+            logging.info(f"📊 Итог преподавателя {teacher_name}: " + (", ".join(
+                f"неделя {week_number} - {len(schedules)} занятий" for week_number, schedules in weeks.items()
+            ) or "занятий нет"))
+            return teacher_name, weeks
+
+        except Exception as e:
+            logging.error(f"❌ Ошибка парсинга расписания преподавателя: {e}")
+            import traceback
+            logging.error(f"❌ Трассировка преподавателя: {traceback.format_exc()}")
+            return "Неизвестный преподаватель", {}
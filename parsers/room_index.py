@@ -0,0 +1,134 @@
+"""Занятость аудиторий по расписаниям групп.
+
+Для каждой аудитории (корпус, номер) хранится битовая маска занятых пар:
+бит (четность недели, день, пара) выставлен, если в аудитории идет занятие.
+На странице портала две соседние недели, поэтому четности хватает, чтобы различить их.
+Поиск свободных аудиторий - проверка одного бита по всем известным аудиториям.
+"""
+import logging
+import re
+import time
+from datetime import datetime
+
+DAYS = ("Пн", "Вт", "Ср", "Чт", "Пт", "Сб")
+PAIRS = 8
+
+# Конец каждой пары (часы, минуты), как в сетке времени на картинке расписания
+PAIR_ENDS = ((9, 50), (11, 20), (12, 50), (14, 50), (16, 20), (17, 50), (19, 20), (20, 50))
+
+# "ауд. 3-312", "ауд. 6-НБ8", "ауд. 3_2" -> корпус и номер; дистанционные занятия (ДОТ) - не аудитории
+ROOM_RE = re.compile(r'(\d+)\s*[\-_]\s*([\dА-ЯA-Z]+)', re.IGNORECASE)
+
+
+def parse_room(classroom):
+    """Возвращает (корпус, номер) из аудитории занятия или None"""
+    if not classroom or 'ДОТ' in classroom.upper():
+        return None
+    match = ROOM_RE.search(classroom)
+    if match is None:
+        return None
+    return match.group(1), match.group(2).upper()
+
+
+def slot_bit(week, day, pair):
+    """Бит занятия в маске аудитории"""
+    return 1 << ((int(week) % 2 * len(DAYS) + DAYS.index(day)) * PAIRS + pair - 1)
+
+
+def current_slot(now=None):
+    """Текущие (день, пара) или ближайшая пара сегодня; None в воскресенье и после последней пары"""
+    now = now or datetime.now()
+    if now.weekday() >= len(DAYS):
+        return None
+    minutes = now.hour * 60 + now.minute
+    for pair, (hour, minute) in enumerate(PAIR_ENDS, 1):
+        if minutes <= hour * 60 + minute:
+            return DAYS[now.weekday()], pair
+    return None
+
+
+def requested_day(now=None):
+    """День для запроса на конкретную пару и сдвиг номера недели:
+    сегодня, а в воскресенье - понедельник следующей недели"""
+    now = now or datetime.now()
+    if now.weekday() >= len(DAYS):
+        return DAYS[0], 1
+    return DAYS[now.weekday()], 0
+
+
+class RoomIndex:
+    """Индекс (корпус, номер) -> битовая маска занятых пар.
+
+    Маски хранятся отдельно по каждой группе, поэтому изменение одной страницы
+    пересчитывает только аудитории этой группы.
+    """
+
+    def __init__(self):
+        self.current_week = None
+        self._by_group = {}  # номер группы -> {аудитория: маска}
+        self._groups_by_room = {}  # аудитория -> номера групп, которые в ней занимаются
+        self._rooms = {}  # аудитория -> общая маска
+
+    def build(self, groups_data):
+        """Полностью перестраивает индекс по результату ScheduleCrawler.crawl_groups"""
+        started = time.perf_counter()
+        self._by_group.clear()
+        self._groups_by_room.clear()
+        self._rooms.clear()
+        for group_number, data in groups_data.items():
+            self.update_group(group_number, data['weeks'], data['week'])
+        logging.info(f"🚪 Индекс аудиторий: {len(self._rooms)} аудиторий из {len(groups_data)} групп "
+                     f"за {time.perf_counter() - started:.3f} с")
+
+    def update_group(self, group_number, weeks, current_week=None):
+        """Заменяет занятость одной группы ({неделя: занятия}) и пересчитывает ее аудитории"""
+        masks = {}
+        for week, lessons in weeks.items():
+            for lesson in lessons:
+                room = parse_room(lesson.classroom)
+                if room is not None and lesson.day in DAYS and 1 <= lesson.pair <= PAIRS:
+                    masks[room] = masks.get(room, 0) | slot_bit(week, lesson.day, lesson.pair)
+
+        # Номер текущей недели обновляется, даже если занятость группы не изменилась
+        if current_week is not None:
+            self.current_week = current_week
+
+        old_masks = self._by_group.get(group_number, {})
+        if masks == old_masks:
+            return
+        self._by_group[group_number] = masks
+
+        for room in old_masks.keys() - masks.keys():
+            self._groups_by_room[room].discard(group_number)
+        for room in masks.keys() - old_masks.keys():
+            self._groups_by_room.setdefault(room, set()).add(group_number)
+
+        for room in old_masks.keys() | masks.keys():
+            if not self._groups_by_room[room]:
+                # В аудитории больше никто не занимается - о ней ничего не известно
+                del self._groups_by_room[room]
+                del self._rooms[room]
+                continue
+            mask = 0
+            for number in self._groups_by_room[room]:
+                mask |= self._by_group[number][room]
+            self._rooms[room] = mask
+
+    def free_rooms(self, day, pair, week=None, building=None):
+        """Аудитории, свободные на паре, отсортированные по корпусу и номеру"""
+        week = week if week is not None else self.current_week
+        if week is None:
+            return []
+        bit = slot_bit(week, day, pair)
+        return sorted(
+            (room for room, mask in self._rooms.items()
+             if not mask & bit and (building is None or room[0] == building)),
+            key=lambda room: (int(room[0]), room[1].zfill(4))
+        )
+
+    def buildings(self):
+        """Номера корпусов, в которых есть известные аудитории"""
+        return sorted({building for building, _ in self._rooms}, key=int)
+
+    def __len__(self):
+        return len(self._rooms)
@@ -0,0 +1,53 @@
+import logging
+from typing import NamedTuple, Optional
+
+from config.config import CACHE_SETTINGS
+from utils.cache import TTLCache
+
+
+class RenderedSchedule(NamedTuple):
+    """Готовая картинка расписания: PNG, признак устаревших данных и время последней загрузки с портала"""
+    png: bytes
+    stale: bool = False
+    updated_at: Optional[float] = None
+
+
+class ScheduleCache:
+    """Трехуровневый кэш расписаний: HTML страницы, разобранные занятия и готовые PNG.
+
+    HTML хранится по URL страницы, занятия и PNG - по ключу (вид, номер, неделя),
+    где вид - 'group' или 'teacher', а неделя None означает текущую неделю портала.
+    На странице портала обычно две недели, каждая кэшируется отдельно.
+    """
+
+    def __init__(self, settings=None):
+        settings = settings or CACHE_SETTINGS
+        self.html = TTLCache('html', **settings['html'])
+        self.parsed = TTLCache('parsed', **settings['parsed'])
+        self.png = TTLCache('png', **settings['png'])
+        # (вид, номер) -> номера недель последней разобранной страницы, первая - текущая
+        self.weeks = {}
+
+    @staticmethod
+    def make_key(kind, number, week=None):
+        """Формирует ключ для уровней занятий и PNG"""
+        return kind, number, week
+
+    def invalidate(self, kind, number, url=None):
+        """Сбрасывает кэш всех недель расписания группы или преподавателя"""
+        for week in (None,) + self.weeks.pop((kind, number), ()):
+            key = self.make_key(kind, number, week)
+            self.parsed.pop(key)
+            self.png.pop(key)
+        if url:
+            self.html.pop(url)
+
+    def stats(self):
+        """Возвращает счетчики по всем уровням"""
+        return {tier.name: tier.stats() for tier in (self.html, self.parsed, self.png)}
+
+    def log_stats(self):
+        """Пишет статистику кэша в лог"""
+        for name, tier_stats in self.stats().items():
+            logging.info(f"📦 Кэш {name}: {tier_stats['size']} записей, попаданий {tier_stats['hits']}, "
+                         f"промахов {tier_stats['misses']} ({tier_stats['hit_rate']:.0%})")
@@ -0,0 +1,116 @@
+"""Расписания преподавателей, собранные из обхода всех групп.
+
+В каждом занятии группы уже указан преподаватель, поэтому после полного обхода
+расписание преподавателя можно получить "переворотом" данных групп, не загружая
+страницы m{n}.html. Занятие лекционного потока у нескольких групп
+склеивается в одно с перечислением групп через запятую.
+"""
+import logging
+import re
+import time
+from collections import defaultdict
+
+from config.config import TEACHER_INDEX_SETTINGS
+from database.teachers_dict import TEACHERS_DICT, TEACHERS_REVERSE_DICT
+from parsers.lesson import make_lesson
+
+_SEPARATORS_RE = re.compile(r'[\s.]+')
+
+
+def normalize_teacher_name(name):
+    """Приводит имя к виду "фамилия и о": регистр, ё, точки и слитные инициалы не важны"""
+    words = _SEPARATORS_RE.split(name.lower().replace('ё', 'е').strip())
+    words = [word for word in words if word]
+    if not words:
+        return ""
+    # "ИО" и "И.О." разбиваем на отдельные буквы, как в справочнике ("Фамилия И О")
+    initials = [letter for word in words[1:] for letter in (word if len(word) <= 2 else (word,))]
+    return ' '.join([words[0]] + initials)
+
+
+# Нормализованное имя -> номер преподавателя; при совпадении имен побеждает первый номер
+_NUMBERS_BY_NAME = {}
+for _name, _number in sorted(TEACHERS_REVERSE_DICT.items(), key=lambda item: item[1]):
+    _NUMBERS_BY_NAME.setdefault(normalize_teacher_name(_name), _number)
+
+
+def find_teacher_number_by_name(name):
+    """Номер преподавателя по имени из ячейки группы ("Иванов И И") или None"""
+    key = normalize_teacher_name(name)
+    number = _NUMBERS_BY_NAME.get(key)
+    if number is None:
+        # В ячейке после инициалов бывает продолжение текста: "Иванов И И Предприятие"
+        number = _NUMBERS_BY_NAME.get(' '.join(key.split()[:3]))
+    return number
+
+
+class TeacherIndex:
+    """Индекс преподаватель -> {неделя: занятия}, построенный по обходу всех групп"""
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age if max_age is not None else TEACHER_INDEX_SETTINGS['max_age']
+        self.weeks = ()  # Недели обхода, первая - текущая
+        self.built_at = None
+        self._teachers = {}
+
+    def build(self, groups_data):
+        """Строит индекс по результату ScheduleCrawler.crawl_groups"""
+        started = time.perf_counter()
+        slots = defaultdict(dict)  # номер -> (неделя, ее номер, день, пара, предмет, тип, аудитория) -> [группы]
+        weeks = {}
+        matched = unmatched = 0
+
+        for data in groups_data.values():
+            for week, lessons in data['weeks'].items():
+                weeks.setdefault(week, None)
+                for lesson in lessons:
+                    number = find_teacher_number_by_name(lesson.teacher)
+                    if number is None:
+                        unmatched += 1
+                        continue
+                    matched += 1
+                    slot = (week, lesson.week, lesson.day, lesson.pair, lesson.subject, lesson.type, lesson.classroom)
+                    groups = slots[number].setdefault(slot, [])
+                    if data['name'] not in groups:
+                        groups.append(data['name'])
+
+        teachers = {}
+        for number, teacher_slots in slots.items():
+            teacher_weeks = {}
+            for (week, week_number, day, pair, subject, lesson_type, classroom), groups in teacher_slots.items():
+                teacher_weeks.setdefault(week, []).append(make_lesson(
+                    week_number, day, pair,
+                    subject=subject,
+                    type=lesson_type,
+                    group=', '.join(groups),
+                    classroom=classroom
+                ))
+            teachers[number] = teacher_weeks
+
+        self._teachers = teachers
+        self.weeks = tuple(weeks)
+        self.built_at = time.monotonic()
+        logging.info(f"👩‍🏫 Индекс преподавателей: {len(teachers)} преподавателей из {len(groups_data)} групп "
+                     f"за {time.perf_counter() - started:.2f} с (занятий сопоставлено {matched}, "
+                     f"без известного преподавателя {unmatched})")
+
+    @property
+    def is_fresh(self):
+        """Построен ли индекс и не устарел ли он"""
+        return self.built_at is not None and time.monotonic() - self.built_at < self.max_age
+
+    def __contains__(self, teacher_number):
+        return self.is_fresh and teacher_number in self._teachers
+
+    def get(self, teacher_number):
+        """Возвращает (имя, {неделя: занятия}) или None, если преподавателя нет в индексе"""
+        if teacher_number not in self:
+            return None
+        teacher_weeks = self._teachers[teacher_number]
+        # Порядок недель как на страницах групп, чтобы первая была текущей
+        return TEACHERS_DICT.get(teacher_number, f"Преподаватель_{teacher_number}"), {
+            week: teacher_weeks[week] for week in self.weeks if week in teacher_weeks
+        }
+
+    def __len__(self):
+        return len(self._teachers)
@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw
+
+
+class TextLayoutCache:
+    """Ограниченный LRU-кэш надписей ячеек: (строка, шрифт, ширина, перенос) -> готовые строки.
+
+    Строка надписи хранится уже растеризованной (маска и смещение), поэтому повторная
+    отрисовка предмета, преподавателя или аудитории - это поиск в словаре и наложение маски.
+    Различных строк во всем университете несколько тысяч, и они общие для групп и преподавателей.
+    Генератор в режиме потоков один на все воркеры, поэтому доступ защищен блокировкой.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """Возвращает надпись по ключу, создавая ее через build() при промахе"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = build()
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+        return value
+
+    def stats(self):
+        """Возвращает счетчики попаданий и промахов"""
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+_MEASURE = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+
+def rasterize_line(text, font):
+    """Растеризует строку: (маска L, смещение x, смещение y) или None для пустой строки.
+    Наложение маски цветом дает те же пиксели, что и ImageDraw.text"""
+    left, top, right, bottom = _MEASURE.textbbox((0, 0), text, font=font)
+    if right <= left or bottom <= top:
+        return None
+    mask = Image.new('L', (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return mask, left, top
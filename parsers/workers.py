@@ -0,0 +1,57 @@
+# Функции, выполняемые в пуле воркеров.
+# Они объявлены на уровне модуля, чтобы их можно было передать и в пул процессов.
+# Воркеру нужен только разборщик страниц и генератор картинок, а не весь UlstuParser
+# с сессией, HTTP-клиентом, кэшами и собственным пулом.
+import threading
+from typing import NamedTuple
+
+from parsers.image_generator import ScheduleImageGenerator
+from parsers.page_parser import SchedulePageParser
+
+
+class WorkerContext(NamedTuple):
+    page_parser: SchedulePageParser
+    image_generator: ScheduleImageGenerator
+
+
+_context = None
+_context_lock = threading.Lock()
+
+
+def _get_context():
+    """Возвращает контекст воркера: один на процесс, общий для потоков пула"""
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                _context = WorkerContext(SchedulePageParser(), ScheduleImageGenerator())
+    return _context
+
+
+def parse_group_weeks(group_url, status, html):
+    """Разбирает все недели на странице группы (html - байты страницы)"""
+    return _get_context().page_parser.parse_group_weeks(group_url, status, html)
+
+
+def parse_teacher_weeks(status, html):
+    """Разбирает все недели на странице преподавателя (html - байты страницы)"""
+    return _get_context().page_parser.parse_teacher_weeks(status, html)
+
+
+def render_group_schedule(group_name, week_number, schedules):
+    """Рисует расписание группы и возвращает PNG в виде bytes"""
+    generator = _get_context().image_generator
+    image = generator.create_schedule_image(group_name, week_number, schedules)
+    return generator.image_to_bytes(image).getvalue()
+
+
+def render_teacher_schedule(teacher_name, week_number, schedules):
+    """Рисует расписание преподавателя и возвращает PNG в виде bytes"""
+    generator = _get_context().image_generator
+    image = generator.create_teacher_schedule_image(teacher_name, week_number, schedules)
+    return generator.image_to_bytes(image).getvalue()
+
+
+def log_text_cache_stats():
+    """Пишет в лог статистику кэша надписей воркера (в пуле процессов - одного из них)"""
+    _get_context().image_generator.log_text_cache_stats()
@@ -0,0 +1,84 @@
+import logging
+from typing import Any, NamedTuple, Optional
+
+from maxapi.types import CallbackButton
+from maxapi.utils.inline_keyboard import InlineKeyboardBuilder
+
+from database.content_catalog import CONTENT_CATALOG, CONTENT_ALIASES
+from services.media_service import media_service
+from utils.assets import asset_store
+
+logging.basicConfig(level=logging.INFO)
+
+
+class ContentMessage(NamedTuple):
+    """Готовое к отправке сообщение раздела"""
+    text: str
+    keyboard: Any  # Вложение inline-клавиатуры
+    media: Optional[Any] = None  # InputMediaBuffer или None, если картинки нет
+
+
+class ContentService:
+    """Статичные разделы меню (стипендии, профком, общежитие, ...).
+
+    Каталог из database/content_catalog.py один раз превращается в готовые сообщения:
+    текст, клавиатура и вложение собраны заранее, а обработчик нажатия только находит
+    сообщение по payload и отправляет его.
+    """
+
+    def __init__(self):
+        self._messages = {}
+
+    def load(self):
+        """Собирает сообщения каталога. Вызывается после asset_store.load()"""
+        messages = {}
+        for payload, entry in CONTENT_CATALOG.items():
+            messages[payload] = self._compile(payload, entry)
+        for alias, payload in CONTENT_ALIASES.items():
+            messages[alias] = messages[payload]
+        self._messages = messages
+        logging.info(f"📚 Разделы меню собраны: {len(CONTENT_CATALOG)} "
+                     f"(с картинками {sum(1 for m in messages.values() if m.media is not None)})")
+
+    @staticmethod
+    def _compile(payload, entry):
+        builder = InlineKeyboardBuilder()
+        for row in entry['buttons']:
+            builder.row(*(CallbackButton(text=text, payload=button_payload) for text, button_payload in row))
+
+        media = None
+        if 'image' in entry:
+            media = asset_store.media(*entry['image'])
+            if media is None:
+                logging.warning(f"❌ Картинка {entry['image'][0]} для раздела {payload} не найдена")
+
+        return ContentMessage(entry['text'], builder.as_markup(), media)
+
+    def get(self, payload):
+        """Готовое сообщение раздела или None, если payload не из каталога"""
+        return self._messages.get(payload)
+
+    def __contains__(self, payload):
+        return payload in self._messages
+
+    async def send(self, bot, chat_id, message):
+        """Отправляет сообщение раздела; если картинку отправить не удалось - только текст"""
+        if message.media is not None:
+            try:
+                return await media_service.send_message(
+                    bot,
+                    chat_id=chat_id,
+                    text=message.text,
+                    attachments=[message.media, message.keyboard]
+                )
+            except Exception as e:
+                logging.error(f"❌ Ошибка при отправке раздела с картинкой {message.media.filename}: {e}")
+
+        return await bot.send_message(
+            chat_id=chat_id,
+            text=message.text,
+            attachments=[message.keyboard]
+        )
+
+
+content_service = ContentService()
@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import weakref
+from collections import OrderedDict
+
+from maxapi.types import InputMediaBuffer
+from maxapi.types.attachments.upload import AttachmentPayload, AttachmentUpload
+from maxapi.types.errors import Error
+from maxapi.utils.message import process_input_media
+
+from config.config import MEDIA_SETTINGS
+from utils.singleflight import SingleFlight
+
+logging.basicConfig(level=logging.INFO)
+
+
+class MediaService:
+    """Отправка сообщений с картинками, загружающая каждый файл на сервер MAX один раз.
+
+    После первой загрузки токен вложения запоминается по хешу содержимого, и повторные
+    отправки тех же байтов (картинки разделов, неизменившиеся расписания) ссылаются на токен.
+    Если сервер отклонит сохраненный токен, файл загружается заново и сообщение отправляется повторно.
+    """
+
+    def __init__(self, max_tokens=None):
+        self.max_tokens = max_tokens or MEDIA_SETTINGS['max_tokens']
+        self._tokens = OrderedDict()  # (тип, хеш) -> AttachmentUpload
+        self._uploads = SingleFlight()  # Одновременные отправки одного файла ждут одну загрузку
+        self._keys = weakref.WeakKeyDictionary()  # InputMediaBuffer -> ключ, пока объект жив
+        self.hits = 0
+        self.uploads = 0
+        self.rejected = 0
+
+    def content_key(self, media):
+        """Ключ вложения: тип и хеш содержимого.
+        Для готовых вложений, которые отправляются много раз (картинки разделов), хеш считается один раз"""
+        key = self._keys.get(media)
+        if key is None:
+            key = media.type, hashlib.blake2b(media.buffer, digest_size=16).hexdigest()
+            self._keys[media] = key
+        return key
+
+    async def _upload(self, bot, key, media):
+        """Загружает файл на сервер MAX и запоминает токен"""
+        uploaded = await process_input_media(base_connection=bot, bot=bot, att=media)
+        self.uploads += 1
+        self._tokens[key] = AttachmentUpload(type=uploaded.type, payload=AttachmentPayload(token=uploaded.payload.token))
+        while len(self._tokens) > self.max_tokens:
+            self._tokens.popitem(last=False)
+        logging.info(f"📤 Загружен файл {media.filename} ({len(media.buffer) / 1024:.0f} КБ), токен сохранен")
+        return self._tokens[key]
+
+    async def _resolve(self, bot, attachments):
+        """Заменяет InputMediaBuffer на загруженные вложения.
+        Возвращает (вложения, ключи токенов, взятых из кэша)"""
+        resolved = []
+        reused = []
+        for attachment in attachments or []:
+            if not isinstance(attachment, InputMediaBuffer):
+                resolved.append(attachment)
+                continue
+
+            key = self.content_key(attachment)
+            uploaded = self._tokens.get(key)
+            if uploaded is not None:
+                self._tokens.move_to_end(key)
+                self.hits += 1
+                reused.append(key)
+            else:
+                uploaded = await self._uploads.do(key, self._upload, bot, key, attachment)
+            resolved.append(uploaded)
+        return resolved, reused
+
+    async def send_message(self, bot, chat_id=None, text=None, attachments=None, **kwargs):
+        """bot.send_message, но вложения загружаются только если их содержимое еще не отправлялось"""
+        resolved, reused = await self._resolve(bot, attachments)
+        result = await bot.send_message(chat_id=chat_id, text=text, attachments=resolved, **kwargs)
+
+        if isinstance(result, Error) and reused:
+            # Сохраненный токен мог устареть на стороне MAX - загружаем файлы заново
+            logging.warning(f"⚠️ Сообщение с сохраненными вложениями отклонено ({result.code}), загружаю файлы заново")
+            for key in reused:
+                self._tokens.pop(key, None)
+            self.rejected += len(reused)
+            resolved, _ = await self._resolve(bot, attachments)
+            result = await bot.send_message(chat_id=chat_id, text=text, attachments=resolved, **kwargs)
+
+        return result
+
+    def stats(self):
+        """Возвращает счетчики повторных использований и загрузок"""
+        total = self.hits + self.uploads
+        return {
+            'size': len(self._tokens),
+            'hits': self.hits,
+            'uploads': self.uploads,
+            'rejected': self.rejected,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+media_service = MediaService()
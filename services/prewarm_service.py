@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from config.config import PREWARM_SETTINGS, TEACHER_INDEX_SETTINGS
+from database.database import async_user_db
+from parsers import workers
+
+logging.basicConfig(level=logging.INFO)
+
+
+class PrewarmService:
+    """Фоновый прогрев кэша расписаний для групп, сохраненных пользователями,
+    и периодический полный обход групп для индекса преподавателей"""
+
+    def __init__(self, parser, settings=None, index_settings=None):
+        self.parser = parser
+        self.settings = dict(PREWARM_SETTINGS, **(settings or {}))
+        self.index_settings = dict(TEACHER_INDEX_SETTINGS, **(index_settings or {}))
+        self._task = None
+        self._index_task = None
+
+    def start(self):
+        """Запускает фоновые задачи прогрева и перестройки индекса преподавателей"""
+        if self.index_settings['enabled'] and (self._index_task is None or self._index_task.done()):
+            self._index_task = asyncio.create_task(self._run_index())
+            logging.info("👩‍🏫 Запущено фоновое построение индекса преподавателей")
+
+        if not self.settings['enabled']:
+            logging.info("⏸️ Прогрев кэша расписаний отключен")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logging.info("🔥 Запущен фоновый прогрев кэша расписаний")
+
+    async def stop(self):
+        """Останавливает фоновые задачи"""
+        for task in (self._task, self._index_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._index_task = None
+
+    def _is_active_hour(self):
+        """Проверяет, попадает ли текущий час в окно прогрева"""
+        start_hour, end_hour = self.settings['active_hours']
+        return start_hour <= datetime.now().hour < end_hour
+
+    async def _run(self):
+        """Периодически прогревает кэш"""
+        await asyncio.sleep(self.settings['initial_delay'])
+        while True:
+            try:
+                if self._is_active_hour():
+                    await self.warm_once()
+            except Exception as e:
+                logging.error(f"❌ Ошибка прогрева кэша: {e}")
+            await asyncio.sleep(self.settings['interval'])
+
+    async def _run_index(self):
+        """Периодически обходит все группы и перестраивает индекс преподавателей"""
+        await asyncio.sleep(self.index_settings['initial_delay'])
+        while True:
+            try:
+                # Первый обход делаем сразу, следующие - только в активные часы
+                if self.parser.teacher_index.built_at is None or self._is_active_hour():
+                    await self.parser.parse_all_groups_async()
+            except Exception as e:
+                logging.error(f"❌ Ошибка построения индекса преподавателей: {e}")
+            await asyncio.sleep(self.index_settings['interval'])
+
+    async def _select_groups(self):
+        """Выбирает номера самых популярных групп пользователей"""
+        group_numbers = []
+        for group_name, users_count in await async_user_db.get_group_popularity():
+            group_number = self.parser.find_group_number(group_name)
+            if group_number and group_number not in group_numbers:
+                group_numbers.append(group_number)
+            if len(group_numbers) >= self.settings['max_groups']:
+                break
+        return group_numbers
+
+    async def warm_once(self):
+        """Загружает и отрисовывает расписания популярных групп заранее"""
+        group_numbers = await self._select_groups()
+        if not group_numbers:
+            return
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.settings['concurrency'])
+
+        async def warm(group_number):
+            async with semaphore:
+                try:
+                    await self.parser.get_schedule_png_by_number_async(group_number)
+                except Exception as e:
+                    logging.warning(f"⚠️ Не удалось прогреть группу {group_number}: {e}")
+
+        await asyncio.gather(*(warm(number) for number in group_numbers))
+
+        logging.info(f"🔥 Прогрето расписаний: {len(group_numbers)} за {time.perf_counter() - started:.1f} с")
+        self.parser.cache.log_stats()
+        await self.parser.worker_pool.run("stats", workers.log_text_cache_stats)
@@ -1,5 +1,5 @@
 import logging
-from database.database import user_db
+from database.database import async_user_db
 from keyboards.student_menu import send_student_menu
 from keyboards.inline_keyboards import get_back_button
 from services.state_service import state_service
@@ -18,21 +18,21 @@ class UserService:
     async def process_role_selection(self, bot, chat_id, role):
         """Обрабатывает выбор роли пользователем и сохраняет в БД"""
         try:
-            current_user_info = user_db.get_user(chat_id)
+            current_user_info = await async_user_db.get_user(chat_id)
 
             if current_user_info:
                 current_role = current_user_info[1]
                 current_group = current_user_info[2]
 
                 if current_role == "student" and role != "student":
-                    user_db.add_or_update_user(chat_id, role, None)
+                    await async_user_db.add_or_update_user(chat_id, role, None)
                     logging.info(
                         f"🔄 Пользователь {chat_id} сменил роль с '{current_role}' на '{role}', группа сброшена")
                 else:
-                    user_db.add_or_update_user(chat_id, role, current_group)
+                    await async_user_db.add_or_update_user(chat_id, role, current_group)
                     logging.info(f"🔄 Пользователь {chat_id} сменил роль с '{current_role}' на '{role}'")
             else:
-                user_db.add_or_update_user(chat_id, role)
+                await async_user_db.add_or_update_user(chat_id, role)
                 logging.info(f"👤 Новый пользователь {chat_id} с ролью '{role}'")
 
             self.clear_temp_states(chat_id)
@@ -87,7 +87,7 @@ class UserService:
 
     async def send_profile_info(self, bot, chat_id):
         """Показывает профиль пользователя"""
-        user_info = user_db.get_user(chat_id)
+        user_info = await async_user_db.get_user(chat_id)
 
         if user_info:
             user_id, role, group_name = user_info
@@ -116,7 +116,7 @@ class UserService:
         from maxapi.utils.inline_keyboard import InlineKeyboardBuilder
         from maxapi.types import CallbackButton
 
-        user_info = user_db.get_user(chat_id)
+        user_info = await async_user_db.get_user(chat_id)
 
         if user_info:
             user_id, role, group_name = user_info
@@ -136,6 +136,7 @@ class UserService:
             help_text += "/group <название> - Расписание конкретной группы\n"
             help_text += "/groups - Список доступных групп\n"
             help_text += "/search <часть названия> - Поиск группы по названию\n"
+            help_text += "/rooms [корпус] [пара] - Свободные аудитории сейчас\n"
             help_text += "💡 Примеры использования:\n"
             help_text += "`/group ИВТИИбд-32` - расписание группы ИВТИИбд-32\n"
             help_text += "`/search ИВТ` - поиск всех групп с 'ИВТ' в названии\n"
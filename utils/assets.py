@@ -0,0 +1,233 @@
+"""Картинки разделов (assets), подготовленные для отправки в чат.
+
+Исходники в assets/ рассчитаны на печать и большие экраны: до 2560 пикселей и нескольких
+мегабайт. Один раз (при сборке или первом запуске) каждая картинка уменьшается до
+ASSET_SETTINGS['max_side'] и пережимается: фотографии - в прогрессивный JPEG,
+графика (немного цветов или прозрачность) - в PNG с палитрой, где текст остается четким.
+Копии и manifest.json лежат в optimized_dir и пересобираются, только если исходник
+или настройки изменились.
+
+При запуске все копии загружаются в неизменяемое хранилище: небольшие - байтами,
+крупные - через mmap. Обработчики берут готовый InputMediaBuffer без обращения к диску.
+
+Подготовить копии заранее и посмотреть экономию:
+    python -m utils.assets
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import time
+from types import MappingProxyType
+from typing import NamedTuple, Union
+
+from maxapi.types import InputMediaBuffer
+from PIL import Image
+
+from config.config import ASSET_SETTINGS
+
+logging.basicConfig(level=logging.INFO)
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+MANIFEST_NAME = 'manifest.json'
+
+
+class Asset(NamedTuple):
+    """Подготовленная картинка: имя исходника, содержимое и расширение копии"""
+    name: str
+    data: Union[bytes, memoryview]
+    extension: str
+    source_size: int
+
+
+def _settings_key(settings):
+    """Отпечаток настроек, влияющих на копии: при их изменении копии пересобираются"""
+    params = {key: settings[key] for key in ('max_side', 'jpeg_quality', 'graphic_max_colors', 'palette_colors')}
+    return hashlib.blake2b(json.dumps(params, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+def _has_alpha(image):
+    if image.mode in ('RGBA', 'LA'):
+        return image.getextrema()[-1][0] < 255
+    return image.mode == 'P' and 'transparency' in image.info
+
+
+def _is_graphic(image, settings):
+    """Схема или таблица, а не фотография: JPEG размыл бы на ней текст"""
+    return _has_alpha(image) or image.convert('RGB').getcolors(settings['graphic_max_colors']) is not None
+
+
+def optimize_image(source_path, target_base, settings=ASSET_SETTINGS):
+    """Уменьшает и пережимает одну картинку. Возвращает путь к копии"""
+    with Image.open(source_path) as image:
+        image.load()
+        max_side = settings['max_side']
+        if max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+        if _is_graphic(image, settings):
+            image = image.convert('RGBA' if _has_alpha(image) else 'RGB')
+            colors = settings['palette_colors']
+            if colors:
+                image = image.quantize(colors, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+            target_path = target_base + '.png'
+            image.save(target_path, 'PNG', optimize=True)
+        else:
+            target_path = target_base + '.jpg'
+            image.convert('RGB').save(target_path, 'JPEG', quality=settings['jpeg_quality'],
+                                      optimize=True, progressive=True)
+
+    # Копия не должна быть больше исходника (например, уже сжатый маленький JPEG)
+    if os.path.getsize(target_path) >= os.path.getsize(source_path):
+        os.remove(target_path)
+        target_path = target_base + os.path.splitext(source_path)[1].lower()
+        with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+            dst.write(src.read())
+    return target_path
+
+
+def optimize_assets(settings=ASSET_SETTINGS):
+    """Готовит копии всех картинок из source_dir. Возвращает манифест {имя: описание копии}"""
+    source_dir = settings['source_dir']
+    target_dir = settings['optimized_dir']
+    os.makedirs(target_dir, exist_ok=True)
+    manifest_path = os.path.join(target_dir, MANIFEST_NAME)
+
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            old_manifest = json.load(f)
+    except (OSError, ValueError):
+        old_manifest = {}
+
+    settings_key = _settings_key(settings)
+    manifest = {}
+    rebuilt = 0
+    for name in sorted(os.listdir(source_dir)):
+        source_path = os.path.join(source_dir, name)
+        if not name.lower().endswith(SOURCE_EXTENSIONS) or not os.path.isfile(source_path):
+            continue
+
+        stat = os.stat(source_path)
+        entry = old_manifest.get(name)
+        if (entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size
+                and entry['settings'] == settings_key
+                and os.path.exists(os.path.join(target_dir, entry['variant']))):
+            manifest[name] = entry
+            continue
+
+        try:
+            target_path = optimize_image(source_path, os.path.join(target_dir, os.path.splitext(name)[0]), settings)
+        except Exception as e:
+            logging.error(f"❌ Не удалось подготовить картинку {name}: {e}")
+            continue
+        rebuilt += 1
+        manifest[name] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'settings': settings_key,
+            'variant': os.path.basename(target_path),
+            'variant_size': os.path.getsize(target_path)
+        }
+
+    # Копии исчезнувших исходников и старых форматов больше не нужны
+    variants = {entry['variant'] for entry in manifest.values()} | {MANIFEST_NAME}
+    for name in os.listdir(target_dir):
+        if name not in variants:
+            os.remove(os.path.join(target_dir, name))
+
+    if rebuilt or manifest != old_manifest:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    if rebuilt:
+        logging.info(f"🖼️ Подготовлено копий картинок: {rebuilt} из {len(manifest)}")
+    return manifest
+
+
+class AssetStore:
+    """Неизменяемое хранилище подготовленных картинок, загружаемое при запуске"""
+
+    def __init__(self, settings=ASSET_SETTINGS):
+        self.settings = settings
+        self._assets = MappingProxyType({})
+        self._media = {}  # (имя, имя файла) -> InputMediaBuffer
+        self._maps = []  # Открытые mmap, живут до конца процесса
+
+    def load(self):
+        """Готовит копии (если нужно) и загружает их в память"""
+        started = time.perf_counter()
+        try:
+            manifest = optimize_assets(self.settings)
+        except OSError as e:
+            logging.error(f"❌ Картинки разделов недоступны: {e}")
+            return
+
+        assets = {}
+        for name, entry in manifest.items():
+            path = os.path.join(self.settings['optimized_dir'], entry['variant'])
+            try:
+                assets[name] = Asset(name, self._read(path), os.path.splitext(path)[1], entry['size'])
+            except OSError as e:
+                logging.error(f"❌ Не удалось загрузить картинку {name}: {e}")
+
+        self._assets = MappingProxyType(assets)
+        self._media.clear()
+        loaded = sum(len(asset.data) for asset in assets.values())
+        source = sum(asset.source_size for asset in assets.values())
+        logging.info(f"🖼️ Картинки разделов в памяти: {len(assets)} шт., {loaded / 1024:.0f} КБ "
+                     f"(исходники {source / 1024:.0f} КБ) за {time.perf_counter() - started:.2f} с")
+
+    def _read(self, path):
+        """Крупные файлы отображаются в память, мелкие читаются целиком"""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.settings['mmap_threshold']:
+                return f.read()
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped)
+
+    def get(self, name):
+        """Подготовленная картинка по имени исходника ("1.jpg") или None"""
+        return self._assets.get(name)
+
+    def media(self, name, filename):
+        """Готовое вложение для отправки или None, если картинки нет.
+        Расширение filename заменяется на расширение подготовленной копии"""
+        key = (name, filename)
+        media = self._media.get(key)
+        if media is None:
+            asset = self._assets.get(name)
+            if asset is None:
+                return None
+            # Тип файла определяется по содержимому один раз, а не при каждой отправке
+            media = InputMediaBuffer(buffer=asset.data, filename=os.path.splitext(filename)[0] + asset.extension)
+            self._media[key] = media
+        return media
+
+    def __contains__(self, name):
+        return name in self._assets
+
+    def __len__(self):
+        return len(self._assets)
+
+
+asset_store = AssetStore()
+
+
+def main():
+    manifest = optimize_assets()
+    print(f"{'картинка':<12}{'исходник, КБ':>15}{'копия':>12}{'копия, КБ':>12}{'экономия':>10}")
+    total_source = total_variant = 0
+    for name, entry in manifest.items():
+        total_source += entry['size']
+        total_variant += entry['variant_size']
+        print(f"{name:<12}{entry['size'] / 1024:>15.0f}{entry['variant']:>12}{entry['variant_size'] / 1024:>12.0f}"
+              f"{1 - entry['variant_size'] / entry['size']:>10.0%}")
+    if total_source:
+        print(f"{'всего':<12}{total_source / 1024:>15.0f}{'':>12}{total_variant / 1024:>12.0f}"
+              f"{1 - total_variant / total_source:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
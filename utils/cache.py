@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """LRU-кэш с ограничением размера и временем жизни записей"""
+
+    def __init__(self, name, ttl, max_size):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data = OrderedDict()  # key -> (expires_at, value, stored_at)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Возвращает значение, если оно есть и не устарело"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            # Устаревшая запись остается до вытеснения: ее можно продлить, если данные не изменились
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key, default=None):
+        """Возвращает актуальное значение без учета в статистике"""
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return default
+        return entry[1]
+
+    def get_stale(self, key, default=None):
+        """Возвращает значение независимо от срока жизни (без учета в статистике)"""
+        entry = self._data.get(key)
+        return entry[1] if entry else default
+
+    def stored_at(self, key):
+        """Возвращает время сохранения записи (unix time) или None"""
+        entry = self._data.get(key)
+        return entry[2] if entry else None
+
+    def set(self, key, value, ttl=None):
+        """Сохраняет значение, вытесняя самые старые записи при переполнении"""
+        self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value, time.time())
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key):
+        """Удаляет запись из кэша"""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self):
+        """Очищает кэш"""
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Возвращает счетчики попаданий и промахов"""
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
@@ -0,0 +1,111 @@
+import logging
+import time
+
+
+class CircuitOpenError(Exception):
+    """Вызов отклонен: автомат разомкнут после серии ошибок"""
+
+
+class CircuitBreaker:
+    """Автоматический выключатель для обращений к внешнему сервису.
+
+    closed - запросы идут как обычно;
+    open - после failure_threshold ошибок или медленных ответов подряд запросы сразу отклоняются;
+    half_open - по истечении reset_timeout пропускается один пробный запрос,
+    по его итогу автомат замыкается или снова размыкается.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold=5, slow_threshold=8.0, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self):
+        """Разомкнут ли автомат прямо сейчас (без перехода в half_open)"""
+        if self.state == self.OPEN:
+            return time.monotonic() - self.opened_at < self.reset_timeout
+        return self.state == self.HALF_OPEN and self._probe_in_flight
+
+    def retry_after(self):
+        """Через сколько секунд автомат пропустит пробный запрос"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def allow_request(self):
+        """Решает, можно ли выполнить запрос, и при необходимости переводит автомат в half_open"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+            logging.info(f"🟡 {self.name}: пробный запрос после паузы")
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self):
+        """Учитывает успешный запрос"""
+        if self.state != self.CLOSED:
+            logging.info(f"🟢 {self.name}: сервис снова доступен")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Учитывает ошибку или слишком медленный ответ"""
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logging.warning(f"🔴 {self.name}: автомат разомкнут на {self.reset_timeout} с "
+                                f"после {self.failures} ошибок")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(self, func, *args, is_failure=None, **kwargs):
+        """Выполняет await func(...) через автомат.
+
+        is_failure(result) позволяет считать ошибкой и успешно полученный ответ (например, 503).
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(f"{self.name}: сервис временно недоступен, "
+                                   f"повтор через {self.retry_after():.0f} с")
+
+        started = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Отмена запроса не говорит о состоянии сервиса - просто освобождаем пробу
+            self._probe_in_flight = False
+            raise
+
+        duration = time.monotonic() - started
+        if duration > self.slow_threshold:
+            logging.warning(f"🐢 {self.name}: медленный ответ {duration:.1f} с")
+            self.record_failure()
+        elif is_failure is not None and is_failure(result):
+            self.record_failure()
+        else:
+            self.record_success()
+        return result
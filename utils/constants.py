@@ -1,7 +1,5 @@
 # Константы проекта
 
-SCHEDULE_DIR = "schedule"
-
 # Тексты сообщений
 WELCOME_TEXT = "🎓 Добро пожаловать в нашего бота - Цифровой вуз!\n\nВыбери нужный вариант:\n"
 
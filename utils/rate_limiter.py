@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму маркерной корзины"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate  # Маркеров в секунду
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Пополняет корзину за прошедшее время"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Ждет, пока в корзине появится маркер, и забирает его"""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
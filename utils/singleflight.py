@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+
+class SingleFlight:
+    """Объединяет одновременные одинаковые запросы: работа выполняется один раз,
+    остальные вызовы с тем же ключом ждут общий результат (или общую ошибку)"""
+
+    def __init__(self):
+        self._in_flight = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key, func, *args):
+        """Выполняет await func(*args) или присоединяется к уже идущему вызову с тем же ключом"""
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func(*args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+            logging.info(f"🔗 Запрос {key} присоединен к уже выполняющемуся")
+
+        # shield: отмена одного ожидающего не должна отменять работу для остальных
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task):
+        """Убирает завершенный вызов из списка выполняющихся"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Помечаем ошибку как полученную, даже если все ожидающие уже отменены
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self):
+        return len(self._in_flight)
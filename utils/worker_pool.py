@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+def _timed_call(func, *args):
+    """Выполняет функцию в воркере и замеряет чистое время выполнения"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class WorkerPool:
+    """Пул потоков или процессов для CPU-задач (парсинг HTML, отрисовка PNG)"""
+
+    def __init__(self, kind='thread', max_workers=4, max_queue=32):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"Неизвестный тип пула: {kind}")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = None
+        # Ограничиваем число задач в работе и в очереди, остальные ждут свободного места.
+        # Семафор привязан к циклу событий, поэтому заводим по одному на цикл
+        self._slots = {}
+        self._pending = 0
+        self.stats = {}
+
+    def _get_executor(self):
+        """Лениво создает исполнитель, чтобы воркеры не запускались без нужды"""
+        if self._executor is None:
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="schedule-worker")
+            logging.info(f"⚙️ Запущен пул воркеров: {self.kind}, воркеров: {self.max_workers}")
+        return self._executor
+
+    def _get_slots(self):
+        """Возвращает семафор очереди для текущего цикла событий"""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_workers + self.max_queue)
+            self._slots[loop] = slots
+        return slots
+
+    async def run(self, stage, func, *args):
+        """Выполняет func(*args) в пуле и логирует время ожидания и выполнения этапа"""
+        submitted = time.perf_counter()
+        self._pending += 1
+        if self._pending > self.max_workers + self.max_queue:
+            logging.warning(f"⚠️ Очередь пула переполнена ({self._pending}), этап {stage} ждет свободного места")
+
+        try:
+            async with self._get_slots():
+                loop = asyncio.get_running_loop()
+                result, run_time = await loop.run_in_executor(self._get_executor(), _timed_call, func, *args)
+        finally:
+            self._pending -= 1
+
+        total_time = time.perf_counter() - submitted
+        self._record(stage, total_time - run_time, run_time)
+        logging.info(f"⏱️ Этап {stage}: ожидание {(total_time - run_time) * 1000:.1f} мс, "
+                     f"выполнение {run_time * 1000:.1f} мс")
+        return result
+
+    def _record(self, stage, wait_time, run_time):
+        """Накапливает статистику по этапу"""
+        stage_stats = self.stats.setdefault(stage, {'count': 0, 'wait': 0.0, 'run': 0.0})
+        stage_stats['count'] += 1
+        stage_stats['wait'] += wait_time
+        stage_stats['run'] += run_time
+
+    def shutdown(self):
+        """Останавливает воркеры"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._slots.clear()